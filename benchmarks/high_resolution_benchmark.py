@@ -0,0 +1,93 @@
+"""Measure the per-frame cost of ingest, analysis and rendering at common sensor resolutions.
+
+For each sensor size (AMG8833/MLX90640-class 8x8 and 24x32 up to Lepton /
+Tiny1-C-class 120x160 and 192x256) and output height, times the stages a
+frame goes through on its way to a camera image:
+
+- ingest_json: parsing a JSON list payload into a ThermalFrame
+- ingest_f32: parsing a big-endian float32 stream payload
+- analysis: min/max/mean and the hotspot from FrameAnalysis
+- render: process_frame to JPEG (upscale, palette, overlays, encode)
+- render+contours: the same with 1 °C contour lines
+
+and prints the achievable frames per second of the whole pipeline on one
+core. Run it on the target hardware (e.g. a Raspberry Pi 4) from the
+repository root (requires the integration's requirements and Home
+Assistant to be importable):
+
+    python -m benchmarks.high_resolution_benchmark --frames 30
+"""
+import argparse
+import json
+import time
+
+import numpy as np
+
+from custom_components.thermal_camera.analysis import FrameAnalysis
+from custom_components.thermal_camera.frame import ThermalFrame
+from custom_components.thermal_camera.renderer import font_size_for_height, load_renderer
+
+SENSORS = ((8, 8), (24, 32), (120, 160), (192, 256))
+HEIGHTS = (480, 720)
+
+def make_frames(count, rows, cols, noise, seed=0):
+    """Return float32 frames of a blob drifting over a gradient plus Gaussian noise."""
+    rng = np.random.default_rng(seed)
+    y, x = np.mgrid[0:rows, 0:cols].astype(np.float32)
+    background = 20.0 + 3.0 * x / cols
+    frames = []
+    for index in range(count):
+        cx = cols * (0.2 + 0.6 * index / max(count, 1))
+        blob = 12.0 * np.exp(-((x - cx) ** 2 + (y - rows / 2) ** 2) / (2 * (rows / 6) ** 2))
+        frames.append((background + blob + rng.normal(0.0, noise, (rows, cols))).astype(np.float32))
+    return frames
+
+def per_frame_ms(function, inputs):
+    """Return the mean wall-clock milliseconds of function over inputs."""
+    start = time.perf_counter()
+    for item in inputs:
+        function(item)
+    return (time.perf_counter() - start) * 1000.0 / len(inputs)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--frames", type=int, default=30)
+    parser.add_argument("--noise", type=float, default=0.1, help="sensor noise in °C")
+    parser.add_argument("--resample", default="BICUBIC")
+    args = parser.parse_args()
+
+    print(f"{'sensor':>9}{'height':>8}{'json':>8}{'f32':>8}{'analysis':>10}{'render':>9}{'+contours':>11}{'fps':>7}")
+    for rows, cols in SENSORS:
+        frames = make_frames(args.frames, rows, cols, args.noise)
+        json_payloads = [json.dumps([round(float(v), 2) for v in frame.ravel()]).encode() for frame in frames]
+        f32_payloads = [frame.astype(">f4").tobytes() for frame in frames]
+        ingest_json = per_frame_ms(lambda payload: ThermalFrame.from_payload(payload, rows, cols), json_payloads)
+        ingest_f32 = per_frame_ms(lambda payload: ThermalFrame.from_payload(payload, rows, cols), f32_payloads)
+
+        def analyse(frame):
+            analysis = FrameAnalysis(0, ThermalFrame.from_celsius(frame), rows, cols)
+            return analysis.stats, analysis.hotspot
+
+        analysis_ms = per_frame_ms(analyse, frames)
+
+        for height in HEIGHTS:
+            process_frame, font = load_renderer(font_size_for_height(height))
+
+            def render(frame, contour_step=None):
+                return process_frame(
+                    frame, float(frame.min()), float(frame.max()), float(frame.mean()),
+                    rows, cols, args.resample, font, height, contour_step=contour_step,
+                )
+
+            render(frames[0])  # Warm the interpolation weights and text sprites
+            render_ms = per_frame_ms(render, frames)
+            contour_ms = per_frame_ms(lambda frame: render(frame, 1.0), frames)
+            total_ms = ingest_f32 + analysis_ms + render_ms
+            print(
+                f"{rows:>4}x{cols:<4}{height:>8}{ingest_json:>8.2f}{ingest_f32:>8.2f}{analysis_ms:>10.2f}"
+                f"{render_ms:>9.2f}{contour_ms:>11.2f}{1000.0 / total_ms:>7.1f}"
+            )
+    print("times in ms per frame; fps = one core for f32 ingest + analysis + render")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,407 @@
+"""Load-test N thermal cameras with M viewers each on one event loop and report how it copes.
+
+Runs the integration's real ThermalCameraDataCoordinator, ThermalCamera,
+temperature, telemetry and motion sensors for every simulated config entry
+against a minimal stub of Home Assistant (StubHass below), fed by fake
+devices served from a separate process (so their CPU is not counted). Each
+camera gets M viewers requesting images like the frontend's MJPEG stream
+does. After a warm-up it reports:
+
+- event loop lag percentiles (how late a 10 ms timer fires)
+- CPU of the Home Assistant side, total and per camera (render threads
+  included; process_pool render workers are not)
+- resident memory growth over the measurement
+- ingested, rendered and delivered frames per second, and state writes
+
+Run from the repository root (requires the integration's requirements and
+Home Assistant to be importable):
+
+    python -m benchmarks.load_test --cameras 8 --viewers 2 --transport stream --duration 60
+
+As a regression benchmark, write the results with --json and fail the run
+with --max-lag-p99-ms when the loop lags more than allowed.
+"""
+import argparse
+import asyncio
+import json
+import multiprocessing
+import os
+import resource
+import socket
+import statistics
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+
+import aiohttp
+import numpy as np
+from aiohttp import web
+from homeassistant.core import CoreState
+from homeassistant.util.unit_system import METRIC_SYSTEM
+
+from custom_components.thermal_camera.binary_sensor import ThermalMotionSensor
+from custom_components.thermal_camera.camera import ThermalCamera
+from custom_components.thermal_camera.change_gate import ChangeGate
+from custom_components.thermal_camera.constants import (
+    DEFAULT_DESIRED_HEIGHT, DEFAULT_MOTION_THRESHOLD, DEFAULT_RENDER_CHANGE_THRESHOLD,
+    DEFAULT_RENDER_MAX_STALENESS, DEFAULT_SENSOR_DEADBAND, DEFAULT_SENSOR_HEARTBEAT,
+    DEFAULT_SENSOR_MIN_INTERVAL, RENDER_BACKENDS,
+)
+from custom_components.thermal_camera.coordinator import ThermalCameraDataCoordinator
+from custom_components.thermal_camera.sensor import (
+    SCAN_INTERVAL, TELEMETRY_SENSORS, ThermalCameraTelemetrySensor, ThermalCameraTemperatureSensor,
+)
+from custom_components.thermal_camera.write_policy import WritePolicy
+
+SCENE_FRAMES = 100  # Synthetic frames the fake devices cycle through
+LAG_INTERVAL_SEC = 0.01
+
+class StubHass:
+    """The parts of HomeAssistant that the coordinator, entities and HA helpers they call use.
+
+    Entities are not registered with a state machine; their state writes are
+    counted instead (see attach_entity).
+    """
+
+    def __init__(self, loop, executor):
+        self.loop = loop
+        self.loop_thread_id = threading.get_ident()
+        self.state = CoreState.running
+        self.is_stopping = False
+        self.is_running = True
+        self.data = {}
+        self.config = SimpleNamespace(time_zone="UTC", units=METRIC_SYSTEM, config_dir=os.getcwd())
+        self.bus = SimpleNamespace(
+            async_fire=lambda *args, **kwargs: None,
+            async_listen=lambda *args, **kwargs: (lambda: None),
+            async_listen_once=lambda *args, **kwargs: (lambda: None),
+        )
+        self._executor = executor
+        self._tasks = set()
+
+    def async_add_executor_job(self, target, *args):
+        return self.loop.run_in_executor(self._executor, target, *args)
+
+    def async_create_task(self, target, name=None, eager_start=True):
+        task = self.loop.create_task(target, name=name)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
+    def async_create_background_task(self, target, name=None, eager_start=True):
+        return self.async_create_task(target, name)
+
+    def async_run_hass_job(self, hassjob, *args, **kwargs):
+        result = hassjob.target(*args)
+        if asyncio.iscoroutine(result):
+            return self.async_create_task(result)
+        return None
+
+    def verify_event_loop_thread(self, what):
+        pass
+
+    async def async_cancel_tasks(self):
+        for task in list(self._tasks):
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+
+def make_scene(rows, cols, seed=0):
+    """Return frames of a person-sized blob walking through and out of view over a noisy gradient."""
+    rng = np.random.default_rng(seed)
+    y, x = np.mgrid[0:rows, 0:cols].astype(np.float32)
+    background = 20.0 + 3.0 * x / cols
+    frames = []
+    for index in range(SCENE_FRAMES):
+        # In view for the first half of the cycle, so motion turns on and off
+        blob = 0.0
+        if index < SCENE_FRAMES // 2:
+            cx = cols * index / (SCENE_FRAMES // 2)
+            blob = 12.0 * np.exp(-((x - cx) ** 2 + (y - rows / 2) ** 2) / (2 * (rows / 6) ** 2))
+        frames.append((background + blob + rng.normal(0.0, 0.1, (rows, cols))).astype(np.float32))
+    return frames
+
+def run_devices(sock, rows, cols, fps):
+    """Serve every fake device from one aiohttp app on sock: /<name>/json polls and /<name>/bin streams."""
+    frames = make_scene(rows, cols)
+    json_bodies = [
+        json.dumps({
+            "frame": [round(float(value), 2) for value in frame.ravel()],
+            "lowest": round(float(frame.min()), 1),
+            "highest": round(float(frame.max()), 1),
+            "average": round(float(frame.mean()), 1),
+        }).encode()
+        for frame in frames
+    ]
+    stream_chunks = [len(payload).to_bytes(4, "big") + payload for payload in (
+        frame.astype(">f4").tobytes() for frame in frames
+    )]
+
+    async def handle_json(request):
+        index = int(time.monotonic() * fps) % SCENE_FRAMES
+        return web.Response(body=json_bodies[index], content_type="application/json")
+
+    async def handle_stream(request):
+        response = web.StreamResponse()
+        await response.prepare(request)
+        next_ts = time.monotonic()
+        index = 0
+        while True:
+            await response.write(stream_chunks[index % SCENE_FRAMES])
+            index += 1
+            next_ts += 1.0 / fps
+            await asyncio.sleep(max(0.0, next_ts - time.monotonic()))
+
+    app = web.Application()
+    app.router.add_get("/{device}/json", handle_json)
+    app.router.add_get("/{device}/bin", handle_stream)
+    web.run_app(app, sock=sock, print=None, handle_signals=False)
+
+def start_devices(rows, cols, fps):
+    """Start the fake devices in a separate process; returns (process, base URL)."""
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.bind(("127.0.0.1", 0))
+    sock.listen(512)
+    port = sock.getsockname()[1]
+    process = multiprocessing.get_context("spawn").Process(
+        target=run_devices, args=(sock, rows, cols, fps), daemon=True
+    )
+    process.start()
+    sock.close()
+    return process, f"http://127.0.0.1:{port}"
+
+async def wait_for_devices(session, base_url, timeout=10.0):
+    """Wait until the fake device process answers."""
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            async with session.get(f"{base_url}/probe/json") as response:
+                if response.status == 200:
+                    return
+        except aiohttp.ClientError:
+            if time.monotonic() > deadline:
+                raise
+        await asyncio.sleep(0.1)
+
+def attach_entity(hass, entity, entity_id, counters):
+    """Give an entity the stub hass and count its state writes instead of writing them."""
+    entity.hass = hass
+    entity.entity_id = entity_id
+
+    def write_state():
+        # Evaluate what Home Assistant would read for the new state
+        entity.state
+        entity.extra_state_attributes
+        counters["state_writes"] += 1
+
+    entity.async_write_ha_state = write_state
+
+async def setup_camera(hass, session, base_url, index, args, counters):
+    """Create one simulated config entry: coordinator, camera and sensors; returns (coordinator, entities)."""
+    name = f"Load {index}"
+    entry = SimpleNamespace(entry_id=f"load{index}", data={"name": name})
+    coordinator = ThermalCameraDataCoordinator(
+        hass, session, f"{base_url}/cam{index}", "bin" if args.transport == "stream" else "json",
+        "frame", "lowest", "highest", "average",
+        width=args.cols, height=args.rows,
+        update_interval_ms=args.update_interval_ms,
+        use_stream=args.transport == "stream",
+        stream_push_ms=args.stream_push_ms,
+        history_seconds=args.history_seconds,
+    )
+    camera = ThermalCamera(
+        name=name, coordinator=coordinator, rows=args.rows, cols=args.cols,
+        data_field="frame", lowest_field="lowest", highest_field="highest", average_field="average",
+        resample_method=args.resample, session=session, mjpeg_port=None,
+        desired_height=args.height, contour_step=args.contour_step,
+        change_gate=ChangeGate(args.render_change_threshold, DEFAULT_RENDER_MAX_STALENESS),
+        render_backend=args.render_backend, config_entry=entry, unique_id=f"load{index}_camera",
+    )
+    entities = [camera, ThermalMotionSensor(name, coordinator, DEFAULT_MOTION_THRESHOLD, config_entry=entry)]
+    for sensor_type in ("highest", "lowest", "average"):
+        entities.append(ThermalCameraTemperatureSensor(
+            coordinator, entry, sensor_type,
+            write_policy=WritePolicy(
+                deadband=DEFAULT_SENSOR_DEADBAND,
+                min_interval=DEFAULT_SENSOR_MIN_INTERVAL,
+                heartbeat=DEFAULT_SENSOR_HEARTBEAT,
+            ),
+        ))
+    entities.extend(ThermalCameraTelemetrySensor(coordinator, entry, key) for key in TELEMETRY_SENSORS)
+
+    for number, entity in enumerate(entities):
+        attach_entity(hass, entity, f"{type(entity).__name__.lower()}.load_{index}_{number}", counters)
+        await entity.async_added_to_hass()
+    hass.async_create_background_task(coordinator.async_refresh(), f"load{index} first refresh")
+    return coordinator, entities
+
+async def poll_telemetry_sensors(entities):
+    """Update the polling diagnostic sensors at their scan interval."""
+    sensors = [entity for entity in entities if isinstance(entity, ThermalCameraTelemetrySensor)]
+    while True:
+        await asyncio.sleep(SCAN_INTERVAL.total_seconds())
+        for sensor in sensors:
+            await sensor.async_update()
+            sensor.async_write_ha_state()
+
+async def view(camera, fps, delivered):
+    """Request camera images at fps like a stream viewer; count the distinct images received."""
+    last_image = None
+    while True:
+        image = await camera.async_camera_image()
+        if image is not None and image is not last_image:
+            delivered[0] += 1
+            last_image = image
+        await asyncio.sleep(1.0 / fps)
+
+async def measure_lag(samples):
+    """Record how late a short timer fires, in milliseconds."""
+    loop = asyncio.get_running_loop()
+    while True:
+        start = loop.time()
+        await asyncio.sleep(LAG_INTERVAL_SEC)
+        samples.append((loop.time() - start - LAG_INTERVAL_SEC) * 1000.0)
+
+def rss_bytes():
+    """Return the current resident set size (peak size where /proc is unavailable)."""
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except OSError:
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+def percentile(sorted_values, fraction):
+    return sorted_values[min(len(sorted_values) - 1, int(fraction * len(sorted_values)))]
+
+def snapshot(coordinators, cameras, viewers, counters):
+    """Return the cumulative counters the report is computed from."""
+    # Only public state, so the harness keeps working when the camera's internals change
+    attributes = [camera.extra_state_attributes for camera in cameras]
+    return {
+        "time": time.monotonic(),
+        "cpu": time.process_time(),
+        "rss": rss_bytes(),
+        "ingested": sum(coordinator.frame_version for coordinator in coordinators),
+        "rendered": sum(attrs["frames_rendered"] for attrs in attributes),
+        "renders_avoided": sum(attrs["renders_avoided"] for attrs in attributes),
+        "delivered": [delivered[0] for delivered in viewers],
+        "state_writes": counters["state_writes"],
+    }
+
+async def run(args):
+    loop = asyncio.get_running_loop()
+    executor = ThreadPoolExecutor(max_workers=args.executor_threads, thread_name_prefix="executor")
+    loop.set_default_executor(executor)
+    hass = StubHass(loop, executor)
+    counters = {"state_writes": 0}
+
+    device_process, base_url = start_devices(args.rows, args.cols, args.device_fps)
+    session = aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit=0))
+    background = []
+    coordinators, all_entities, cameras, viewers = [], [], [], []
+    try:
+        await wait_for_devices(session, base_url)
+        for index in range(args.cameras):
+            coordinator, entities = await setup_camera(hass, session, base_url, index, args, counters)
+            coordinators.append(coordinator)
+            all_entities.extend(entities)
+            cameras.append(entities[0])
+        background.append(asyncio.create_task(poll_telemetry_sensors(all_entities)))
+        for camera in cameras:
+            for _ in range(args.viewers):
+                delivered = [0]
+                viewers.append(delivered)
+                background.append(asyncio.create_task(view(camera, args.viewer_fps, delivered)))
+        lag_samples = []
+        background.append(asyncio.create_task(measure_lag(lag_samples)))
+
+        await asyncio.sleep(args.warmup)
+        lag_samples.clear()
+        start = snapshot(coordinators, cameras, viewers, counters)
+        await asyncio.sleep(args.duration)
+        end = snapshot(coordinators, cameras, viewers, counters)
+    finally:
+        for task in background:
+            task.cancel()
+        await asyncio.gather(*background, return_exceptions=True)
+        for entity in all_entities:
+            await entity.async_will_remove_from_hass()
+        for coordinator in coordinators:
+            if coordinator._reader_task is not None:
+                coordinator._reader_task.cancel()
+            if hasattr(coordinator, "async_shutdown"):
+                await coordinator.async_shutdown()
+        await hass.async_cancel_tasks()
+        await session.close()
+        device_process.terminate()
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    elapsed = end["time"] - start["time"]
+    lags = sorted(lag_samples)
+    delivered_fps = [(after - before) / elapsed for before, after in zip(start["delivered"], end["delivered"])]
+    cpu_percent = (end["cpu"] - start["cpu"]) / elapsed * 100.0
+    return {
+        "cameras": args.cameras,
+        "viewers_per_camera": args.viewers,
+        "transport": args.transport,
+        "render_backend": args.render_backend,
+        "sensor": f"{args.rows}x{args.cols}",
+        "height": args.height,
+        "duration_s": round(elapsed, 1),
+        "loop_lag_ms": {
+            "p50": round(percentile(lags, 0.50), 2),
+            "p95": round(percentile(lags, 0.95), 2),
+            "p99": round(percentile(lags, 0.99), 2),
+            "max": round(lags[-1], 2),
+        } if lags else None,
+        "cpu_percent": round(cpu_percent, 1),
+        "cpu_percent_per_camera": round(cpu_percent / args.cameras, 2),
+        "rss_mb": round(end["rss"] / 2 ** 20, 1),
+        "rss_growth_mb": round((end["rss"] - start["rss"]) / 2 ** 20, 2),
+        "ingested_fps_per_camera": round((end["ingested"] - start["ingested"]) / elapsed / args.cameras, 2),
+        "rendered_fps_per_camera": round((end["rendered"] - start["rendered"]) / elapsed / args.cameras, 2),
+        "renders_avoided_fps_per_camera": round(
+            (end["renders_avoided"] - start["renders_avoided"]) / elapsed / args.cameras, 2
+        ),
+        "delivered_fps_per_viewer": {
+            "mean": round(statistics.fmean(delivered_fps), 2),
+            "min": round(min(delivered_fps), 2),
+        } if delivered_fps else None,
+        "state_writes_per_second": round((end["state_writes"] - start["state_writes"]) / elapsed, 1),
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--cameras", type=int, default=4)
+    parser.add_argument("--viewers", type=int, default=1, help="concurrent viewers per camera")
+    parser.add_argument("--viewer-fps", type=float, default=2.0, help="image requests per second per viewer")
+    parser.add_argument("--transport", choices=["json", "stream"], default="json")
+    parser.add_argument("--device-fps", type=float, default=8.0, help="frames per second each fake device produces")
+    parser.add_argument("--update-interval-ms", type=int, default=125, help="JSON polling interval")
+    parser.add_argument("--stream-push-ms", type=int, default=125)
+    parser.add_argument("--rows", type=int, default=24)
+    parser.add_argument("--cols", type=int, default=32)
+    parser.add_argument("--height", type=int, default=DEFAULT_DESIRED_HEIGHT)
+    parser.add_argument("--resample", default="BICUBIC")
+    parser.add_argument("--contour-step", type=float, default=0.0)
+    parser.add_argument("--render-backend", choices=RENDER_BACKENDS, default="inline")
+    parser.add_argument("--render-change-threshold", type=float, default=DEFAULT_RENDER_CHANGE_THRESHOLD)
+    parser.add_argument("--history-seconds", type=float, default=30.0)
+    parser.add_argument("--executor-threads", type=int, default=8)
+    parser.add_argument("--warmup", type=float, default=10.0, help="seconds before measuring")
+    parser.add_argument("--duration", type=float, default=30.0, help="seconds measured")
+    parser.add_argument("--json", metavar="PATH", help="also write the results to this JSON file")
+    parser.add_argument("--max-lag-p99-ms", type=float, help="exit with status 1 if the p99 loop lag is higher")
+    args = parser.parse_args()
+
+    results = asyncio.run(run(args))
+    print(json.dumps(results, indent=2))
+    if args.json:
+        with open(args.json, "w") as output:
+            json.dump(results, output, indent=2)
+    lag = results["loop_lag_ms"]
+    if args.max_lag_p99_ms is not None and (lag is None or lag["p99"] > args.max_lag_p99_ms):
+        raise SystemExit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""Measure camera render throughput inline versus the shared process pool.
+
+Simulates several cameras that each submit frames as fast as their renders
+complete and reports the total frames per second for the inline renderer and
+for the process pool at every worker count up to the number of cores.
+
+Run from the repository root (requires the integration's requirements and
+Home Assistant to be importable):
+
+    python -m benchmarks.render_pool_benchmark --cameras 12 --seconds 5
+"""
+import argparse
+import asyncio
+import os
+import time
+
+import numpy as np
+
+from custom_components.thermal_camera.render_pool import RenderPool
+from custom_components.thermal_camera.renderer import load_renderer, FONT_SIZE
+
+PARAMS = {
+    "min_value": 20.0,
+    "max_value": 35.0,
+    "avg_value": 26.0,
+    "rows": 24,
+    "cols": 32,
+    "resample_method": "BICUBIC",
+    "desired_height": 720,
+}
+
+def make_frame(rng):
+    return (rng.random((PARAMS["rows"], PARAMS["cols"])) * 15 + 20).astype(np.float32)
+
+def bench_inline(cameras, seconds):
+    """All cameras rendering in one interpreter, one after another."""
+    rng = np.random.default_rng(0)
+    process_frame, font = load_renderer()
+    frames = 0
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        for _ in range(cameras):
+            process_frame(make_frame(rng), font=font, **PARAMS)
+            frames += 1
+    return frames / seconds
+
+async def bench_pool(cameras, seconds, workers):
+    """Each camera keeps one render in flight on a pool with `workers` processes."""
+    pool = RenderPool(workers)
+    slots = [pool.slot() for _ in range(cameras)]
+    rng = np.random.default_rng(0)
+
+    # Start every worker before timing
+    await asyncio.gather(*(slot.async_render(make_frame(rng), FONT_SIZE, **PARAMS) for slot in slots))
+
+    async def camera(slot):
+        rendered = 0
+        while time.perf_counter() < deadline:
+            if await slot.async_render(make_frame(rng), FONT_SIZE, **PARAMS) is not None:
+                rendered += 1
+        return rendered
+
+    deadline = time.perf_counter() + seconds
+    frames = sum(await asyncio.gather(*(camera(slot) for slot in slots)))
+    for slot in slots:
+        slot.close()
+    pool.shutdown()
+    return frames / seconds
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--cameras", type=int, default=12)
+    parser.add_argument("--seconds", type=float, default=5.0)
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    inline_fps = bench_inline(args.cameras, args.seconds)
+    print(f"{'backend':<16}{'workers':>8}{'total fps':>12}{'per camera':>12}{'speedup':>9}")
+    print(f"{'inline':<16}{1:>8}{inline_fps:>12.1f}{inline_fps / args.cameras:>12.2f}{1.0:>9.2f}")
+    for workers in range(1, args.max_workers + 1):
+        fps = asyncio.run(bench_pool(args.cameras, args.seconds, workers))
+        print(f"{'process_pool':<16}{workers:>8}{fps:>12.1f}{fps / args.cameras:>12.2f}{fps / inline_fps:>9.2f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""Compare bytes per second and server CPU of websocket raw frames against JPEG stills.
+
+Generates a synthetic scene (a warm blob drifting over a gradient with sensor
+noise) and, per frame, measures the encoded size and the server CPU time of:
+
+- jpeg: the camera's rendered still / MJPEG frame
+- raw_f32: the float32 frame, base64 encoded
+- ws_delta: int16 keyframes plus zlib deltas, base64 encoded, as sent by
+  the thermal_camera/subscribe_frames websocket command
+
+Run from the repository root (requires the integration's requirements and
+Home Assistant to be importable):
+
+    python -m benchmarks.websocket_frames_benchmark --frames 300 --fps 5
+"""
+import argparse
+import base64
+import time
+
+import numpy as np
+
+from custom_components.thermal_camera.analysis import INT16_SCALE
+from custom_components.thermal_camera.renderer import load_renderer
+from custom_components.thermal_camera.websocket import DEFAULT_KEYFRAME_INTERVAL, FrameDeltaEncoder
+
+def make_frames(count, rows, cols, noise, seed=0):
+    """Yield float32 frames of a blob drifting over a gradient plus Gaussian noise."""
+    rng = np.random.default_rng(seed)
+    y, x = np.mgrid[0:rows, 0:cols].astype(np.float32)
+    background = 20.0 + 3.0 * x / cols
+    for index in range(count):
+        cx = cols * (0.2 + 0.6 * (index % 100) / 100)
+        cy = rows / 2
+        blob = 12.0 * np.exp(-((x - cx) ** 2 + (y - cy) ** 2) / (2 * (rows / 6) ** 2))
+        yield (background + blob + rng.normal(0.0, noise, (rows, cols))).astype(np.float32)
+
+def measure(encode, frames):
+    """Return (mean bytes per frame, mean CPU ms per frame) of an encoder over frames."""
+    total_bytes = 0
+    start = time.process_time()
+    for frame in frames:
+        total_bytes += len(encode(frame))
+    cpu_ms = (time.process_time() - start) * 1000.0 / len(frames)
+    return total_bytes / len(frames), cpu_ms
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--frames", type=int, default=300)
+    parser.add_argument("--rows", type=int, default=24)
+    parser.add_argument("--cols", type=int, default=32)
+    parser.add_argument("--fps", type=float, default=5.0)
+    parser.add_argument("--height", type=int, default=720, help="JPEG output height")
+    parser.add_argument("--noise", type=float, default=0.1, help="sensor noise in °C")
+    parser.add_argument("--keyframe-interval", type=int, default=DEFAULT_KEYFRAME_INTERVAL)
+    args = parser.parse_args()
+
+    frames = list(make_frames(args.frames, args.rows, args.cols, args.noise))
+    process_frame, font = load_renderer()
+
+    def jpeg(frame):
+        return process_frame(
+            frame, float(frame.min()), float(frame.max()), float(frame.mean()),
+            args.rows, args.cols, "BICUBIC", font, args.height,
+        )
+
+    def raw_f32(frame):
+        return base64.b64encode(frame.astype("<f4").tobytes())
+
+    encoder = FrameDeltaEncoder(args.keyframe_interval)
+
+    def ws_delta(frame):
+        quantized = np.round(frame / INT16_SCALE).clip(-32768, 32767).astype(np.int16)
+        return base64.b64encode(encoder.encode(quantized)[1])
+
+    results = [(name, *measure(encode, frames)) for name, encode in (
+        ("jpeg", jpeg), ("raw_f32", raw_f32), ("ws_delta", ws_delta),
+    )]
+    jpeg_bytes = results[0][1]
+    print(f"{args.rows}x{args.cols} frames at {args.fps:g} fps, JPEG height {args.height}")
+    print(f"{'encoding':<10}{'bytes/frame':>13}{'kB/s':>10}{'cpu ms/frame':>14}{'vs jpeg':>9}")
+    for name, size, cpu_ms in results:
+        print(f"{name:<10}{size:>13.0f}{size * args.fps / 1000:>10.1f}{cpu_ms:>14.3f}{size / jpeg_bytes:>9.3f}")
+
+if __name__ == "__main__":
+    main()
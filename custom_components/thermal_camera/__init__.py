@@ -1,22 +1,46 @@
+from __future__ import annotations
+
+import asyncio
+import time
 import uuid
 import logging
+from typing import TYPE_CHECKING
+
+from .constants import (
+    DOMAIN, DEFAULT_ROWS, DEFAULT_COLS, DEFAULT_HISTORY_SECONDS, DEFAULT_STREAM_PUSH_MS,
+    DEFAULT_UPDATE_INTERVAL_MS
+)
 
-import aiohttp
-from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.typing import ConfigType
-from .constants import DOMAIN
-from .coordinator import ThermalCameraDataCoordinator
+# Home Assistant, aiohttp and the modules built on them are imported by the
+# setup functions, so the offline tools (reprocess) can import this package
+# with only numpy and Pillow installed
+if TYPE_CHECKING:
+    from homeassistant.config_entries import ConfigEntry
+    from homeassistant.core import HomeAssistant
+    from homeassistant.helpers.typing import ConfigType
 
 _LOGGER = logging.getLogger(__name__)
 
 async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     """Set up the thermal camera integration using YAML."""
+    from .services import async_register_services
+    from .views import ThermalFrameView
+    from .websocket import async_register_websocket_commands
+
     hass.data.setdefault(DOMAIN, {})
+    hass.http.register_view(ThermalFrameView())
+    async_register_websocket_commands(hass)
+    async_register_services(hass)
     return True
 
 async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> bool:
     """Set up the thermal camera integration from a config entry."""
+    import aiohttp
+
+    from .coordinator import ThermalCameraDataCoordinator
+
+    setup_start = time.perf_counter()
+
     # Initialize the session and coordinator
     session = hass.data.get("thermal_camera_session")
     if session is None or session.closed:
@@ -32,11 +56,21 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> b
         data_field=config_entry.data.get("data_field", "frame"),
         lowest_field=config_entry.data.get("lowest_field", "lowest"),
         highest_field=config_entry.data.get("highest_field", "highest"),
-        average_field=config_entry.data.get("average_field", "average")
+        average_field=config_entry.data.get("average_field", "average"),
+        width=config_entry.data.get("columns", DEFAULT_COLS),
+        height=config_entry.data.get("rows", DEFAULT_ROWS),
+        history_seconds=config_entry.data.get("history_seconds", DEFAULT_HISTORY_SECONDS),
+        # Entries created before use_stream existed keep choosing by path
+        use_stream=config_entry.data.get("use_stream"),
+        stream_push_ms=config_entry.data.get("stream_push_ms", DEFAULT_STREAM_PUSH_MS),
+        update_interval_ms=config_entry.data.get("update_interval_ms", DEFAULT_UPDATE_INTERVAL_MS),
     )
 
-    # Wait for initial data load
-    await coordinator.async_config_entry_first_refresh()
+    # Fetch the first frame in the background: an offline camera must not hold
+    # up the other entries. Entities stay unavailable until a frame arrives.
+    config_entry.async_create_background_task(
+        hass, coordinator.async_refresh(), f"{DOMAIN} first refresh {config_entry.entry_id}"
+    )
 
     # Generate unique IDs for entities if not already in the config entry data
     updated_data = config_entry.data.copy()
@@ -64,6 +98,10 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> b
     # Forward setup for camera, binary sensor, and temperature sensors
     await hass.config_entries.async_forward_entry_setups(config_entry, ["camera", "binary_sensor", "sensor"])
 
+    setup_ms = (time.perf_counter() - setup_start) * 1000.0
+    hass.data[DOMAIN][config_entry.entry_id]["setup_ms"] = setup_ms
+    _LOGGER.debug("Set up %s in %.1f ms", config_entry.title, setup_ms)
+
     return True
 
 async def async_reload_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> None:
@@ -71,8 +109,6 @@ async def async_reload_entry(hass: HomeAssistant, config_entry: ConfigEntry) ->
     await async_unload_entry(hass, config_entry)
     await async_setup_entry(hass, config_entry)
 
-import asyncio
-
 async def async_unload_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     platforms = ["camera", "binary_sensor", "sensor"]
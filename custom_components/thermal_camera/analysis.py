@@ -0,0 +1,72 @@
+from functools import cached_property
+
+from .frame import ThermalFrame
+
+# Scale of the int16 representation: one unit is 0.01 °C
+INT16_SCALE = ThermalFrame.CENTI_SCALE
+
+class FrameAnalysis:
+    """Derived data for one accepted frame.
+
+    The coordinator creates one instance per frame and every entity on the
+    config entry reads the same object. Each property is computed on first
+    access and memoized, so consumers only pay for the features they use.
+    Treat instances (and the arrays they return) as read-only.
+
+    The pixels are held by a compact ThermalFrame; numpy is imported on
+    first use, so creating an analysis (and importing the coordinator) does
+    not pull it in during startup.
+    """
+
+    def __init__(self, version, frame, rows, cols, min_value=0.0, max_value=0.0, avg_value=0.0):
+        self.version = version
+        self.frame = frame  # ThermalFrame
+        self.rows = rows
+        self.cols = cols
+        # Reported statistics (device fields in JSON mode, computed in stream mode)
+        self.min_value = min_value
+        self.max_value = max_value
+        self.avg_value = avg_value
+
+    @cached_property
+    def array(self):
+        """Return the frame as a read-only (rows, cols) float32 °C array, or None if the shape is wrong."""
+        if self.frame is None or self.frame.shape != (self.rows, self.cols):
+            return None
+        array = self.frame.celsius()
+        array.setflags(write=False)
+        return array
+
+    @cached_property
+    def centi_degrees(self):
+        """Return the frame as a read-only int16 array of centi-degrees, clipped to the int16 range."""
+        if self.array is None:
+            return None
+        quantized = self.frame.centi_degrees()
+        quantized.setflags(write=False)
+        return quantized
+
+    @cached_property
+    def stats(self):
+        """Return (min, max, mean) computed from the pixels themselves."""
+        array = self.array
+        if array is None:
+            return None
+        return float(array.min()), float(array.max()), float(array.mean())
+
+    @cached_property
+    def hotspot(self):
+        """Return (row, col, value) of the hottest pixel."""
+        array = self.array
+        if array is None:
+            return None
+        row, col = divmod(int(array.argmax()), self.cols)
+        return row, col, float(array[row, col])
+
+    @property
+    def motion_delta(self):
+        """Return the reported highest minus average temperature used for motion detection."""
+        if self.max_value is None or self.avg_value is None:
+            return None
+        return self.max_value - self.avg_value
+
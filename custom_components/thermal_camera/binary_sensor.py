@@ -3,7 +3,9 @@ import uuid
 from homeassistant.components.binary_sensor import BinarySensorEntity
 from .constants import DOMAIN, DEFAULT_NAME, DEFAULT_MOTION_THRESHOLD, DEFAULT_AVERAGE_FIELD, DEFAULT_HIGHEST_FIELD
 from homeassistant.const import CONF_NAME
+from homeassistant.core import callback
 from .coordinator import ThermalCameraDataCoordinator
+from .write_policy import WritePolicy
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -38,6 +40,9 @@ async def async_setup_entry(hass, config_entry, async_add_entities):
 class ThermalMotionSensor(BinarySensorEntity):
     """Representation of a thermal motion detection sensor using the DataUpdateCoordinator."""
 
+    # Write counters change on every write; keep them out of the recorder
+    _unrecorded_attributes = frozenset({"writes", "writes_suppressed"})
+
     def __init__(self, name, coordinator, motion_threshold, config_entry=None, unique_id=None):
         super().__init__()
         self._config_entry = config_entry
@@ -47,6 +52,9 @@ class ThermalMotionSensor(BinarySensorEntity):
         self._is_on = False
         self._unique_id = unique_id
 
+        # Motion is only written when it actually turns on or off
+        self._write_policy = WritePolicy()
+
         # Register the entity as a listener to the coordinator’s data updates
         self._remove_listener = None
 
@@ -78,6 +86,21 @@ class ThermalMotionSensor(BinarySensorEntity):
     def icon(self):
         return "mdi:motion-sensor"
 
+    @property
+    def should_poll(self):
+        """State is pushed by the coordinator."""
+        return False
+
+    @property
+    def available(self):
+        """Unavailable until the coordinator delivers its first frame."""
+        return self.coordinator.analysis is not None
+
+    @property
+    def extra_state_attributes(self):
+        """Expose how many state writes were suppressed because motion did not change."""
+        return self._write_policy.attributes
+
     async def async_update(self):
         """Update the state based on coordinator data."""
         data = self.coordinator.data
@@ -87,21 +110,56 @@ class ThermalMotionSensor(BinarySensorEntity):
             _LOGGER.warning(f"{self.name}: No data available from coordinator.")
             return
 
-        # Use the predefined keys from the coordinator directly
-        avg_temp = data.get("avg_value")
-        max_temp = data.get("max_value")
+        self._update_motion(self.coordinator.analysis)
+
+    def _update_motion(self, analysis):
+        """Recompute the motion state from the coordinator's shared frame analysis."""
+        if analysis is None:
+            return
 
-        if avg_temp is not None and max_temp is not None:
-            temp_diff = max_temp - avg_temp
+        temp_diff = analysis.motion_delta
+        if temp_diff is not None:
             self._is_on = temp_diff > self._motion_threshold
             _LOGGER.debug(f"{self.name}: Motion state updated. Temperature difference: {temp_diff}, Threshold: {self._motion_threshold}")
         else:
             _LOGGER.error(f"{self.name}: Missing required temperature data fields from coordinator.")
 
+    def _motion_changed(self, analysis):
+        """Return True if the frame turns motion on or off (or is the first one to be written)."""
+        if self._write_policy.writes == 0:
+            return True
+        temp_diff = analysis.motion_delta
+        if temp_diff is not None and (temp_diff > self._motion_threshold) != self._is_on:
+            return True
+        # The frame never reaches the write policy; count the write it saved
+        self._write_policy.record_suppressed()
+        return False
+
+    @callback
+    def _handle_coordinator_update(self):
+        """Recompute motion and write the state only when it changed."""
+        analysis = self.coordinator.analysis
+        if analysis is None:
+            return
+
+        self._update_motion(analysis)
+        if self._write_policy.evaluate(self._is_on) == 0:
+            self._write_policy.record_write(self._is_on)
+            self.async_write_ha_state()
+
     async def async_added_to_hass(self):
         """Called when the entity is added to Home Assistant."""
-        # Now attach the listener since hass is guaranteed to be available
-        self._remove_listener = self.coordinator.async_add_listener(self.async_write_ha_state)
+        # The initial state is written by Home Assistant when the entity is added
+        analysis = self.coordinator.analysis
+        if analysis is not None:
+            self._update_motion(analysis)
+            self._write_policy.record_write(self._is_on)
+
+        # Now attach the listener since hass is guaranteed to be available; only
+        # frames that flip the motion state are delivered, without delay
+        self._remove_listener = self.coordinator.async_add_rate_limited_listener(
+            self._handle_coordinator_update, significant=self._motion_changed
+        )
 
     async def async_will_remove_from_hass(self):
         """Clean up when the sensor is removed from Home Assistant."""
@@ -1,29 +1,24 @@
 import asyncio
+import importlib
+from functools import partial
 import time
 import logging
-import os
 import uuid
 import aiohttp
 from homeassistant.components.camera import Camera
+from homeassistant.core import callback
 from homeassistant.helpers.network import get_url
-from .constants import DOMAIN, DEFAULT_NAME, DEFAULT_ROWS, DEFAULT_COLS, DEFAULT_DATA_FIELD, DEFAULT_LOWEST_FIELD, DEFAULT_HIGHEST_FIELD, DEFAULT_AVERAGE_FIELD, DEFAULT_RESAMPLE_METHOD, DEFAULT_MJPEG_PORT, DEFAULT_DESIRED_HEIGHT
-from .frame_processor import process_frame
+from .constants import DOMAIN, DEFAULT_NAME, DEFAULT_ROWS, DEFAULT_COLS, DEFAULT_DATA_FIELD, DEFAULT_LOWEST_FIELD, DEFAULT_HIGHEST_FIELD, DEFAULT_AVERAGE_FIELD, DEFAULT_RESAMPLE_METHOD, DEFAULT_MJPEG_PORT, DEFAULT_DESIRED_HEIGHT, DEFAULT_CONTOUR_STEP, DEFAULT_DISPLAY_RANGE_MODE, DEFAULT_DISPLAY_MIN, DEFAULT_DISPLAY_MAX, DEFAULT_DISPLAY_HYSTERESIS, DEFAULT_RENDER_BACKEND, DEFAULT_PALETTE, DEFAULT_RENDER_CHANGE_THRESHOLD, DEFAULT_RENDER_MAX_STALENESS
+from .change_gate import ChangeGate
+from .display_range import DisplayRange
+from .renderer import async_load_renderer, font_size_for_height, isotherm_from_config
 from .coordinator import ThermalCameraDataCoordinator
-from PIL import Image, ImageFont
-import numpy as np
-import hashlib
 
 _LOGGER = logging.getLogger(__name__)
 
-FONT_PATH = os.path.join(os.path.dirname(__file__), 'DejaVuSans-Bold.ttf')
-
-# Resample method mappings
-RESAMPLE_METHODS = {
-    "NEAREST": Image.NEAREST,
-    "BILINEAR": Image.BILINEAR,
-    "BICUBIC": Image.BICUBIC,
-    "LANCZOS": Image.LANCZOS,
-}
+# How long an image request waits for the warm-up render: the very first
+# one, and the first one after an idle period (the front buffer is stale)
+WARM_UP_TIMEOUT_SEC = 5.0
 
 async def async_setup_entry(hass, config_entry, async_add_entities):
     """Set up the thermal camera platform from a config entry."""
@@ -40,9 +35,25 @@ async def async_setup_entry(hass, config_entry, async_add_entities):
     lowest_field = config.get("lowest_field", DEFAULT_LOWEST_FIELD)
     highest_field = config.get("highest_field", DEFAULT_HIGHEST_FIELD)
     average_field = config.get("average_field", DEFAULT_AVERAGE_FIELD)
-    resample_method = RESAMPLE_METHODS.get(config.get("resample", DEFAULT_RESAMPLE_METHOD), Image.NEAREST)
+    resample_method = config.get("resample", DEFAULT_RESAMPLE_METHOD)
     mjpeg_port = config.get("mjpeg_port", DEFAULT_MJPEG_PORT)
     desired_height = config.get("desired_height", DEFAULT_DESIRED_HEIGHT)
+    contour_step = config.get("contour_step", DEFAULT_CONTOUR_STEP)
+
+    # Translate the isotherm mode into the (low, high) band used by process_frame
+    isotherm = isotherm_from_config(config)
+
+    display_range = DisplayRange(
+        mode=config.get("display_range_mode", DEFAULT_DISPLAY_RANGE_MODE),
+        fixed_min=config.get("display_min", DEFAULT_DISPLAY_MIN),
+        fixed_max=config.get("display_max", DEFAULT_DISPLAY_MAX),
+        hysteresis=config.get("display_hysteresis", DEFAULT_DISPLAY_HYSTERESIS),
+    )
+
+    change_gate = ChangeGate(
+        threshold=config.get("render_change_threshold", DEFAULT_RENDER_CHANGE_THRESHOLD),
+        max_staleness=config.get("render_max_staleness", DEFAULT_RENDER_MAX_STALENESS),
+    )
 
     # Initialize or reuse the session
     session = hass.data.get("thermal_camera_session")
@@ -68,18 +79,26 @@ async def async_setup_entry(hass, config_entry, async_add_entities):
             highest_field=highest_field,
             average_field=average_field,
             resample_method=resample_method,
+            palette=config.get("palette", DEFAULT_PALETTE),
             session=session,
             mjpeg_port=mjpeg_port,
             desired_height=desired_height,
+            isotherm=isotherm,
+            contour_step=contour_step,
+            display_range=display_range,
+            change_gate=change_gate,
+            render_backend=config.get("render_backend", DEFAULT_RENDER_BACKEND),
             config_entry=config_entry,
             unique_id=unique_id,
         )
-    ], update_before_add=True)
+    ])
 
 class ThermalCamera(Camera):
     """Representation of a thermal camera using centralized polling with a DataUpdateCoordinator."""
 
-    def __init__(self, name, coordinator, rows, cols, data_field, lowest_field, highest_field, average_field, resample_method, session, mjpeg_port, desired_height, config_entry=None, unique_id=None):
+    _unrecorded_attributes = frozenset({"frames_rendered", "frames_skipped", "renders_avoided"})
+
+    def __init__(self, name, coordinator, rows, cols, data_field, lowest_field, highest_field, average_field, resample_method, session, mjpeg_port, desired_height, palette=DEFAULT_PALETTE, isotherm=None, contour_step=None, display_range=None, change_gate=None, render_backend=DEFAULT_RENDER_BACKEND, config_entry=None, unique_id=None):
         super().__init__()
         self._config_entry = config_entry
         self._name = name
@@ -93,68 +112,130 @@ class ThermalCamera(Camera):
         self._resample_method = resample_method
         self._session = session
         self._unique_id = unique_id
-        self._frame = None  # Initialize frame as None
-        self._frame_lock = asyncio.Lock()
+        self._frame = None  # Front buffer: the last completed JPEG, served as-is
+        self._render_task = None  # Background task rendering into the back buffer
+        self._render_pending = False  # A newer frame arrived while rendering
+        self._frames_rendered = 0
+        self._frames_skipped = 0
         self._mjpeg_port = mjpeg_port
         self._desired_height = desired_height
-        self._last_frame_data = None  # Store a hash of the last processed frame
+        self._font_size = font_size_for_height(desired_height)
+        self._palette = palette
+        self._isotherm = isotherm
+        self._contour_step = contour_step
+        self._display_range = display_range or DisplayRange()
+        self._change_gate = change_gate or ChangeGate()
+        self._render_backend = render_backend
+        self._render_pool = None  # render_pool module, imported when render_backend is "process_pool"
+        self._render_slot = None
+        self._last_frame_data = None  # Version of the last processed frame
+        self._rendered_version = None  # Version of the frame in the front buffer
         # Viewing/activity tracking: only render when recently viewed
         self._last_image_request_ts = 0.0
         self._view_window_sec = 3.0  # consider "viewed" if an image was requested within 3s
 
-        # Load font data
-        try:
-            self._font = ImageFont.truetype(FONT_PATH, 30)
-        except IOError:
-            _LOGGER.error("Failed to load DejaVu font, using default font.")
-            self._font = ImageFont.load_default()
+        # process_frame and the shared font are loaded in the executor on first render
+        self._process_frame = None
+        self._font = None
+        self._was_available = False
 
         # Listen for updates from the coordinator
         self._remove_listener = None
 
     async def async_update(self):
-        """Prepare data but avoid rendering unless recently viewed."""
-        # Only render if an image was requested recently (considered "viewed")
-        if (time.monotonic() - self._last_image_request_ts) > self._view_window_sec:
-            return
+        """Queue a background render if the camera is being viewed."""
+        if self._is_viewed():
+            self._schedule_render()
+
+    def _is_viewed(self):
+        """An image was requested recently (within the view window)."""
+        return (time.monotonic() - self._last_image_request_ts) <= self._view_window_sec
+
+    def _schedule_render(self):
+        """Render the newest frame into the back buffer in the background.
 
-        if self._frame_lock.locked():
+        Only one render runs at a time; frames arriving meanwhile are coalesced
+        so the next pass picks up the newest one.
+        """
+        if self._render_task is not None and not self._render_task.done():
+            if self._render_pending:
+                self._frames_skipped += 1
+            self._render_pending = True
             return
+        self._render_pending = False
+        self._render_task = self.hass.async_create_background_task(
+            self._async_render_loop(), f"{DOMAIN} render {self.entity_id}"
+        )
 
-        async with self._frame_lock:
-            data = self.coordinator.data
-            if not data or "frame_data" not in data:
-                # No data yet; don't log to avoid spam
+    async def _async_render_loop(self):
+        """Render frames until no newer frame is pending, swapping each into the front buffer."""
+        while True:
+            self._render_pending = False
+            analysis = self._next_analysis()
+            params = None if analysis is None else self._render_params(analysis)
+            # Frames that would not visibly change the image are not rendered
+            if params is not None and self._change_gate.should_render(
+                analysis.array, params["min_value"], params["max_value"], params["avg_value"], params["hotspot"]
+            ):
+                try:
+                    back_buffer = await self._async_render(analysis, params)
+                except Exception:
+                    _LOGGER.exception("%s: failed to render frame", self.name)
+                    back_buffer = None
+                if back_buffer is not None:
+                    # Swap: requests are always answered from the front buffer
+                    self._frame = back_buffer
+                    self._rendered_version = analysis.version
+                    self._frames_rendered += 1
+                    self._change_gate.record_render(
+                        analysis.array, params["min_value"], params["max_value"], params["avg_value"], params["hotspot"]
+                    )
+            if not self._render_pending:
                 return
 
-            frame_data = data.get("frame_data") or []
-            if not frame_data:
-                # Skip rendering when empty; avoid warning spam
-                return
+    async def _async_render(self, analysis, params):
+        """Render one frame off the event loop and return the JPEG bytes."""
+        if self._render_slot is not None:
+            return await self._render_slot.async_render(analysis.array, self._font_size, **params)
 
-            # Convert to numpy and reshape
-            try:
-                frame_nd = np.array(frame_data, dtype=float).reshape(self._rows, self._cols)
-            except Exception:
-                # If shape is unexpected, skip without logging loudly
-                return
+        if self._process_frame is None:
+            self._process_frame, self._font = await async_load_renderer(self.hass, self._font_size)
+        return await self.hass.async_add_executor_job(
+            partial(self._process_frame, analysis.array, font=self._font, **params)
+        )
 
-            frame_checksum = hashlib.md5(frame_nd.tobytes()).hexdigest()
-            if frame_checksum == self._last_frame_data:
-                return
+    def _next_analysis(self):
+        """Return the coordinator's analysis if it holds a frame not rendered yet, else None."""
+        # The coordinator's shared analysis already holds the reshaped
+        # array, its version and the hotspot
+        analysis = self.coordinator.analysis
+        if analysis is None or analysis.array is None:
+            # No data yet or unexpected shape; don't log to avoid spam
+            return None
 
-            self._frame = process_frame(
-                frame_nd,
-                data.get("min_value", 0.0),
-                data.get("max_value", 0.0),
-                data.get("avg_value", 0.0),
-                self._rows,
-                self._cols,
-                self._resample_method,
-                self._font,
-                self._desired_height,
-            )
-            self._last_frame_data = frame_checksum
+        if analysis.version == self._last_frame_data:
+            return None
+        self._last_frame_data = analysis.version
+        return analysis
+
+    def _render_params(self, analysis):
+        """Return the process_frame arguments (other than frame and font) for a new frame."""
+        # Stable display ranges keep the palette mapping, scale bar and
+        # labels identical between frames so their rendering is reused
+        display_min, display_max = self._display_range.update(analysis.min_value, analysis.max_value)
+        return {
+            "min_value": display_min,
+            "max_value": display_max,
+            "avg_value": analysis.avg_value,
+            "rows": self._rows,
+            "cols": self._cols,
+            "resample_method": self._resample_method,
+            "desired_height": self._desired_height,
+            "palette": self._palette,
+            "isotherm": self._isotherm,
+            "contour_step": self._contour_step,
+            "hotspot": analysis.hotspot,
+        }
 
     @property
     def unique_id(self):
@@ -176,14 +257,34 @@ class ThermalCamera(Camera):
         """Return the name of the camera."""
         return self._name
 
+    @property
+    def extra_state_attributes(self):
+        """Expose how many frames were rendered, coalesced away, or skipped as visually unchanged."""
+        return {
+            "frames_rendered": self._frames_rendered,
+            "frames_skipped": self._frames_skipped,
+            "renders_avoided": self._change_gate.renders_avoided,
+        }
+
     async def async_camera_image(self, width=None, height=None):
         """Return the camera image asynchronously."""
-        # Mark as viewed
+        # A request after an idle period warms the renderer up straight away
+        warm = self._is_viewed()
         self._last_image_request_ts = time.monotonic()
-        # Ensure we have a frame ready; generate on-demand if needed
-        if self._frame is None:
+        analysis = self.coordinator.analysis
+        stale = not warm and analysis is not None and analysis.version != self._rendered_version
+        if not warm or self._frame is None:
+            # The front buffer may be from long ago; render the current frame
+            # regardless of the change gate, even if it was skipped before
+            self._change_gate.reset()
+            self._last_frame_data = self._rendered_version
+            self._schedule_render()
+
+        # Serve the front buffer; the very first image and the first one
+        # after an idle period wait for the background render to finish
+        if (self._frame is None or stale) and self._render_task is not None:
             try:
-                await self.async_update()
+                await asyncio.wait_for(asyncio.shield(self._render_task), WARM_UP_TIMEOUT_SEC)
             except Exception:
                 pass
         return self._frame
@@ -203,13 +304,41 @@ class ThermalCamera(Camera):
         """Camera polling is required."""
         return False
 
+    @property
+    def available(self):
+        """The camera is unavailable until the coordinator delivers its first frame."""
+        return self.coordinator.analysis is not None
+
+    @callback
+    def _handle_coordinator_update(self):
+        """Publish the availability change on the first frame and render while viewed."""
+        if self.available != self._was_available:
+            self._was_available = self.available
+            self.async_write_ha_state()
+        if self._is_viewed():
+            self._schedule_render()
+
     async def async_added_to_hass(self):
         """Called when the entity is added to Home Assistant."""
+        self._was_available = self.available
+        if self._render_backend == "process_pool":
+            # Imported on demand: the pool pulls in numpy and the frame processor
+            self._render_pool = await self.hass.async_add_executor_job(
+                importlib.import_module, f"{__package__}.render_pool"
+            )
+            self._render_slot = self._render_pool.async_get_render_slot(self.hass)
+
         # Now attach the listener since hass is guaranteed to be available
-        self._remove_listener = self.coordinator.async_add_listener(lambda: self.hass.async_create_task(self.async_update())) 
+        self._remove_listener = self.coordinator.async_add_listener(self._handle_coordinator_update)
 
     async def async_will_remove_from_hass(self):
         """Clean up when the sensor is removed from Home Assistant."""
         if self._remove_listener:
             self._remove_listener()  # Remove the listener when removing the entity
             self._remove_listener = None
+        if self._render_task is not None:
+            self._render_task.cancel()
+            self._render_task = None
+        if self._render_slot is not None:
+            self._render_pool.async_release_render_slot(self.hass, self._render_slot)
+            self._render_slot = None
@@ -0,0 +1,101 @@
+import time
+
+# Palette steps a display range is mapped onto
+PALETTE_STEPS = 255.0
+# A frame changed visibly once more than this fraction of its pixels moved
+# by more than the threshold (drift, range changes, large objects) ...
+CHANGED_PIXEL_FRACTION = 0.01
+# ... or once any pixel moved by more than this many thresholds (a small
+# object moving); sensor noise rarely reaches that far even on large grids
+OUTLIER_FACTOR = 2.0
+
+class ChangeGate:
+    """Decide whether a new frame would visibly change the last rendered image.
+
+    Frames are compared to the last rendered one (not the previous frame, so
+    slow drifts still add up) in display units: each frame's display range
+    is mapped onto the palette's 256 colors and pixels are compared by color
+    index. A frame is rendered once more than CHANGED_PIXEL_FRACTION of its
+    pixels moved by more than `threshold`, or any pixel moved by more than
+    OUTLIER_FACTOR times that. The overlay is held to the same tolerance,
+    converted to °C over the display range: a render is due when the display
+    range, average or hotspot label moved by more than that, or when the
+    hotspot moved to a pixel that is hotter than the old reticle position by
+    more than that. Smaller changes wait until `max_staleness` seconds have
+    passed. A threshold of 0 renders every frame.
+    """
+
+    def __init__(self, threshold=0.0, max_staleness=0.0):
+        self.threshold = threshold
+        self.max_staleness = max_staleness
+        self.renders_avoided = 0
+        self._last_index = None  # Palette indices of the last rendered frame
+        self._last_labels = None  # (display_min, display_max, avg, hotspot value) as rendered
+        self._last_hotspot = None
+        self._last_render_ts = None
+
+    def should_render(self, array, display_min, display_max, avg_value=None, hotspot=None, now=None):
+        """Return True if `array` rendered over (display_min, display_max) would differ visibly."""
+        now = time.monotonic() if now is None else now
+        last_index = self._last_index
+        if (
+            self.threshold <= 0
+            or last_index is None
+            or last_index.shape != array.shape
+            or display_max <= display_min
+            or (self.max_staleness > 0 and now - self._last_render_ts >= self.max_staleness)
+        ):
+            return True
+
+        tolerance = self.threshold * (display_max - display_min) / PALETTE_STEPS
+        labels = _labels(display_min, display_max, avg_value, hotspot)
+        if (
+            any(_moved(old, new, tolerance) for old, new in zip(self._last_labels, labels))
+            or self._hotspot_moved(array, hotspot, tolerance)
+        ):
+            return True
+        delta = abs(palette_index(array, display_min, display_max) - last_index)
+        if delta.max() > OUTLIER_FACTOR * self.threshold or (delta > self.threshold).mean() > CHANGED_PIXEL_FRACTION:
+            return True
+        self.renders_avoided += 1
+        return False
+
+    def record_render(self, array, display_min, display_max, avg_value=None, hotspot=None, now=None):
+        """Remember the frame, range and overlay of a completed render."""
+        # A flat range renders one color; no index to compare against
+        self._last_index = palette_index(array, display_min, display_max) if display_max > display_min else None
+        self._last_labels = _labels(display_min, display_max, avg_value, hotspot)
+        self._last_hotspot = hotspot
+        self._last_render_ts = time.monotonic() if now is None else now
+
+    def reset(self):
+        """Forget the last render; the next frame is always rendered."""
+        self._last_index = None
+        self._last_labels = None
+        self._last_hotspot = None
+        self._last_render_ts = None
+
+    def _hotspot_moved(self, array, hotspot, tolerance):
+        """Return True if the reticle would move to a pixel clearly hotter than its old position."""
+        last = self._last_hotspot
+        if hotspot is None or last is None:
+            return hotspot is not last
+        if hotspot[:2] == last[:2]:
+            return False
+        # Noise makes the hottest pixel hop between near-equal neighbours;
+        # the old position is still right if it is as hot within tolerance
+        return hotspot[2] - float(array[last[0], last[1]]) > tolerance
+
+def _labels(display_min, display_max, avg_value, hotspot):
+    """Return the temperatures printed on the overlay."""
+    return display_min, display_max, avg_value, None if hotspot is None else hotspot[2]
+
+def _moved(old, new, tolerance):
+    """Return True if a label changed by more than tolerance (or appeared or disappeared)."""
+    if old is None or new is None:
+        return old is not new
+    return abs(new - old) > tolerance
+
+def palette_index(array, display_min, display_max):
+    """Return the fractional 0..255 palette position of each pixel of array."""
+    return ((array - display_min) * (PALETTE_STEPS / (display_max - display_min))).clip(0.0, PALETTE_STEPS)
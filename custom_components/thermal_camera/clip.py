@@ -0,0 +1,93 @@
+import math
+import os
+
+from PIL import Image
+
+from .frame_processor import render_images, image_to_jpeg_bytes
+from .renderer import load_font, font_size_for_height
+
+# Frames upscaled and colorized together per batch; bounds the float32 working set
+BATCH_PIXELS = 8_000_000
+# Frames are streamed into the GIF writer, but Pillow keeps each encoded frame
+# (palettized, up to one byte per pixel) until the file is finished; longer
+# clips are thinned out in time to stay under this many pixels
+MAX_GIF_PIXELS = 40_000_000
+MIN_GIF_FRAME_MS = 20  # Browsers clamp shorter delays
+
+# Blocking: everything in this module runs in an executor
+
+def write_clip(entries, path, fmt, rows, cols, resample_method, desired_height, *, palette="classic",
+               isotherm=None, contour_step=None, progress=None):
+    """Render coordinator history entries to an animated GIF or MJPEG file and return the frame count.
+
+    `entries` are (monotonic time, ThermalFrame, min, max, avg) tuples. All
+    frames share one display range so colors stay stable through the clip.
+    `progress(done, total)` is called after every rendered batch.
+    """
+    entries = [entry for entry in entries if entry[1].shape == (rows, cols)]
+    if not entries:
+        return 0
+
+    out_width = int(desired_height * cols / rows)
+    frame_pixels = desired_height * out_width
+    if fmt == "gif":
+        entries = entries[::max(1, math.ceil(len(entries) * frame_pixels / MAX_GIF_PIXELS))]
+    total = len(entries)
+
+    lows, highs = zip(*(frame_range(entry[1]) for entry in entries))
+    min_value, max_value = min(lows), max(highs)
+    font = load_font(font_size_for_height(desired_height))
+    batch_size = max(1, BATCH_PIXELS // frame_pixels)
+
+    def rendered_images():
+        """Yield the clip's frames as they are rendered, batch by batch."""
+        for start in range(0, total, batch_size):
+            batch = entries[start:start + batch_size]
+            images = render_images(
+                [entry[1].celsius() for entry in batch], min_value, max_value, [entry[4] for entry in batch],
+                rows, cols, resample_method, font, desired_height,
+                palette=palette, isotherm=isotherm, contour_step=contour_step,
+            )
+            for img in images:
+                yield img.quantize(256, method=Image.Quantize.FASTOCTREE) if fmt == "gif" else img
+            if progress is not None:
+                progress(start + len(batch), total)
+
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    partial_path = path + ".part"
+    try:
+        with open(partial_path, "wb") as output:
+            images = rendered_images()
+            if fmt == "gif":
+                # The remaining frames are rendered while Pillow writes the file
+                first = next(images)
+                first.save(
+                    output, format="GIF", save_all=True, append_images=images,
+                    duration=frame_durations([entry[0] for entry in entries]), loop=0,
+                )
+            else:
+                # MJPEG: concatenated JPEG frames, written as they are rendered
+                for img in images:
+                    output.write(image_to_jpeg_bytes(img))
+    except BaseException:
+        # Never leave a truncated clip behind
+        if os.path.exists(partial_path):
+            os.remove(partial_path)
+        raise
+    os.replace(partial_path, path)
+    return total
+
+def frame_range(frame):
+    """Return (min, max) °C of a ThermalFrame without converting the whole frame."""
+    low, high = float(frame.raw.min()), float(frame.raw.max())
+    return low * frame.scale + frame.offset, high * frame.scale + frame.offset
+
+def frame_durations(timestamps):
+    """Return GIF frame durations in ms that replay the frames at their original pace."""
+    durations = [
+        max(MIN_GIF_FRAME_MS, round((later - earlier) * 1000))
+        for earlier, later in zip(timestamps, timestamps[1:])
+    ]
+    # The last frame is shown as long as the one before it
+    durations.append(durations[-1] if durations else 100)
+    return durations
@@ -7,8 +7,22 @@ from .constants import (
     DOMAIN, DEFAULT_NAME, DEFAULT_ROWS, DEFAULT_COLS, DEFAULT_PATH,
     DEFAULT_DATA_FIELD, DEFAULT_LOWEST_FIELD, DEFAULT_HIGHEST_FIELD,
     DEFAULT_RESAMPLE_METHOD, DEFAULT_MOTION_THRESHOLD, DEFAULT_AVERAGE_FIELD,
-    DEFAULT_DESIRED_HEIGHT
+    DEFAULT_DESIRED_HEIGHT, DEFAULT_ISOTHERM_MODE, DEFAULT_ISOTHERM_MIN,
+    DEFAULT_ISOTHERM_MAX, DEFAULT_CONTOUR_STEP, ISOTHERM_MODES,
+    DEFAULT_DISPLAY_RANGE_MODE, DEFAULT_DISPLAY_MIN, DEFAULT_DISPLAY_MAX,
+    DEFAULT_DISPLAY_HYSTERESIS, DISPLAY_RANGE_MODES, DEFAULT_SENSOR_DEADBAND,
+    DEFAULT_SENSOR_RELATIVE_DEADBAND, DEFAULT_SENSOR_MIN_INTERVAL, DEFAULT_SENSOR_HEARTBEAT,
+    DEFAULT_RENDER_BACKEND, RENDER_BACKENDS, DEFAULT_PALETTE, PALETTES, DEFAULT_HISTORY_SECONDS,
+    DEFAULT_USE_STREAM, DEFAULT_STREAM_PUSH_MS, DEFAULT_UPDATE_INTERVAL_MS,
+    DEFAULT_RENDER_CHANGE_THRESHOLD, DEFAULT_RENDER_MAX_STALENESS
 )
+from .probe import async_probe_device
+
+# First step: where the device is; it is probed before the remaining settings are shown
+USER_SCHEMA = vol.Schema({
+    vol.Required("url"): str,
+    vol.Optional("name", default=DEFAULT_NAME): str,
+})
 
 # Configuration schema for the UI
 CONFIG_SCHEMA = vol.Schema({
@@ -21,41 +35,104 @@ CONFIG_SCHEMA = vol.Schema({
     vol.Optional("lowest_field", default=DEFAULT_LOWEST_FIELD): str,
     vol.Optional("highest_field", default=DEFAULT_HIGHEST_FIELD): str,
     vol.Optional("average_field", default=DEFAULT_AVERAGE_FIELD): str,
+    vol.Optional("use_stream", default=DEFAULT_USE_STREAM): bool,
+    vol.Optional("stream_push_ms", default=DEFAULT_STREAM_PUSH_MS): int,
+    vol.Optional("update_interval_ms", default=DEFAULT_UPDATE_INTERVAL_MS): int,
     vol.Optional("resample", default=DEFAULT_RESAMPLE_METHOD): vol.In(["NEAREST", "BILINEAR", "BICUBIC", "LANCZOS"]),
+    vol.Optional("palette", default=DEFAULT_PALETTE): vol.In(PALETTES),
     vol.Optional("motion_threshold", default=DEFAULT_MOTION_THRESHOLD): int,
     # vol.Optional("mjpeg_port", default=DEFAULT_MJPEG_PORT): int,
     vol.Optional("desired_height", default=DEFAULT_DESIRED_HEIGHT): int,
+    vol.Optional("isotherm_mode", default=DEFAULT_ISOTHERM_MODE): vol.In(ISOTHERM_MODES),
+    vol.Optional("isotherm_min", default=DEFAULT_ISOTHERM_MIN): vol.Coerce(float),
+    vol.Optional("isotherm_max", default=DEFAULT_ISOTHERM_MAX): vol.Coerce(float),
+    vol.Optional("contour_step", default=DEFAULT_CONTOUR_STEP): vol.Coerce(float),
+    vol.Optional("display_range_mode", default=DEFAULT_DISPLAY_RANGE_MODE): vol.In(DISPLAY_RANGE_MODES),
+    vol.Optional("display_min", default=DEFAULT_DISPLAY_MIN): vol.Coerce(float),
+    vol.Optional("display_max", default=DEFAULT_DISPLAY_MAX): vol.Coerce(float),
+    vol.Optional("display_hysteresis", default=DEFAULT_DISPLAY_HYSTERESIS): vol.Coerce(float),
+    vol.Optional("sensor_deadband", default=DEFAULT_SENSOR_DEADBAND): vol.Coerce(float),
+    vol.Optional("sensor_relative_deadband", default=DEFAULT_SENSOR_RELATIVE_DEADBAND): vol.Coerce(float),
+    vol.Optional("sensor_min_interval", default=DEFAULT_SENSOR_MIN_INTERVAL): vol.Coerce(float),
+    vol.Optional("sensor_heartbeat", default=DEFAULT_SENSOR_HEARTBEAT): vol.Coerce(float),
+    vol.Optional("render_backend", default=DEFAULT_RENDER_BACKEND): vol.In(RENDER_BACKENDS),
+    vol.Optional("render_change_threshold", default=DEFAULT_RENDER_CHANGE_THRESHOLD): vol.Coerce(float),
+    vol.Optional("render_max_staleness", default=DEFAULT_RENDER_MAX_STALENESS): vol.Coerce(float),
+    vol.Optional("history_seconds", default=DEFAULT_HISTORY_SECONDS): vol.Coerce(float),
 })
 
+# Shown when the probe found no frames but the device answered
+UNDETECTED_SUMMARY = {"transport": "not detected", "format": "-", "shape": "-", "latency_ms": "-", "fps": "-"}
+
+def validate_display_range(user_input):
+    """Return form errors for a fixed display range that is empty or inverted."""
+    if (
+        user_input.get("display_range_mode") == "fixed"
+        and user_input.get("display_min", DEFAULT_DISPLAY_MIN) >= user_input.get("display_max", DEFAULT_DISPLAY_MAX)
+    ):
+        return {"display_max": "invalid_display_range"}
+    return {}
+
+def settings_schema(suggested):
+    """Return CONFIG_SCHEMA without url and name, defaulting to the probe's suggestions."""
+    fields = {}
+    for key, validator in CONFIG_SCHEMA.schema.items():
+        if key.schema in ("url", "name"):
+            continue
+        fields[vol.Optional(key.schema, default=suggested.get(key.schema, key.default()))] = validator
+    return vol.Schema(fields)
+
 class ThermalCameraConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle a config flow for the Thermal Camera integration."""
 
     VERSION = 1
 
+    def __init__(self):
+        self._user_input = None
+        self._probe = None
+
     async def async_step_user(self, user_input=None):
-        """Handle the initial step."""
+        """Handle the initial step: probe the device at the given URL."""
         errors = {}
         if user_input is not None:
+            session = async_get_clientsession(self.hass)
             try:
-                # Validate the URL and create entry if successful
-                session = async_get_clientsession(self.hass)
-                async with session.get(user_input["url"]) as response:
-                    response.raise_for_status()
-                # Generate and store unique IDs for camera and binary sensor
-                if "unique_id" not in user_input:
-                    user_input["unique_id"] = str(uuid.uuid4())
-                if "unique_id_motion_sensor" not in user_input:
-                    user_input["unique_id_motion_sensor"] = str(uuid.uuid4())
-                return self.async_create_entry(title=user_input["name"], data=user_input)
+                self._probe = await async_probe_device(session, user_input["url"])
+                if self._probe is None:
+                    # Reachable but no recognizable frames: continue with the defaults
+                    async with session.get(user_input["url"]) as response:
+                        response.raise_for_status()
+                self._user_input = user_input
+                return await self.async_step_settings()
             except Exception:
                 errors["base"] = "cannot_connect"
 
         return self.async_show_form(
             step_id="user",
-            data_schema=CONFIG_SCHEMA,
+            data_schema=USER_SCHEMA,
             errors=errors
         )
 
+    async def async_step_settings(self, user_input=None):
+        """Confirm the settings pre-filled from the probe and create the entry."""
+        errors = validate_display_range(user_input) if user_input is not None else {}
+        if user_input is not None and not errors:
+            data = {**self._user_input, **user_input}
+            # Generate and store unique IDs for camera and binary sensor
+            if "unique_id" not in data:
+                data["unique_id"] = str(uuid.uuid4())
+            if "unique_id_motion_sensor" not in data:
+                data["unique_id_motion_sensor"] = str(uuid.uuid4())
+            return self.async_create_entry(title=data["name"], data=data)
+
+        probe = self._probe or {"settings": {}, "summary": UNDETECTED_SUMMARY}
+        return self.async_show_form(
+            step_id="settings",
+            data_schema=settings_schema({**probe["settings"], **(user_input or {})}),
+            description_placeholders={key: str(value) for key, value in probe["summary"].items()},
+            errors=errors,
+        )
+
     @staticmethod
     @callback
     def async_get_options_flow(config_entry):
@@ -66,7 +143,8 @@ class ThermalCameraOptionsFlowHandler(config_entries.OptionsFlow):
 
     async def async_step_init(self, user_input=None):
         """Manage the options for the thermal camera."""
-        if user_input is not None:
+        errors = validate_display_range(user_input) if user_input is not None else {}
+        if user_input is not None and not errors:
             # Update the config entry with new user input values
             self.hass.config_entries.async_update_entry(self.config_entry, data={**self.config_entry.data, **user_input})
             await self.hass.config_entries.async_reload(self.config_entry.entry_id)
@@ -82,12 +160,36 @@ class ThermalCameraOptionsFlowHandler(config_entries.OptionsFlow):
             vol.Optional("lowest_field", default=self.config_entry.data.get("lowest_field", DEFAULT_LOWEST_FIELD)): str,
             vol.Optional("highest_field", default=self.config_entry.data.get("highest_field", DEFAULT_HIGHEST_FIELD)): str,
             vol.Optional("average_field", default=self.config_entry.data.get("average_field", DEFAULT_AVERAGE_FIELD)): str,
+            vol.Optional("use_stream", default=self.config_entry.data.get("use_stream", self.config_entry.data.get("path") == "bin")): bool,
+            vol.Optional("stream_push_ms", default=self.config_entry.data.get("stream_push_ms", DEFAULT_STREAM_PUSH_MS)): int,
+            vol.Optional("update_interval_ms", default=self.config_entry.data.get("update_interval_ms", DEFAULT_UPDATE_INTERVAL_MS)): int,
             vol.Optional("resample", default=self.config_entry.data.get("resample", DEFAULT_RESAMPLE_METHOD)): vol.In(["NEAREST", "BILINEAR", "BICUBIC", "LANCZOS"]),
+            vol.Optional("palette", default=self.config_entry.data.get("palette", DEFAULT_PALETTE)): vol.In(PALETTES),
             vol.Optional("motion_threshold", default=self.config_entry.data.get("motion_threshold", DEFAULT_MOTION_THRESHOLD)): int,
             vol.Optional("desired_height", default=self.config_entry.data.get("desired_height", DEFAULT_DESIRED_HEIGHT)): int,
+            vol.Optional("isotherm_mode", default=self.config_entry.data.get("isotherm_mode", DEFAULT_ISOTHERM_MODE)): vol.In(ISOTHERM_MODES),
+            vol.Optional("isotherm_min", default=self.config_entry.data.get("isotherm_min", DEFAULT_ISOTHERM_MIN)): vol.Coerce(float),
+            vol.Optional("isotherm_max", default=self.config_entry.data.get("isotherm_max", DEFAULT_ISOTHERM_MAX)): vol.Coerce(float),
+            vol.Optional("contour_step", default=self.config_entry.data.get("contour_step", DEFAULT_CONTOUR_STEP)): vol.Coerce(float),
+            vol.Optional("display_range_mode", default=self.config_entry.data.get("display_range_mode", DEFAULT_DISPLAY_RANGE_MODE)): vol.In(DISPLAY_RANGE_MODES),
+            vol.Optional("display_min", default=self.config_entry.data.get("display_min", DEFAULT_DISPLAY_MIN)): vol.Coerce(float),
+            vol.Optional("display_max", default=self.config_entry.data.get("display_max", DEFAULT_DISPLAY_MAX)): vol.Coerce(float),
+            vol.Optional("display_hysteresis", default=self.config_entry.data.get("display_hysteresis", DEFAULT_DISPLAY_HYSTERESIS)): vol.Coerce(float),
+            vol.Optional("sensor_deadband", default=self.config_entry.data.get("sensor_deadband", DEFAULT_SENSOR_DEADBAND)): vol.Coerce(float),
+            vol.Optional("sensor_relative_deadband", default=self.config_entry.data.get("sensor_relative_deadband", DEFAULT_SENSOR_RELATIVE_DEADBAND)): vol.Coerce(float),
+            vol.Optional("sensor_min_interval", default=self.config_entry.data.get("sensor_min_interval", DEFAULT_SENSOR_MIN_INTERVAL)): vol.Coerce(float),
+            vol.Optional("sensor_heartbeat", default=self.config_entry.data.get("sensor_heartbeat", DEFAULT_SENSOR_HEARTBEAT)): vol.Coerce(float),
+            vol.Optional("render_backend", default=self.config_entry.data.get("render_backend", DEFAULT_RENDER_BACKEND)): vol.In(RENDER_BACKENDS),
+            vol.Optional("render_change_threshold", default=self.config_entry.data.get("render_change_threshold", DEFAULT_RENDER_CHANGE_THRESHOLD)): vol.Coerce(float),
+            vol.Optional("render_max_staleness", default=self.config_entry.data.get("render_max_staleness", DEFAULT_RENDER_MAX_STALENESS)): vol.Coerce(float),
+            vol.Optional("history_seconds", default=self.config_entry.data.get("history_seconds", DEFAULT_HISTORY_SECONDS)): vol.Coerce(float),
         })
 
+        if user_input is not None:
+            # Keep what was entered when the form is shown again with an error
+            options_schema = self.add_suggested_values_to_schema(options_schema, user_input)
         return self.async_show_form(
             step_id="init",
-            data_schema=options_schema
+            data_schema=options_schema,
+            errors=errors
         )
\ No newline at end of file
@@ -14,6 +14,30 @@ DEFAULT_RESAMPLE_METHOD = "NEAREST"
 DEFAULT_MOTION_THRESHOLD = 8
 DEFAULT_MJPEG_PORT = 8169
 DEFAULT_DESIRED_HEIGHT = 720
+DEFAULT_ISOTHERM_MODE = "off"
+DEFAULT_ISOTHERM_MIN = 0.0
+DEFAULT_ISOTHERM_MAX = 0.0
+DEFAULT_CONTOUR_STEP = 0.0
+DEFAULT_DISPLAY_RANGE_MODE = "auto"
+DEFAULT_DISPLAY_MIN = 15.0
+DEFAULT_DISPLAY_MAX = 35.0
+DEFAULT_DISPLAY_HYSTERESIS = 1.0
+DEFAULT_SENSOR_DEADBAND = 0.2
+DEFAULT_SENSOR_RELATIVE_DEADBAND = 0.0
+DEFAULT_SENSOR_MIN_INTERVAL = 5.0
+DEFAULT_SENSOR_HEARTBEAT = 300.0
+DEFAULT_RENDER_BACKEND = "inline"
+DEFAULT_PALETTE = "classic"
+DEFAULT_HISTORY_SECONDS = 30.0
+DEFAULT_USE_STREAM = False
+DEFAULT_STREAM_PUSH_MS = 200
+DEFAULT_UPDATE_INTERVAL_MS = 500
+DEFAULT_RENDER_CHANGE_THRESHOLD = 16.0
+DEFAULT_RENDER_MAX_STALENESS = 10.0
+
+# How often the temperature sensors look at new frames (their write policy
+# then decides what is recorded)
+SENSOR_UPDATE_RATE_HZ = 1.0
 
 CONF_DIMENSIONS = "dimensions"
 CONF_ROWS = "rows"
@@ -27,10 +51,49 @@ CONF_RESAMPLE = "resample"
 CONF_MOTION_THRESHOLD = "motion_threshold"
 CONF_MJPEG_PORT = "mjpeg_port"
 CONF_DESIRED_HEIGHT = "desired_height"
+CONF_ISOTHERM_MODE = "isotherm_mode"
+CONF_ISOTHERM_MIN = "isotherm_min"
+CONF_ISOTHERM_MAX = "isotherm_max"
+CONF_CONTOUR_STEP = "contour_step"
+CONF_DISPLAY_RANGE_MODE = "display_range_mode"
+CONF_DISPLAY_MIN = "display_min"
+CONF_DISPLAY_MAX = "display_max"
+CONF_DISPLAY_HYSTERESIS = "display_hysteresis"
+CONF_SENSOR_DEADBAND = "sensor_deadband"
+CONF_SENSOR_RELATIVE_DEADBAND = "sensor_relative_deadband"
+CONF_SENSOR_MIN_INTERVAL = "sensor_min_interval"
+CONF_SENSOR_HEARTBEAT = "sensor_heartbeat"
+CONF_RENDER_BACKEND = "render_backend"
+CONF_PALETTE = "palette"
+CONF_HISTORY_SECONDS = "history_seconds"
+CONF_USE_STREAM = "use_stream"
+CONF_STREAM_PUSH_MS = "stream_push_ms"
+CONF_UPDATE_INTERVAL_MS = "update_interval_ms"
+CONF_RENDER_CHANGE_THRESHOLD = "render_change_threshold"
+CONF_RENDER_MAX_STALENESS = "render_max_staleness"
 
 RESAMPLE_METHODS = {
     "NEAREST": "NEAREST",
     "BILINEAR": "BILINEAR",
     "BICUBIC": "BICUBIC",
     "LANCZOS": "LANCZOS",
-}
\ No newline at end of file
+}
+
+# Isotherm highlighting: off, everything above isotherm_min, or the band
+# between isotherm_min and isotherm_max
+ISOTHERM_MODES = ["off", "above", "within"]
+
+# How the palette range is chosen: per frame, fixed, expand/contract past a
+# hysteresis band, or slowly tracking the scene
+DISPLAY_RANGE_MODES = ["auto", "fixed", "hysteresis", "tracking"]
+
+# Where camera images are rendered: in Home Assistant's process, or in a
+# process pool shared by all thermal cameras
+RENDER_BACKENDS = ["inline", "process_pool"]
+
+# Color palettes compiled by palettes.py
+PALETTES = ["classic", "ironbow", "rainbow", "white_hot", "black_hot", "high_contrast"]
+
+# Clip export: output formats and the event fired while a clip is written
+CLIP_FORMATS = ["gif", "mjpeg"]
+EVENT_CLIP_PROGRESS = "thermal_camera_clip_progress"
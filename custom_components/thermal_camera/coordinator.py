@@ -1,7 +1,9 @@
 import asyncio
+import json
 import time
 import logging
 import aiohttp
+from collections import deque
 from datetime import timedelta
 # UpdateFailed lives in helpers.update_coordinator in current HA. Fall back
 # gracefully if imported location differs on older cores.
@@ -16,8 +18,16 @@ except Exception:  # pragma: no cover - compatibility shim
     class UpdateFailed(Exception):
         pass
 
+from .analysis import FrameAnalysis
+from .frame import ThermalFrame
+from .listeners import RateLimitedListener
+from .telemetry import IngestTelemetry
+
 _LOGGER = logging.getLogger(__name__)
 
+# Upper bound on retained frames, whatever the frame rate
+MAX_HISTORY_FRAMES = 3000
+
 
 class ThermalCameraDataCoordinator(DataUpdateCoordinator):
     """
@@ -29,7 +39,8 @@ class ThermalCameraDataCoordinator(DataUpdateCoordinator):
     that constructs this class with (hass, session, url, path, data_field,
     lowest_field, highest_field, average_field) continues to work. Additional
     optional kwargs: width, height, update_interval_ms, use_stream,
-    stream_push_ms (throttle push frequency when streaming; default ~66ms for ~15 FPS).
+    stream_push_ms (throttle push frequency when streaming; default ~66ms for ~15 FPS),
+    history_seconds (how long accepted frames are retained for clip export; 0 disables).
     """
 
     def __init__(
@@ -49,6 +60,7 @@ class ThermalCameraDataCoordinator(DataUpdateCoordinator):
         use_stream: bool = None,
         stream_push_ms: int = 200,
         read_timeout_s: float = 10.0,
+        history_seconds: float = 0.0,
     ):
         super().__init__(
             hass,
@@ -89,12 +101,27 @@ class ThermalCameraDataCoordinator(DataUpdateCoordinator):
                 pass
 
         self._last_data = {
-            "frame_data": [],
+            "frame": None,
             "min_value": 0.0,
             "max_value": 0.0,
             "avg_value": 0.0,
+            "analysis": None,
         }
 
+        # Incremented for every accepted frame; identifies the shared analysis.
+        # The epoch tells versions from different runs apart (e.g. in ETags).
+        self.frame_version = 0
+        self.frame_epoch = format(time.time_ns(), "x")
+        # Set (and replaced) on every accepted frame to wake long-polling readers
+        self._frame_event = asyncio.Event()
+
+        # Ingest counters and timings, exposed by diagnostic sensors and diagnostics
+        self.telemetry = IngestTelemetry()
+
+        # Recent frames as (monotonic time, ThermalFrame, min, max, avg), oldest first
+        self.history_seconds = float(history_seconds)
+        self.history = deque(maxlen=MAX_HISTORY_FRAMES)
+
         # background stream reader (only created in stream mode)
         self._reader_task = None
         if self.use_stream:
@@ -107,14 +134,22 @@ class ThermalCameraDataCoordinator(DataUpdateCoordinator):
         data.
         """
         if not self.use_stream:
+            telemetry = self.telemetry
             try:
                 _LOGGER.debug("Polling JSON endpoint %s/%s", self.url, self.path)
+                request_start = time.monotonic()
                 async with asyncio.timeout(1.5):
                     async with self.session.get(f"{self.url}/{self.path}", headers={"Connection": "close"}) as resp:
                         if resp.status != 200:
                             _LOGGER.warning("Failed to fetch JSON: %s", resp.status)
+                            telemetry.record_request_error()
+                            telemetry.record_disconnected()
                             return self._last_data
-                        data = await resp.json()
+                        body = await resp.read()
+                        telemetry.record_request(time.monotonic() - request_start)
+                        telemetry.record_connected()
+                        telemetry.record_frame(len(body))
+                        data = json.loads(body)
                         frame_data = data.get(self.data_field, []) if self.data_field else data
                         # If the response lacked frame data, keep the last known frame to
                         # avoid spamming downstream components with empty frames.
@@ -122,17 +157,25 @@ class ThermalCameraDataCoordinator(DataUpdateCoordinator):
                             _LOGGER.debug(
                                 "JSON response missing/empty frame data; keeping last known frame"
                             )
-                            frame_data = self._last_data.get("frame_data", [])
-
-                        min_v = data.get(self.lowest_field, 0.0) if self.lowest_field else 0.0
-                        max_v = data.get(self.highest_field, 0.0) if self.highest_field else 0.0
-                        avg_v = data.get(self.average_field, 0.0) if self.average_field else 0.0
-                        self._last_data = {
-                            "frame_data": frame_data,
-                            "min_value": min_v,
-                            "max_value": max_v,
-                            "avg_value": avg_v,
-                        }
+                            telemetry.record_dropped()
+                            return self._last_data
+
+                        try:
+                            frame = ThermalFrame.from_values(frame_data, self.height, self.width)
+                        except (TypeError, ValueError):
+                            _LOGGER.warning("JSON frame data is not numeric; keeping last known frame")
+                            telemetry.record_dropped()
+                            return self._last_data
+                        telemetry.record_parsed()
+
+                        # Statistics the device does not report are computed from the pixels
+                        if isinstance(data, dict) and self.lowest_field and self.highest_field and self.average_field:
+                            min_v = data.get(self.lowest_field, 0.0)
+                            max_v = data.get(self.highest_field, 0.0)
+                            avg_v = data.get(self.average_field, 0.0)
+                            self._accept_frame(frame, min_v, max_v, avg_v)
+                        else:
+                            self._accept_frame(frame)
                         # set updated data and notify listeners
                         try:
                             self.async_set_updated_data(self._last_data)
@@ -142,6 +185,12 @@ class ThermalCameraDataCoordinator(DataUpdateCoordinator):
                         return self._last_data
             except (aiohttp.ClientError, asyncio.TimeoutError) as e:
                 _LOGGER.warning("Network error polling JSON: %s", e)
+                telemetry.record_request_error()
+                telemetry.record_disconnected()
+                return self._last_data
+            except ValueError as e:
+                _LOGGER.warning("Invalid JSON from device: %s", e)
+                telemetry.record_dropped()
                 return self._last_data
             except Exception as e:
                 _LOGGER.exception("Unexpected error polling JSON: %s", e)
@@ -160,22 +209,31 @@ class ThermalCameraDataCoordinator(DataUpdateCoordinator):
         """
         connect_url = f"{self.url}/{self.path}"
         backoff = 1.0
+        telemetry = self.telemetry
+        first_connect = True
         while True:
+            if not first_connect:
+                telemetry.record_reconnect()
+            first_connect = False
             try:
                 _LOGGER.debug("Connecting to binary stream at %s", connect_url)
                 timeout = aiohttp.ClientTimeout(total=None)
                 headers = {"Connection": "keep-alive"}
+                request_start = time.monotonic()
                 async with self.session.get(connect_url, timeout=timeout, headers=headers) as resp:
                     if resp.status != 200:
                         _LOGGER.warning("Stream endpoint returned %s, retrying", resp.status)
+                        telemetry.record_request_error()
+                        telemetry.record_disconnected()
                         await asyncio.sleep(backoff)
                         backoff = min(backoff * 2, 10.0)
                         continue
 
                     _LOGGER.debug("Connected to stream, reading frames")
+                    telemetry.record_request(time.monotonic() - request_start)
+                    telemetry.record_connected()
                     backoff = 1.0
                     last_push_ts = 0.0  # monotonic seconds
-                    pending_payload: bytes | None = None
 
                     while True:
                         # Per-read timeout to detect stalled connections and trigger reconnect
@@ -192,50 +250,28 @@ class ThermalCameraDataCoordinator(DataUpdateCoordinator):
                         payload = await asyncio.wait_for(
                             resp.content.readexactly(length), timeout=self.read_timeout_s
                         )
-
-                        # Coalesce frames: avoid parsing for frames we won't push
                         now_ts = time.monotonic()
+                        telemetry.record_frame(length + 4, now_ts)
+
+                        # Coalesce frames: don't parse frames we won't push. The
+                        # next frame after the push interval is the newest one.
                         if (now_ts - last_push_ts) * 1000.0 < self.stream_push_ms:
-                            # keep only the latest payload
-                            pending_payload = payload
+                            telemetry.record_coalesced()
                             continue
 
-                        # Use the latest payload (current or pending) for parsing
-                        if pending_payload is not None:
-                            payload_to_parse = pending_payload
-                            pending_payload = None
-                        else:
-                            payload_to_parse = payload
-
-                        values = self._parse_payload(payload_to_parse)
+                        frame = ThermalFrame.from_payload(payload, self.height, self.width)
 
-                        # If the parsed payload is an empty list, skip updating the
+                        # If the payload is empty or unparseable, skip updating the
                         # last-known frame. Empty frames are noisy for consumers;
                         # prefer keeping the previous frame until valid data arrives.
-                        if isinstance(values, list) and not values:
+                        if frame is None:
                             _LOGGER.debug("Received empty frame from stream; keeping last known frame")
+                            telemetry.record_dropped()
                             continue
 
-                        # compute stats if numeric
-                        min_v = max_v = avg_v = None
-                        if isinstance(values, list) and values:
-                            try:
-                                numeric = [float(x) for x in values]
-                                min_v = round(min(numeric), 1)
-                                max_v = round(max(numeric), 1)
-                                avg_v = round(sum(numeric) / len(numeric), 1)
-                            except Exception:
-                                numeric = None
-
-                        # Keep a flat 1D list to reduce object churn; consumers can reshape if needed
-                        frame_data = values
-
-                        self._last_data = {
-                            "frame_data": frame_data,
-                            "min_value": (min_v if min_v is not None else self._last_data.get("min_value", 0.0)),
-                            "max_value": (max_v if max_v is not None else self._last_data.get("max_value", 0.0)),
-                            "avg_value": (avg_v if avg_v is not None else self._last_data.get("avg_value", 0.0)),
-                        }
+                        # Statistics are computed from the pixels by the analysis
+                        telemetry.record_parsed()
+                        self._accept_frame(frame)
 
                         # Throttle updates to Home Assistant to reduce load
                         if (now_ts - last_push_ts) * 1000.0 >= self.stream_push_ms:
@@ -246,57 +282,91 @@ class ThermalCameraDataCoordinator(DataUpdateCoordinator):
                                 _LOGGER.exception("Failed to set updated data: %s", e)
                             # Yield to event loop to avoid starving HA
                             await asyncio.sleep(0)
+                # The server closed the stream or sent an invalid frame length
+                telemetry.record_disconnected()
 
             except asyncio.CancelledError:
                 _LOGGER.debug("Stream reader cancelled")
                 break
             except (aiohttp.ClientError, asyncio.TimeoutError) as exc:
                 _LOGGER.warning("Stream connection error: %s — reconnecting in %.1fs", exc, backoff)
+                telemetry.record_disconnected()
                 await asyncio.sleep(backoff)
                 backoff = min(backoff * 2, 10.0)
                 continue
             except Exception as exc:
                 _LOGGER.exception("Unexpected stream reader error: %s — reconnecting in %.1fs", exc, backoff)
+                telemetry.record_disconnected()
                 await asyncio.sleep(backoff)
                 backoff = min(backoff * 2, 10.0)
                 continue
 
-    def _parse_payload(self, payload: bytes):
-        # try JSON
-        try:
-            text = payload.decode("utf-8")
-            data = __import__("json").loads(text)
-            if isinstance(data, list):
-                return data
-        except Exception:
-            pass
-
-        # float32 big-endian
-        if len(payload) % 4 == 0:
-            try:
-                import struct
+    def _accept_frame(self, frame, min_v=None, max_v=None, avg_v=None):
+        """Store a new ThermalFrame together with its shared, lazily evaluated analysis.
 
-                cnt = len(payload) // 4
-                fmt = ">" + ("f" * cnt)
-                return list(struct.unpack(fmt, payload))
-            except Exception:
-                pass
+        Without reported statistics (stream mode) they are computed from the
+        pixels, falling back to the previous values if the frame has the wrong shape.
+        """
+        self.frame_version += 1
+        analysis = FrameAnalysis(self.frame_version, frame, self.height, self.width, min_v, max_v, avg_v)
+        if min_v is None:
+            stats = analysis.stats
+            if stats is None:
+                stats = (self._last_data.get(key, 0.0) for key in ("min_value", "max_value", "avg_value"))
+            else:
+                stats = (round(value, 1) for value in stats)
+            min_v, max_v, avg_v = stats
+            analysis.min_value, analysis.max_value, analysis.avg_value = min_v, max_v, avg_v
+        self._last_data = {
+            "frame": frame,
+            "min_value": min_v,
+            "max_value": max_v,
+            "avg_value": avg_v,
+            "analysis": analysis,
+        }
+        if self.history_seconds > 0:
+            now = time.monotonic()
+            self.history.append((now, frame, min_v, max_v, avg_v))
+            while now - self.history[0][0] > self.history_seconds:
+                self.history.popleft()
+        self._frame_event.set()
+        self._frame_event = asyncio.Event()
+
+    def async_add_rate_limited_listener(self, update_callback, max_rate_hz=None, significant=None):
+        """Listen for frames at most max_rate_hz times per second and/or only when significant(analysis).
+
+        All consumers share the one ingest stream; slow consumers (sensors)
+        no longer wake up for every frame a fast one (the camera) needs.
+        Returns a callable that removes the listener.
+        """
+        listener = RateLimitedListener(self, update_callback, max_rate_hz, significant)
+        remove_listener = self.async_add_listener(listener.async_handle_update)
 
-        # uint16 big-endian
-        if len(payload) % 2 == 0:
-            try:
-                import struct
-
-                cnt = len(payload) // 2
-                fmt = ">" + ("H" * cnt)
-                raw_vals = list(struct.unpack(fmt, payload))
-                # convert raw uint16 -> Celsius using device formula: (v/128.0)-64.0
-                vals = [((v / 128.0) - 64.0) for v in raw_vals]
-                return vals
-            except Exception:
-                pass
+        def remove():
+            remove_listener()
+            listener.async_cancel()
 
-        return payload
+        return remove
+
+    def recent_frames(self, seconds):
+        """Return the retained (monotonic time, frame, min, max, avg) entries of the last `seconds`."""
+        cutoff = time.monotonic() - seconds
+        return [entry for entry in self.history if entry[0] >= cutoff]
+
+    async def async_wait_for_frame(self, after_version, timeout):
+        """Wait until a frame newer than after_version is accepted; return False on timeout."""
+        if self.frame_version > after_version:
+            return True
+        try:
+            await asyncio.wait_for(self._frame_event.wait(), timeout)
+        except asyncio.TimeoutError:
+            return False
+        return self.frame_version > after_version
+
+    @property
+    def analysis(self):
+        """Return the FrameAnalysis of the latest accepted frame, or None before the first frame."""
+        return self._last_data.get("analysis")
 
     async def async_will_remove(self):
         if self._reader_task:
@@ -0,0 +1,34 @@
+from homeassistant.components.diagnostics import async_redact_data
+
+from .constants import DOMAIN
+
+# The device address is private to the user's network
+TO_REDACT = {"url"}
+
+async def async_get_config_entry_diagnostics(hass, config_entry):
+    """Return the configuration, setup time and ingest telemetry of a config entry."""
+    data = hass.data[DOMAIN][config_entry.entry_id]
+    coordinator = data["coordinator"]
+    analysis = coordinator.analysis
+    return {
+        "config": async_redact_data(dict(config_entry.data), TO_REDACT),
+        "setup_ms": data.get("setup_ms"),
+        "coordinator": {
+            "use_stream": coordinator.use_stream,
+            "stream_push_ms": coordinator.stream_push_ms,
+            "update_interval_ms": (
+                coordinator.update_interval.total_seconds() * 1000.0 if coordinator.update_interval else None
+            ),
+            "frame_version": coordinator.frame_version,
+            "history_frames": len(coordinator.history),
+            "history_bytes": sum(entry[1].nbytes for entry in coordinator.history),
+        },
+        "telemetry": coordinator.telemetry.snapshot(),
+        "last_frame": None if analysis is None else {
+            "shape": list(analysis.frame.shape) if analysis.frame is not None else None,
+            "dtype": str(analysis.frame.raw.dtype) if analysis.frame is not None else None,
+            "min_value": analysis.min_value,
+            "max_value": analysis.max_value,
+            "avg_value": analysis.avg_value,
+        },
+    }
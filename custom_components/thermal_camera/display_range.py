@@ -0,0 +1,68 @@
+import logging
+import math
+
+_LOGGER = logging.getLogger(__name__)
+
+# Display range bounds are snapped to this step so a stable scene maps to the
+# same range frame after frame, letting rendered layers be reused
+RANGE_QUANTUM = 0.5
+
+# Fraction of the gap closed per frame in "tracking" mode
+TRACKING_RATE = 0.1
+
+class DisplayRange:
+    """Decide the temperature range the palette is stretched over.
+
+    Modes:
+      auto       - each frame's own min/max (original behavior)
+      fixed      - always fixed_min..fixed_max
+      hysteresis - expand as soon as a frame leaves the range, contract only
+                   once the frame is more than two bands inside it
+      tracking   - ease towards each frame's min/max
+    """
+
+    def __init__(self, mode="auto", fixed_min=0.0, fixed_max=0.0, hysteresis=1.0):
+        self.mode = mode
+        self.fixed_min = float(fixed_min)
+        self.fixed_max = float(fixed_max)
+        if mode == "fixed" and self.fixed_min >= self.fixed_max:
+            # Entries saved before the config flow checked this
+            _LOGGER.warning(
+                "Fixed display range %s..%s is empty; using each frame's own range instead",
+                self.fixed_min, self.fixed_max,
+            )
+            self.mode = "auto"
+        self.hysteresis = max(float(hysteresis), RANGE_QUANTUM)
+        self._low = None
+        self._high = None
+
+    def update(self, min_value, max_value):
+        """Feed a frame's min/max and return the (low, high) display range."""
+        if self.mode == "auto":
+            return min_value, max_value
+        if self.mode == "fixed":
+            return self.fixed_min, self.fixed_max
+
+        if self._low is None:
+            self._low = min_value - self.hysteresis
+            self._high = max_value + self.hysteresis
+        elif self.mode == "hysteresis":
+            band = self.hysteresis
+            if min_value < self._low or min_value > self._low + 2 * band:
+                self._low = min_value - band
+            if max_value > self._high or max_value < self._high - 2 * band:
+                self._high = max_value + band
+        else:
+            self._low += (min_value - self._low) * TRACKING_RATE
+            self._high += (max_value - self._high) * TRACKING_RATE
+
+        low = math.floor(self._low / RANGE_QUANTUM) * RANGE_QUANTUM
+        high = math.ceil(self._high / RANGE_QUANTUM) * RANGE_QUANTUM
+        if high <= low:
+            high = low + RANGE_QUANTUM
+        return low, high
+
+    def reset(self):
+        """Forget the tracked range; the next frame starts a new one."""
+        self._low = None
+        self._high = None
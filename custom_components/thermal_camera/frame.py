@@ -0,0 +1,117 @@
+import json
+
+class ThermalFrame:
+    """One sensor frame stored as a compact, contiguous numpy buffer.
+
+    Temperatures are kept as `raw * scale + offset` °C. Frames that fit are
+    stored as int16 centi-degrees (2 bytes per pixel); raw device counts keep
+    their own uint16 scale and anything else is float32 (4 bytes per pixel).
+    A list of Python floats costs ~32 bytes per pixel, so frames are only
+    converted to °C arrays or lists at the edges (rendering, export).
+
+    The buffer has shape (rows, cols) when the pixel count matches the
+    configured resolution and is flat otherwise. Treat frames as immutable.
+    numpy is imported on first use, like in FrameAnalysis.
+    """
+
+    __slots__ = ("raw", "scale", "offset")
+
+    # int16 centi-degrees cover -327.68 .. 327.67 °C
+    CENTI_SCALE = 0.01
+
+    def __init__(self, raw, scale=1.0, offset=0.0):
+        raw.setflags(write=False)
+        self.raw = raw
+        self.scale = scale
+        self.offset = offset
+
+    @classmethod
+    def from_values(cls, values, rows, cols):
+        """Build a frame from a sequence of °C values (e.g. a JSON list)."""
+        import numpy as np
+
+        celsius = np.asarray(values, dtype=np.float32)
+        if celsius.ndim != 1:
+            celsius = celsius.ravel()
+        return cls.from_celsius(_shaped(celsius, rows, cols))
+
+    @classmethod
+    def from_celsius(cls, celsius):
+        """Store a float °C array as int16 centi-degrees when lossless enough, else as float32."""
+        import numpy as np
+
+        if celsius.size and np.isfinite(celsius).all():
+            centi = np.round(celsius / cls.CENTI_SCALE)
+            if centi.min() >= -32768 and centi.max() <= 32767:
+                return cls(centi.astype(np.int16), cls.CENTI_SCALE)
+        return cls(np.ascontiguousarray(celsius, dtype=np.float32))
+
+    @classmethod
+    def from_payload(cls, payload, rows, cols):
+        """Parse a binary stream payload: JSON list, big-endian float32, or uint16 device counts.
+
+        Returns None if the payload is none of those.
+        """
+        import numpy as np
+
+        try:
+            data = json.loads(payload.decode("utf-8"))
+        except ValueError:
+            data = None
+        if isinstance(data, list):
+            try:
+                return cls.from_values(data, rows, cols) if data else None
+            except (TypeError, ValueError):
+                return None
+
+        # float32 big-endian
+        if len(payload) % 4 == 0 and len(payload) // 4 == rows * cols:
+            return cls.from_celsius(_shaped(np.frombuffer(payload, dtype=">f4"), rows, cols))
+
+        # uint16 big-endian counts; the device formula is (v / 128.0) - 64.0
+        if len(payload) % 2 == 0:
+            counts = np.frombuffer(payload, dtype=">u2").astype(np.uint16)
+            return cls(_shaped(counts, rows, cols), 1.0 / 128.0, -64.0)
+        return None
+
+    @property
+    def shape(self):
+        return self.raw.shape
+
+    @property
+    def size(self):
+        return self.raw.size
+
+    @property
+    def nbytes(self):
+        """Bytes used by the pixel buffer."""
+        return self.raw.nbytes
+
+    def __len__(self):
+        return self.raw.size
+
+    def celsius(self):
+        """Return the frame as a new float32 °C array."""
+        import numpy as np
+
+        if self.raw.dtype == np.float32 and self.scale == 1.0 and self.offset == 0.0:
+            return self.raw.copy()
+        celsius = self.raw.astype(np.float32)
+        celsius *= np.float32(self.scale)
+        if self.offset:
+            celsius += np.float32(self.offset)
+        return celsius
+
+    def centi_degrees(self):
+        """Return the frame as int16 centi-degrees (no copy when stored that way)."""
+        import numpy as np
+
+        if self.raw.dtype == np.int16 and self.scale == self.CENTI_SCALE and self.offset == 0.0:
+            return self.raw
+        return np.round(self.celsius() / self.CENTI_SCALE).clip(-32768, 32767).astype(np.int16)
+
+def _shaped(array, rows, cols):
+    """Reshape a flat array to (rows, cols) if the pixel count matches."""
+    if array.size == rows * cols:
+        return array.reshape(rows, cols)
+    return array
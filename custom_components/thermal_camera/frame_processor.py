@@ -1,66 +1,249 @@
 import numpy as np
+from functools import lru_cache
 from PIL import Image, ImageDraw, ImageFont
 from io import BytesIO
-
-def process_frame(frame_data, min_value, max_value, avg_value, rows, cols, resample_method, font, desired_height):
-    """Convert frame data to an image with overlays, ensuring distinct colors per pixel."""
-    # Prepare an empty RGB array for storing colors
-    rgb_array = np.zeros((rows, cols, 3), dtype=np.uint8)
-
-    # Apply colors to each pixel in the RGB array
-    for r in range(rows):
-        for c in range(cols):
-            rgb_array[r, c] = map_to_color(frame_data[r, c], min_value, max_value)
-
-    # Create a PIL image from the RGB array
+from .palettes import palette_lut
+from .renderer import FONT_SIZE, OVERLAY_REFERENCE_HEIGHT
+
+# Kernels used to interpolate the temperature field for each configured
+# resample method. LANCZOS shares the bicubic kernel; at the scale factors
+# used here the two are visually indistinguishable.
+INTERPOLATION_KERNELS = {
+    "NEAREST": "nearest",
+    "BILINEAR": "bilinear",
+    "BICUBIC": "bicubic",
+    "LANCZOS": "bicubic",
+}
+
+# Isotherm highlight color (magenta is not part of the palette) and blend weight
+ISOTHERM_COLOR = np.array([255, 0, 255], dtype=np.float32)
+ISOTHERM_OPACITY = 0.6
+CONTOUR_COLOR = (255, 255, 255)
+MAX_CONTOUR_LEVELS = 32
+# Grids whose cells come out smaller than this are block-averaged before
+# contouring; on dense sensors, contours of single noisy pixels are
+# unreadable and cost tens of thousands of segments per frame
+MIN_CONTOUR_CELL_PX = 8
+
+# Text and scale bar decoration, in pixels at OVERLAY_REFERENCE_HEIGHT (text
+# sizes at FONT_SIZE); other output sizes scale them proportionally
+TEXT_BORDER = 2  # Border thickness around text
+SHADOW_OFFSET = 5  # Offset for drop shadows
+SHADOW_COLOR = (0, 0, 0, 100)  # Semi-transparent black
+SCALE_BAR_LABEL_OFFSET = 95  # Labels sit this far left of the scale bar
+SCALE_BAR_WIDTH = 10
+SCALE_BAR_MARGIN = 10
+RETICLE_RADIUS = 9
+TEXT_WIDTH = 120  # Room kept for the hotspot temperature at the right edge
+TEXT_HEIGHT = 50
+
+def process_frame(frame_data, min_value, max_value, avg_value, rows, cols, resample_method, font, desired_height,
+                  *, palette="classic", isotherm=None, contour_step=None, hotspot=None):
+    """Convert frame data to an image with overlays, ensuring distinct colors per pixel.
+
+    `palette` names one of the palettes in palettes.py.
+    `isotherm` is an optional (low, high) band to highlight; `high` may be None
+    to highlight everything above `low`. `contour_step` draws contour lines at
+    multiples of that temperature step.
+    `hotspot` is an optional precomputed (row, col, value) of the hottest pixel.
+    """
+    # Interpolate the temperatures straight to the output size, then map the
+    # result through the palette once. Colors are never interpolated, so every
+    # output pixel stays on the palette.
+    out_height = desired_height
+    out_width = int(desired_height * cols / rows)
+    field = upscale_temperature(frame_data, out_height, out_width, resample_method)
+    rgb_array = colorize(field, min_value, max_value, palette)
+    if isotherm is not None:
+        apply_isotherm(rgb_array, field, *isotherm)
+    scale_factor = out_height / rows
+    if contour_step:
+        levels = contour_levels(min_value, max_value, contour_step)
+        rasterize_contours(rgb_array, output_contours(frame_data, levels, scale_factor), scale_factor)
     img = Image.fromarray(rgb_array, "RGB")
 
-    # Scale the image with the specified resampling method
-    scale_factor = 20
-    img = img.resize((cols * scale_factor, rows * scale_factor), resample=resample_method)
-
-    # Draw overlay elements (e.g., reticle, scale bar) on the upscaled image
-    draw_overlay(img, frame_data, min_value, max_value, avg_value, scale_factor, font)
-
-    # Resize to desired height if needed, using the specified resample method
-    if img.height != desired_height:
-        aspect_ratio = img.width / img.height
-        img = img.resize((int(desired_height * aspect_ratio), desired_height), resample=resample_method)
+    # Draw overlay elements (e.g., reticle, scale bar) at the output resolution
+    draw_overlay(img, frame_data, min_value, max_value, avg_value, scale_factor, font,
+                 hotspot=hotspot, palette=palette)
 
     return image_to_jpeg_bytes(img)
 
-def map_to_color(value, min_value, max_value):
-    """Map thermal value to a color gradient."""
-    # Avoid division by zero by setting a default normalized value if min_value == max_value
+def render_images(frames, min_value, max_value, avg_values, rows, cols, resample_method, font, desired_height,
+                  *, palette="classic", isotherm=None, contour_step=None):
+    """Render a stack of frames that share one display range into PIL images with overlays.
+
+    Upscaling and colorization run once over the whole (n, rows, cols) stack;
+    only the overlays are drawn per frame. Used for clips, where a common range
+    also keeps the colors stable from frame to frame.
+    """
+    frames = np.asarray(frames, dtype=np.float32)
+    out_height = desired_height
+    out_width = int(desired_height * cols / rows)
+    fields = upscale_temperature(frames, out_height, out_width, resample_method)
+    rgb_arrays = colorize(fields, min_value, max_value, palette)
+    levels = contour_levels(min_value, max_value, contour_step) if contour_step else ()
+
+    images = []
+    scale_factor = out_height / rows
+    for frame, field, rgb_array, avg_value in zip(frames, fields, rgb_arrays, avg_values):
+        if isotherm is not None:
+            apply_isotherm(rgb_array, field, *isotherm)
+        if levels:
+            rasterize_contours(rgb_array, output_contours(frame, levels, scale_factor), scale_factor)
+        img = Image.fromarray(rgb_array, "RGB")
+        draw_overlay(img, frame, min_value, max_value, avg_value, scale_factor, font, palette=palette)
+        images.append(img)
+    return images
+
+def upscale_temperature(frame_data, out_height, out_width, resample_method="NEAREST"):
+    """Resample a 2D temperature array, or a stack of them, to (out_height, out_width)."""
+    kernel = INTERPOLATION_KERNELS.get(resample_method, "nearest")
+    frame = np.asarray(frame_data, dtype=np.float32)
+    rows, cols = frame.shape[-2:]
+
+    if kernel == "nearest":
+        return frame[..., nearest_indices(rows, out_height)[:, None], nearest_indices(cols, out_width)]
+
+    # Separable resampling: one small matrix product per axis
+    weights_y = interpolation_weights(rows, out_height, kernel)
+    weights_x = interpolation_weights(cols, out_width, kernel)
+    return weights_y @ frame @ weights_x.T
+
+@lru_cache(maxsize=16)
+def nearest_indices(size_in, size_out):
+    """Return the source index sampled by each output pixel along one axis."""
+    indices = np.floor((np.arange(size_out) + 0.5) * (size_in / size_out)).astype(np.intp)
+    indices = np.minimum(indices, size_in - 1)
+    indices.setflags(write=False)
+    return indices
+
+@lru_cache(maxsize=16)
+def interpolation_weights(size_in, size_out, kernel):
+    """Return a (size_out, size_in) matrix that resamples one axis with the given kernel."""
+    # Pixel-centre alignment, matching PIL's resize
+    position = (np.arange(size_out) + 0.5) * (size_in / size_out) - 0.5
+    base = np.floor(position)
+    offset = position - base
+
+    if kernel == "bilinear":
+        taps = np.arange(0, 2)
+        distance = np.abs(offset[:, None] - taps[None, :])
+        tap_weights = np.maximum(0.0, 1.0 - distance)
+    else:
+        # Keys cubic convolution kernel with a = -0.5
+        a = -0.5
+        taps = np.arange(-1, 3)
+        distance = np.abs(offset[:, None] - taps[None, :])
+        near = distance <= 1.0
+        tap_weights = np.where(
+            near,
+            (a + 2) * distance ** 3 - (a + 3) * distance ** 2 + 1,
+            a * distance ** 3 - 5 * a * distance ** 2 + 8 * a * distance - 4 * a,
+        )
+        tap_weights[distance >= 2.0] = 0.0
+
+    # Clamp taps to the edge; taps landing on the same source pixel accumulate
+    source = np.clip(base[:, None].astype(np.intp) + taps[None, :], 0, size_in - 1)
+    weights = np.zeros((size_out, size_in), dtype=np.float32)
+    np.add.at(weights, (np.repeat(np.arange(size_out), len(taps)), source.ravel()), tap_weights.ravel())
+    weights.setflags(write=False)
+    return weights
+
+def colorize(field, min_value, max_value, palette="classic"):
+    """Map a temperature array to an RGB array through the palette lookup table."""
     if min_value == max_value:
-        return (255, 255, 255)  # White color or any default color choice
-
-    # Normalize the value between 0 and 1
-    normalized = max(0.0, min(1.0, (value - min_value) / (max_value - min_value)))
-
-    # Gradient interpolation: Black-Blue-Green-Yellow-Red-White
-    if normalized < 0.2:  # Black to Blue
-        red = 0
-        green = 0
-        blue = int(255 * (normalized / 0.2))
-    elif normalized < 0.4:  # Blue to Green
-        red = 0
-        green = int(255 * ((normalized - 0.2) / 0.2))
-        blue = 255 - green
-    elif normalized < 0.6:  # Green to Yellow
-        red = int(255 * ((normalized - 0.4) / 0.2))
-        green = 255
-        blue = 0
-    elif normalized < 0.8:  # Yellow to Red
-        red = 255
-        green = int(255 * (1 - (normalized - 0.6) / 0.2))
-        blue = 0
-    else:  # Red to White
-        red = 255
-        green = int(255 * ((normalized - 0.8) / 0.2))
-        blue = green
-
-    return (red, green, blue)
+        return np.full(field.shape + (3,), 255, dtype=np.uint8)
+
+    scale = 255.0 / (max_value - min_value)
+    index = np.clip((field - min_value) * scale + 0.5, 0, 255).astype(np.uint8)
+    return palette_lut(palette)[index]
+
+def apply_isotherm(rgb_array, field, low, high=None):
+    """Blend the isotherm color into pixels at or above `low` (and at or below `high`)."""
+    mask = field >= low
+    if high is not None:
+        mask &= field <= high
+    if mask.any():
+        blended = rgb_array[mask] * (1.0 - ISOTHERM_OPACITY) + ISOTHERM_COLOR * ISOTHERM_OPACITY
+        rgb_array[mask] = blended.astype(np.uint8)
+    return rgb_array
+
+def contour_levels(min_value, max_value, step):
+    """Return the contour temperatures (multiples of step) inside the display range.
+
+    A range that would need more than MAX_CONTOUR_LEVELS lines uses a
+    multiple of step instead, so the lines still span the whole range.
+    """
+    if step <= 0 or max_value <= min_value:
+        return ()
+    count = np.floor(max_value / step) - np.ceil(min_value / step) + 1
+    if count > MAX_CONTOUR_LEVELS:
+        step *= int(np.ceil(count / MAX_CONTOUR_LEVELS))
+    first = np.ceil(min_value / step)
+    last = np.floor(max_value / step)
+    return tuple(float((first + i) * step) for i in range(int(max(last - first + 1, 0))))
+
+# Marching-squares edge pairs per cell case. Corner bits: top-left 8,
+# top-right 4, bottom-right 2, bottom-left 1. Edges: 0 top, 1 right,
+# 2 bottom, 3 left. Cases 16 and 17 are the saddles 5 and 10 with the cell
+# centre above the level, which joins the two "above" corners.
+_SEGMENT_TABLE = np.full((18, 2, 2), -1, dtype=np.intp)
+for _case, _pairs in {
+    1: [(3, 2)], 2: [(2, 1)], 3: [(3, 1)], 4: [(0, 1)],
+    5: [(0, 1), (3, 2)], 6: [(0, 2)], 7: [(0, 3)], 8: [(0, 3)],
+    9: [(0, 2)], 10: [(0, 3), (2, 1)], 11: [(0, 1)], 12: [(3, 1)],
+    13: [(1, 2)], 14: [(3, 2)], 16: [(0, 3), (2, 1)], 17: [(0, 1), (3, 2)],
+}.items():
+    for _slot, _pair in enumerate(_pairs):
+        _SEGMENT_TABLE[_case, _slot] = _pair
+
+def contour_segments(frame_data, levels):
+    """Return contour line segments as an (N, 2, 2) array of (row, col) grid points."""
+    frame = np.asarray(frame_data, dtype=np.float32)
+    tl, tr = frame[:-1, :-1], frame[:-1, 1:]
+    bl, br = frame[1:, :-1], frame[1:, 1:]
+    cell_rows, cell_cols = np.indices(tl.shape, dtype=np.float32)
+    center = (tl + tr + bl + br) * 0.25
+    segments = []
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        for level in levels:
+            case = (
+                (tl >= level) * 8 + (tr >= level) * 4 + (br >= level) * 2 + (bl >= level) * 1
+            ).astype(np.intp)
+            case[(case == 5) & (center >= level)] = 16
+            case[(case == 10) & (center >= level)] = 17
+
+            # Crossing point on each of the four edges, (row, col) per cell
+            edges = np.stack([
+                np.stack([cell_rows, cell_cols + (level - tl) / (tr - tl)], axis=-1),
+                np.stack([cell_rows + (level - tr) / (br - tr), cell_cols + 1], axis=-1),
+                np.stack([cell_rows + 1, cell_cols + (level - bl) / (br - bl)], axis=-1),
+                np.stack([cell_rows + (level - tl) / (bl - tl), cell_cols], axis=-1),
+            ])
+
+            pairs = _SEGMENT_TABLE[case]
+            for slot in range(2):
+                start, end = pairs[..., slot, 0], pairs[..., slot, 1]
+                r, c = np.nonzero(start >= 0)
+                if r.size:
+                    segments.append(np.stack([edges[start[r, c], r, c], edges[end[r, c], r, c]], axis=1))
+
+    if not segments:
+        return np.empty((0, 2, 2), dtype=np.float32)
+    return np.concatenate(segments)
+
+def output_contours(frame_data, levels, scale_factor):
+    """Return contour segments in grid coordinates, traced on a grid coarse enough to read at scale_factor."""
+    factor = int(np.ceil(MIN_CONTOUR_CELL_PX / scale_factor))
+    frame = np.asarray(frame_data, dtype=np.float32)
+    if factor <= 1 or min(frame.shape) < 2 * factor:
+        return contour_segments(frame, levels)
+
+    rows, cols = frame.shape[0] // factor, frame.shape[1] // factor
+    coarse = frame[:rows * factor, :cols * factor].reshape(rows, factor, cols, factor).mean(axis=(1, 3))
+    # Coarse cell (i, j) is centred on fine grid point ((i + 0.5) * factor - 0.5, ...)
+    return (contour_segments(coarse, levels) + 0.5) * factor - 0.5
 
 def image_to_jpeg_bytes(img):
     """Convert PIL image to JPEG bytes."""
@@ -68,125 +251,168 @@ def image_to_jpeg_bytes(img):
         img.save(output, format="JPEG")
         return output.getvalue()
 
-def draw_overlay(img, frame_data, min_value, max_value, avg_value, scale_factor, font):
-    """Draw reticle, scale bar, and temperature text on the image."""
+def overlay_size(value, height):
+    """Scale a layout size given at OVERLAY_REFERENCE_HEIGHT to an image `height` pixels tall."""
+    return max(1, round(value * height / OVERLAY_REFERENCE_HEIGHT))
+
+def draw_overlay(img, frame_data, min_value, max_value, avg_value, scale_factor, font, hotspot=None,
+                 palette="classic"):
+    """Draw the reticle, scale bar, and temperature text on the image."""
     draw = ImageDraw.Draw(img)
 
     # Locate the hottest pixel for the reticle
-    max_index = np.argmax(frame_data)
-    max_row, max_col = divmod(max_index, frame_data.shape[1])
+    if hotspot is None:
+        max_row, max_col = divmod(int(np.argmax(frame_data)), frame_data.shape[1])
+        hotspot = (max_row, max_col, frame_data[max_row, max_col])
+    max_row, max_col, max_temp = hotspot
     center_x = (max_col + 0.5) * scale_factor
     center_y = (max_row + 0.5) * scale_factor
-    reticle_radius = 9
+    reticle_radius = overlay_size(RETICLE_RADIUS, img.height)
+    ring_inset = overlay_size(2, img.height)
+    line_width = overlay_size(1, img.height)
 
     # Draw crosshairs and reticle on the hottest pixel
     draw.line(
         [(center_x, center_y - reticle_radius), (center_x, center_y + reticle_radius)],
         fill="red",
-        width=1
+        width=line_width
     )
     draw.line(
         [(center_x - reticle_radius, center_y), (center_x + reticle_radius, center_y)],
         fill="red",
-        width=1
+        width=line_width
     )
     draw.ellipse(
-        [(center_x - reticle_radius + 2, center_y - reticle_radius + 2),
-         (center_x + reticle_radius - 2, center_y + reticle_radius - 2)],
+        [(center_x - reticle_radius + ring_inset, center_y - reticle_radius + ring_inset),
+         (center_x + reticle_radius - ring_inset, center_y + reticle_radius - ring_inset)],
         outline="red",
-        width=1
+        width=line_width
     )
 
     # Draw the scale bar with shadows
-    bar_width = 10
-    bar_height = img.height - 20
-    bar_x = img.width - bar_width - 10
-    bar_y = 10
-    draw_scale_bar_with_shadow(img, bar_x, bar_y, bar_width, bar_height, min_value, max_value, avg_value, font)
+    margin = overlay_size(SCALE_BAR_MARGIN, img.height)
+    bar_width = overlay_size(SCALE_BAR_WIDTH, img.height)
+    bar_height = img.height - 2 * margin
+    bar_x = img.width - bar_width - margin
+    bar_y = margin
+    draw_scale_bar_with_shadow(img, bar_x, bar_y, bar_width, bar_height, min_value, max_value, avg_value, font, palette)
 
     # Draw the highest temperature text
-    text = f"{frame_data[max_row, max_col]:.1f}°"
+    text = f"{max_temp:.1f}°"
     if max_row >= (img.height // scale_factor) - 3:
         # If the reticle is in the bottom three rows, move the text above the reticle
-        text_y = max(center_y - 50, 0)
+        text_y = max(center_y - overlay_size(TEXT_HEIGHT, img.height), 0)
     else:
         # Otherwise, place the text below the reticle
         text_y = min(center_y + reticle_radius, img.height)
-    text_x = min(max(center_x, 0), img.width - 120)
+    text_x = min(max(center_x, 0), img.width - overlay_size(TEXT_WIDTH, img.height))
 
     # Draw the temperature text with shadow
     draw_text_with_shadow(img, text_x, text_y, text, font)
 
+def rasterize_contours(rgb_array, segments, scale_factor):
+    """Paint contour segments given in grid coordinates into the upscaled RGB array.
+
+    Every segment is sampled at more points than its longest one is pixels
+    long, so lines have no gaps; all segments are painted with one
+    fancy-indexing assignment instead of a draw call each, which keeps dense
+    contours of large grids cheap.
+    """
+    if not len(segments):
+        return rgb_array
+    height, width = rgb_array.shape[:2]
+    longest = float(np.max(np.abs(segments[:, 1, :] - segments[:, 0, :]).sum(axis=1))) * scale_factor
+    steps = np.linspace(0.0, 1.0, int(np.ceil(longest)) + 2, dtype=np.float32)
+    start, end = segments[:, 0, :], segments[:, 1, :]
+    # Grid samples sit at pixel centres, so shift by half a cell
+    points = (start[:, None, :] + (end - start)[:, None, :] * steps[None, :, None] + 0.5) * scale_factor
+    ys = np.clip(points[..., 0].astype(np.intp), 0, height - 1)
+    xs = np.clip(points[..., 1].astype(np.intp), 0, width - 1)
+    rgb_array[ys, xs] = CONTOUR_COLOR
+    return rgb_array
+
+def text_spacing(font):
+    """Return the (border, shadow offset) of bordered text for this font's size."""
+    scale = getattr(font, "size", FONT_SIZE) / FONT_SIZE
+    return max(1, round(TEXT_BORDER * scale)), max(1, round(SHADOW_OFFSET * scale))
+
 def draw_text_with_shadow(img, text_x, text_y, text, font):
     """Draw text with both a black border and a semi-transparent shadow."""
-    shadow_layer = Image.new("RGBA", img.size, (0, 0, 0, 0))  # Transparent RGBA layer
-    shadow_draw = ImageDraw.Draw(shadow_layer)
-
-    # Define shadow properties
-    shadow_offset = 5  # Offset for the shadow
-    shadow_color = (0, 0, 0, 100)  # Semi-transparent black
-
-    # Draw the semi-transparent shadow
-    shadow_draw.text(
-        (text_x + shadow_offset, text_y + shadow_offset),
-        text,
-        font=font,
-        fill=shadow_color
-    )
+    sprite = text_sprite(text, font)
+    border, _ = text_spacing(font)
+    dest = (int(text_x) - border, int(text_y) - border)
+    if img.mode == "RGBA":
+        img.alpha_composite(sprite, dest=(max(dest[0], 0), max(dest[1], 0)))
+    else:
+        img.paste(sprite, dest, sprite)
 
-    # Add the shadow layer to the main image
-    img_rgba = img.convert("RGBA")
-    combined = Image.alpha_composite(img_rgba, shadow_layer)
+@lru_cache(maxsize=512)
+def text_sprite(text, font):
+    """Render bordered, shadowed text once into a transparent RGBA sprite.
 
-    # Convert back to RGB (to remove the alpha channel)
-    img_rgb = combined.convert("RGB")
-    img.paste(img_rgb)
+    The text origin sits at (border, border) inside the sprite.
+    """
+    border, shadow = text_spacing(font)
+    _, _, right, bottom = font.getbbox(text)
+    size = (right + 2 * border + shadow + 1, bottom + 2 * border + shadow + 1)
+    sprite = Image.new("RGBA", size, (0, 0, 0, 0))
+    draw = ImageDraw.Draw(sprite)
 
-    # Reinitialize ImageDraw for drawing on the combined image
-    draw = ImageDraw.Draw(img)
+    # Draw the semi-transparent shadow
+    draw.text((border + shadow, border + shadow), text, font=font, fill=SHADOW_COLOR)
 
     # Draw the black border
-    border_offset = 2  # Border thickness
-    for dx in range(-border_offset, border_offset + 1):
-        for dy in range(-border_offset, border_offset + 1):
+    for dx in range(-border, border + 1):
+        for dy in range(-border, border + 1):
             if dx != 0 or dy != 0:
-                draw.text((text_x + dx, text_y + dy), text, fill="black", font=font)
+                draw.text((border + dx, border + dy), text, fill="black", font=font)
 
     # Draw the main text (white) in the center
-    draw.text((text_x, text_y), text, fill="white", font=font)
+    draw.text((border, border), text, fill="white", font=font)
+    return sprite
 
-def draw_scale_bar_with_shadow(img, bar_x, bar_y, bar_width, bar_height, min_value, max_value, avg_value, font):
+def draw_scale_bar_with_shadow(img, bar_x, bar_y, bar_width, bar_height, min_value, max_value, avg_value, font,
+                               palette="classic"):
     """Draw the scale bar with a shadow and gradient."""
-    shadow_layer = Image.new("RGBA", img.size, (0, 0, 0, 0))  # Transparent RGBA layer
-    shadow_draw = ImageDraw.Draw(shadow_layer)
-
-    shadow_offset = 5  # Offset for the shadow
-    shadow_color = (0, 0, 0, 100)  # Semi-transparent black
+    # The bar, its shadow and the min/max labels only depend on the display
+    # range and palette, so they are rendered once and reused across frames
+    label_offset = overlay_size(SCALE_BAR_LABEL_OFFSET, img.height)
+    border, _ = text_spacing(font)
+    layer_x = max(bar_x - label_offset - border, 0)
+    layer = scale_bar_layer(img.size, layer_x, bar_x, bar_y, bar_width, bar_height, min_value, max_value, font, palette)
+    img.paste(layer, (layer_x, 0), layer)
+
+    # The average label changes every frame
+    draw_text_with_shadow(img, bar_x - label_offset, (bar_y + bar_height) // 2, f"{avg_value:.1f}°", font)
+
+@lru_cache(maxsize=8)
+def scale_bar_layer(img_size, layer_x, bar_x, bar_y, bar_width, bar_height, min_value, max_value, font,
+                    palette="classic"):
+    """Render the scale bar, its shadow and min/max labels into an RGBA layer starting at layer_x."""
+    layer = Image.new("RGBA", (img_size[0] - layer_x, img_size[1]), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(layer)
+    x = bar_x - layer_x
+    shadow = overlay_size(SHADOW_OFFSET, img_size[1])
 
     # Draw the shadow for the scale bar
-    shadow_draw.rectangle(
-        [bar_x + shadow_offset, bar_y + shadow_offset, bar_x + bar_width + shadow_offset, bar_y + bar_height + shadow_offset],
-        fill=shadow_color
+    draw.rectangle(
+        [x + shadow, bar_y + shadow, x + bar_width + shadow, bar_y + bar_height + shadow],
+        fill=SHADOW_COLOR
     )
 
-    # Add the shadow layer to the main image
-    img_rgba = img.convert("RGBA")
-    combined = Image.alpha_composite(img_rgba, shadow_layer)
-
-    # Convert back to RGB (to remove the alpha channel)
-    img_rgb = combined.convert("RGB")
-    img.paste(img_rgb)
-
-    draw = ImageDraw.Draw(img)
-
     # Draw gradient on scale bar (from bottom to top, black to white)
-    for i in range(bar_height):
-        color_value = min_value + (max_value - min_value) * ((bar_height - i - 1) / bar_height)
-        color = map_to_color(color_value, min_value, max_value)
-        draw.line([(bar_x, bar_y + i), (bar_x + bar_width, bar_y + i)], fill=color)
-
-    # Draw min, max, and average values to the left of the scale bar
-    label_x = bar_x - 95
-    draw_text_with_shadow(img, label_x, bar_y, f"{max_value:.1f}°", font)
-    draw_text_with_shadow(img, label_x, bar_y + bar_height - 40, f"{min_value:.1f}°", font)
-    draw_text_with_shadow(img, label_x, (bar_y + bar_height) // 2, f"{avg_value:.1f}°", font)
+    if min_value == max_value:
+        colors = np.full((bar_height, 3), 255, dtype=np.uint8)
+    else:
+        normalized = (bar_height - np.arange(bar_height) - 1) / bar_height
+        colors = palette_lut(palette)[np.rint(normalized * 255).astype(np.uint8)]
+    gradient = np.empty((bar_height, bar_width + 1, 4), dtype=np.uint8)
+    gradient[..., :3] = colors[:, None, :]
+    gradient[..., 3] = 255
+    layer.paste(Image.fromarray(gradient, "RGBA"), (x, bar_y))
+
+    # Draw min and max values to the left of the scale bar
+    label_x = x - overlay_size(SCALE_BAR_LABEL_OFFSET, img_size[1])
+    draw_text_with_shadow(layer, label_x, bar_y, f"{max_value:.1f}°", font)
+    draw_text_with_shadow(layer, label_x, bar_y + bar_height - overlay_size(40, img_size[1]), f"{min_value:.1f}°", font)
+    return layer
@@ -0,0 +1,55 @@
+import time
+
+from homeassistant.core import callback
+from homeassistant.helpers.event import async_call_later
+
+class RateLimitedListener:
+    """Forward coordinator updates to one consumer at its own rate.
+
+    The consumer is called at most `max_rate_hz` times per second (None for
+    every frame); a frame arriving too soon is delivered once the interval
+    has passed, so the newest frame always lands. With `significant`, a
+    predicate taking the new FrameAnalysis, frames for which it returns False
+    are not delivered at all.
+    """
+
+    def __init__(self, coordinator, update_callback, max_rate_hz=None, significant=None):
+        self.coordinator = coordinator
+        self._update_callback = update_callback
+        self._significant = significant
+        self._min_interval = 1.0 / max_rate_hz if max_rate_hz else 0.0
+        self._last_delivery_ts = None
+        self._cancel_pending = None
+
+    @callback
+    def async_handle_update(self):
+        """Deliver the coordinator's newest frame if the consumer's rate and predicate allow it."""
+        analysis = self.coordinator.analysis
+        if analysis is None:
+            return
+        if self._significant is not None and not self._significant(analysis):
+            return
+        if self._cancel_pending is not None:
+            # A delivery is already scheduled; it will pick up this frame
+            return
+        now = time.monotonic()
+        if self._last_delivery_ts is not None:
+            delay = self._last_delivery_ts + self._min_interval - now
+            if delay > 0:
+                self._cancel_pending = async_call_later(self.coordinator.hass, delay, self._async_deliver_pending)
+                return
+        self._last_delivery_ts = now
+        self._update_callback()
+
+    @callback
+    def _async_deliver_pending(self, _now):
+        """Deliver the frame held back by the rate limit."""
+        self._cancel_pending = None
+        self.async_handle_update()
+
+    @callback
+    def async_cancel(self):
+        """Drop a pending delivery."""
+        if self._cancel_pending:
+            self._cancel_pending()
+            self._cancel_pending = None
@@ -0,0 +1,70 @@
+from functools import lru_cache
+
+import numpy as np
+
+# Color stops per palette as (position 0..1, (r, g, b)). Positions must be
+# increasing; colors are linearly interpolated between stops.
+PALETTE_STOPS = {
+    # The original Black-Blue-Green-Yellow-Red-White ramp
+    "classic": [
+        (0.0, (0, 0, 0)),
+        (0.2, (0, 0, 255)),
+        (0.4, (0, 255, 0)),
+        (0.6, (255, 255, 0)),
+        (0.8, (255, 0, 0)),
+        (1.0, (255, 255, 255)),
+    ],
+    "ironbow": [
+        (0.0, (0, 0, 10)),
+        (0.15, (30, 0, 100)),
+        (0.35, (140, 10, 150)),
+        (0.55, (220, 60, 50)),
+        (0.75, (250, 150, 0)),
+        (0.9, (255, 220, 60)),
+        (1.0, (255, 255, 230)),
+    ],
+    "rainbow": [
+        (0.0, (0, 0, 130)),
+        (0.15, (0, 0, 255)),
+        (0.35, (0, 255, 255)),
+        (0.5, (0, 255, 0)),
+        (0.65, (255, 255, 0)),
+        (0.85, (255, 0, 0)),
+        (1.0, (170, 0, 0)),
+    ],
+    "white_hot": [
+        (0.0, (0, 0, 0)),
+        (1.0, (255, 255, 255)),
+    ],
+    "black_hot": [
+        (0.0, (255, 255, 255)),
+        (1.0, (0, 0, 0)),
+    ],
+}
+
+# Palettes made of flat, equally wide bands instead of gradients
+PALETTE_BANDS = {
+    "high_contrast": [
+        (0, 0, 0), (0, 0, 160), (90, 0, 200), (0, 150, 255), (0, 220, 120),
+        (150, 255, 0), (255, 230, 0), (255, 130, 0), (230, 0, 0), (255, 255, 255),
+    ],
+}
+
+LUT_SIZE = 256
+
+@lru_cache(maxsize=None)
+def palette_lut(name="classic"):
+    """Compile a palette into a read-only (256, 3) uint8 lookup table, once per process."""
+    positions = np.linspace(0.0, 1.0, LUT_SIZE)
+    if name in PALETTE_BANDS:
+        bands = np.array(PALETTE_BANDS[name], dtype=np.uint8)
+        lut = bands[np.minimum((positions * len(bands)).astype(np.intp), len(bands) - 1)]
+    else:
+        stops = PALETTE_STOPS.get(name, PALETTE_STOPS["classic"])
+        xp = [position for position, _ in stops]
+        lut = np.stack(
+            [np.interp(positions, xp, [color[channel] for _, color in stops]) for channel in range(3)],
+            axis=-1,
+        ).astype(np.uint8)
+    lut.setflags(write=False)
+    return lut
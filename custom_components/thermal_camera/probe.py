@@ -0,0 +1,213 @@
+import asyncio
+import json
+import logging
+import math
+import statistics
+import time
+
+import aiohttp
+
+from .constants import (
+    DEFAULT_PATH, DEFAULT_DATA_FIELD, DEFAULT_LOWEST_FIELD, DEFAULT_HIGHEST_FIELD,
+    DEFAULT_AVERAGE_FIELD, DEFAULT_ROWS, DEFAULT_COLS
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+PROBE_SECONDS = 3.0  # Measurement time per transport
+REQUEST_TIMEOUT_SEC = 3.0
+STREAM_PATH = "bin"
+
+# Fastest rates the probe will suggest; Home Assistant gains nothing from more
+MIN_UPDATE_INTERVAL_MS = 100
+MIN_STREAM_PUSH_MS = 66
+
+# Pixel count -> (rows, columns) of common thermal sensors
+KNOWN_RESOLUTIONS = {
+    64: (8, 8),            # AMG88xx
+    192: (12, 16),         # MLX90641
+    768: (24, 32),         # MLX90640
+    4800: (60, 80),        # Lepton 2
+    19200: (120, 160),     # Lepton 3
+    49152: (192, 256),     # 256x192 modules
+}
+
+# Field names tried, in order, for the statistics in a JSON frame
+STAT_FIELD_CANDIDATES = {
+    "lowest_field": (DEFAULT_LOWEST_FIELD, "min", "minimum", "min_temp"),
+    "highest_field": (DEFAULT_HIGHEST_FIELD, "max", "maximum", "max_temp"),
+    "average_field": (DEFAULT_AVERAGE_FIELD, "avg", "mean", "average_temp"),
+}
+
+async def async_probe_device(session, url, seconds=PROBE_SECONDS):
+    """Probe the JSON and binary stream endpoints of a device and suggest settings.
+
+    Returns None if neither endpoint delivered a frame. Otherwise returns a
+    dict with `settings` (config entry values to pre-fill) and `summary`
+    (measurements, for display).
+    """
+    url = url.rstrip("/")
+    json_result = await _async_probe_json(session, url, seconds)
+    stream_result = await _async_probe_stream(session, url, seconds)
+    _LOGGER.debug("Probe of %s: json=%s stream=%s", url, json_result, stream_result)
+    if json_result is None and stream_result is None:
+        return None
+
+    # Prefer whichever transport sustains more frames per second
+    use_stream = stream_result is not None and (
+        json_result is None or stream_result["fps"] >= json_result["fps"]
+    )
+    best = stream_result if use_stream else json_result
+    rows, cols = best["shape"]
+    settings = {
+        "rows": rows,
+        "columns": cols,
+        "use_stream": use_stream,
+        "path": STREAM_PATH if use_stream else json_result["path"],
+    }
+    if json_result is not None:
+        settings.update(json_result["fields"])
+        settings["update_interval_ms"] = json_result["update_interval_ms"]
+    if stream_result is not None:
+        settings["stream_push_ms"] = stream_result["stream_push_ms"]
+
+    return {
+        "settings": settings,
+        "summary": {
+            "transport": "binary stream" if use_stream else "JSON polling",
+            "format": best["format"],
+            "shape": f"{cols}x{rows}",
+            "latency_ms": round(best["latency_ms"], 1),
+            "fps": round(best["fps"], 1),
+        },
+    }
+
+async def _async_probe_json(session, url, seconds):
+    """Poll the JSON endpoint back to back for `seconds`; None if it serves no frame."""
+    for path in (DEFAULT_PATH, ""):
+        endpoint = f"{url}/{path}" if path else url
+        try:
+            data, latency = await _async_get_json(session, endpoint)
+        except (aiohttp.ClientError, asyncio.TimeoutError, ValueError):
+            continue
+        found = _find_frame_fields(data)
+        if found is None:
+            continue
+        fields, shape = found
+
+        latencies = [latency]
+        deadline = time.monotonic() + seconds
+        start = time.monotonic()
+        while time.monotonic() < deadline:
+            try:
+                _data, latency = await _async_get_json(session, endpoint)
+            except (aiohttp.ClientError, asyncio.TimeoutError, ValueError):
+                break
+            latencies.append(latency)
+        elapsed = max(time.monotonic() - start, 1e-3)
+
+        # Poll no faster than the slow end of the measured round trips
+        slow_ms = _percentile(latencies, 0.9) * 1000.0
+        return {
+            "path": path,
+            "fields": fields,
+            "shape": shape,
+            "format": "json",
+            "latency_ms": statistics.median(latencies) * 1000.0,
+            "fps": (len(latencies) - 1) / elapsed if len(latencies) > 1 else 1.0 / latencies[0],
+            "update_interval_ms": max(MIN_UPDATE_INTERVAL_MS, int(math.ceil(slow_ms * 1.2 / 10.0)) * 10),
+        }
+    return None
+
+async def _async_get_json(session, endpoint):
+    """GET an endpoint and return (decoded JSON, seconds taken)."""
+    start = time.monotonic()
+    async with asyncio.timeout(REQUEST_TIMEOUT_SEC):
+        async with session.get(endpoint, headers={"Connection": "close"}) as resp:
+            resp.raise_for_status()
+            data = await resp.json(content_type=None)
+    return data, time.monotonic() - start
+
+def _find_frame_fields(data):
+    """Return (field settings, (rows, cols)) for a JSON frame, or None if it holds no frame."""
+    if isinstance(data, list):
+        frame_field, frame = "", data
+    elif isinstance(data, dict):
+        candidates = [(DEFAULT_DATA_FIELD, data.get(DEFAULT_DATA_FIELD))] + list(data.items())
+        frame_field, frame = next(
+            ((key, value) for key, value in candidates if isinstance(value, list) and value), ("", None)
+        )
+        if frame is None:
+            return None
+    else:
+        return None
+
+    fields = {"data_field": frame_field}
+    for setting, names in STAT_FIELD_CANDIDATES.items():
+        # An empty field name makes the coordinator compute the value from the pixels
+        fields[setting] = next(
+            (name for name in names if isinstance(data, dict) and isinstance(data.get(name), (int, float))), ""
+        )
+
+    if isinstance(frame[0], list):
+        return fields, (len(frame), len(frame[0]))
+    return fields, KNOWN_RESOLUTIONS.get(len(frame), (DEFAULT_ROWS, DEFAULT_COLS))
+
+async def _async_probe_stream(session, url, seconds):
+    """Read the length-prefixed binary stream for `seconds`; None if it delivers no frame."""
+    timestamps = []
+    payload = None
+    try:
+        start = time.monotonic()
+        async with asyncio.timeout(seconds + REQUEST_TIMEOUT_SEC):
+            async with session.get(
+                f"{url}/{STREAM_PATH}", timeout=aiohttp.ClientTimeout(total=None)
+            ) as resp:
+                resp.raise_for_status()
+                latency = time.monotonic() - start
+                deadline = time.monotonic() + seconds
+                while time.monotonic() < deadline:
+                    header = await resp.content.readexactly(4)
+                    length = int.from_bytes(header, byteorder="big", signed=False)
+                    if length <= 0:
+                        break
+                    payload = await resp.content.readexactly(length)
+                    timestamps.append(time.monotonic())
+    except (aiohttp.ClientError, asyncio.TimeoutError, asyncio.IncompleteReadError):
+        pass
+    if payload is None:
+        return None
+
+    fmt, shape = _payload_format(payload)
+    if fmt is None:
+        return None
+    elapsed = timestamps[-1] - timestamps[0] if len(timestamps) > 1 else 0.0
+    fps = (len(timestamps) - 1) / elapsed if elapsed > 0 else 1.0
+    return {
+        "shape": shape,
+        "format": fmt,
+        "latency_ms": latency * 1000.0,
+        "fps": fps,
+        "stream_push_ms": max(MIN_STREAM_PUSH_MS, int(math.ceil(1000.0 / fps))),
+    }
+
+def _payload_format(payload):
+    """Return (format name, (rows, cols)) of a stream payload, matching ThermalFrame.from_payload."""
+    if payload[:1] == b"[":
+        try:
+            values = json.loads(payload.decode("utf-8"))
+        except ValueError:
+            return None, None
+        if isinstance(values, list) and values:
+            return "json", KNOWN_RESOLUTIONS.get(len(values), (DEFAULT_ROWS, DEFAULT_COLS))
+        return None, None
+    if len(payload) % 4 == 0 and len(payload) // 4 in KNOWN_RESOLUTIONS:
+        return "float32", KNOWN_RESOLUTIONS[len(payload) // 4]
+    if len(payload) % 2 == 0 and len(payload) // 2 in KNOWN_RESOLUTIONS:
+        return "uint16", KNOWN_RESOLUTIONS[len(payload) // 2]
+    return None, None
+
+def _percentile(values, fraction):
+    """Return the value below which `fraction` of values fall."""
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
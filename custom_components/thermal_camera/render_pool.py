@@ -0,0 +1,167 @@
+import asyncio
+import logging
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from .constants import DOMAIN
+from .frame_processor import process_frame
+from .renderer import load_font
+
+_LOGGER = logging.getLogger(__name__)
+
+# Leave one core for the Home Assistant event loop
+DEFAULT_RENDER_WORKERS = max(1, min(4, (os.cpu_count() or 2) - 1))
+
+_POOL_KEY = "render_pool"
+
+def _attach_shared_memory(name):
+    """Attach to a block owned (and eventually unlinked) by the Home Assistant process."""
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        # Python < 3.13 always registers the block, but spawned workers share
+        # the parent's resource tracker, so the registration is a duplicate
+        return shared_memory.SharedMemory(name=name)
+
+def _render_in_worker(shm_name, shape, font_size, params):
+    """Render one frame from shared memory in a worker process and return JPEG bytes."""
+    shm = _attach_shared_memory(shm_name)
+    try:
+        frame = np.ndarray(shape, dtype=np.float32, buffer=shm.buf).copy()
+    finally:
+        shm.close()
+    return process_frame(frame, font=load_font(font_size), **params)
+
+class RenderPool:
+    """A small process pool shared by every camera that opted into process rendering."""
+
+    def __init__(self, workers=DEFAULT_RENDER_WORKERS):
+        self.workers = workers
+        self._executor = ProcessPoolExecutor(
+            max_workers=workers,
+            # Forking a threaded Home Assistant process is unsafe
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+        self._users = 0
+
+    def slot(self):
+        """Create a per-camera render slot backed by this pool."""
+        self._users += 1
+        return RenderSlot(self)
+
+    def release(self):
+        """Drop one user; returns True when the pool is no longer used."""
+        self._users -= 1
+        return self._users <= 0
+
+    async def async_run(self, *args):
+        """Run _render_in_worker in the pool."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, _render_in_worker, *args)
+
+    def shutdown(self):
+        """Stop the worker processes."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+class RenderSlot:
+    """Per-camera handle on the render pool with latest-frame-wins scheduling.
+
+    A slot owns one shared-memory frame buffer and keeps at most one render in
+    flight. Frames submitted while a render is running replace each other;
+    superseded requests resolve to None instead of queueing up.
+    """
+
+    def __init__(self, pool):
+        self._pool = pool
+        self._shm = None
+        self._shape = None
+        self._pending = None
+        self._drain_task = None
+        self.rendered = 0
+        self.superseded = 0
+
+    async def async_render(self, frame, font_size, **params):
+        """Render frame with process_frame params; returns JPEG bytes, or None if superseded."""
+        future = asyncio.get_running_loop().create_future()
+        if self._pending is not None:
+            self._supersede(self._pending[3])
+        self._pending = (frame, font_size, params, future)
+        if self._drain_task is None or self._drain_task.done():
+            self._drain_task = asyncio.create_task(self._drain())
+        return await future
+
+    def _supersede(self, future):
+        self.superseded += 1
+        if not future.done():
+            future.set_result(None)
+
+    async def _drain(self):
+        """Render the most recently submitted frame until nothing is pending."""
+        while self._pending is not None:
+            frame, font_size, params, future = self._pending
+            self._pending = None
+            if future.done():
+                # The requester went away
+                continue
+            try:
+                # Only one render is in flight, so the buffer is free to overwrite
+                shape = self._write_frame(frame)
+                result = await self._pool.async_run(self._shm.name, shape, font_size, params)
+            except Exception as err:
+                if not future.done():
+                    future.set_exception(err)
+                continue
+            self.rendered += 1
+            if not future.done():
+                future.set_result(result)
+
+    def _write_frame(self, frame):
+        """Copy frame into the shared buffer, (re)allocating it if the shape changed."""
+        frame = np.asarray(frame, dtype=np.float32)
+        if self._shm is None or frame.shape != self._shape:
+            self._release_buffer()
+            self._shm = shared_memory.SharedMemory(create=True, size=max(frame.nbytes, 1))
+            self._shape = frame.shape
+        np.ndarray(self._shape, dtype=np.float32, buffer=self._shm.buf)[...] = frame
+        return self._shape
+
+    def _release_buffer(self):
+        if self._shm is not None:
+            self._shm.close()
+            try:
+                self._shm.unlink()
+            except FileNotFoundError:
+                pass
+            self._shm = None
+
+    def close(self):
+        """Cancel pending work and free the shared buffer."""
+        if self._pending is not None:
+            self._supersede(self._pending[3])
+            self._pending = None
+        if self._drain_task is not None:
+            self._drain_task.cancel()
+            self._drain_task = None
+        self._release_buffer()
+
+def async_get_render_slot(hass):
+    """Return a render slot on the pool shared by all config entries, creating the pool if needed."""
+    pool = hass.data.setdefault(DOMAIN, {}).get(_POOL_KEY)
+    if pool is None:
+        pool = RenderPool()
+        hass.data[DOMAIN][_POOL_KEY] = pool
+        _LOGGER.debug("Started render pool with %s workers", pool.workers)
+    return pool.slot()
+
+def async_release_render_slot(hass, slot):
+    """Close a render slot and stop the shared pool once no camera uses it."""
+    slot.close()
+    pool = hass.data.get(DOMAIN, {}).get(_POOL_KEY)
+    if pool is not None and pool.release():
+        hass.data[DOMAIN].pop(_POOL_KEY, None)
+        pool.shutdown()
+        _LOGGER.debug("Stopped render pool")
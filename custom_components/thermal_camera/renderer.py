@@ -0,0 +1,51 @@
+import logging
+import os
+from functools import lru_cache
+
+from .constants import DEFAULT_ISOTHERM_MODE, DEFAULT_ISOTHERM_MIN, DEFAULT_ISOTHERM_MAX
+
+_LOGGER = logging.getLogger(__name__)
+
+FONT_PATH = os.path.join(os.path.dirname(__file__), 'DejaVuSans-Bold.ttf')
+FONT_SIZE = 30
+MIN_FONT_SIZE = 10
+# The overlay layout (font size, reticle, scale bar) is tuned for this output
+# height and scaled proportionally for others
+OVERLAY_REFERENCE_HEIGHT = 720
+
+# numpy and PIL are only imported by the functions below, so importing this
+# module (and the platforms that use it) stays cheap during startup
+
+@lru_cache(maxsize=None)
+def load_font(size=FONT_SIZE):
+    """Load the overlay font once per process. Blocking; call it from an executor."""
+    from PIL import ImageFont
+
+    try:
+        return ImageFont.truetype(FONT_PATH, size)
+    except OSError:
+        _LOGGER.error("Failed to load DejaVu font, using default font.")
+        return ImageFont.load_default()
+
+def font_size_for_height(height):
+    """Return the overlay font size for images `height` pixels tall."""
+    return max(MIN_FONT_SIZE, round(FONT_SIZE * height / OVERLAY_REFERENCE_HEIGHT))
+
+def load_renderer(size=FONT_SIZE):
+    """Import the frame processor and load the font; returns (process_frame, font)."""
+    from .frame_processor import process_frame
+
+    return process_frame, load_font(size)
+
+def isotherm_from_config(config):
+    """Translate the isotherm options into the (low, high) band used by process_frame, or None."""
+    isotherm_mode = config.get("isotherm_mode", DEFAULT_ISOTHERM_MODE)
+    if isotherm_mode == "above":
+        return (config.get("isotherm_min", DEFAULT_ISOTHERM_MIN), None)
+    if isotherm_mode == "within":
+        return (config.get("isotherm_min", DEFAULT_ISOTHERM_MIN), config.get("isotherm_max", DEFAULT_ISOTHERM_MAX))
+    return None
+
+async def async_load_renderer(hass, size=FONT_SIZE):
+    """Load the rendering stack in the executor so the event loop never blocks on it."""
+    return await hass.async_add_executor_job(load_renderer, size)
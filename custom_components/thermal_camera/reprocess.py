@@ -0,0 +1,274 @@
+"""Reprocess recorded thermal frames offline with the integration's own rendering and analysis.
+
+Reads a recording, either JSON lines in the device's JSON format (one
+response per line) or binary frames as the `bin` stream delivers them
+(4-byte big-endian length, then the payload), and writes to the output
+directory:
+
+- frame_NNNNNN.jpg: each frame rendered by process_frame (unless --no-images)
+- stats.csv: per-frame min / max / average, hotspot and motion delta
+- motion_events.csv: periods in which the motion sensor would have been on
+
+Frames are parsed, analysed and rendered in a process pool while the file is
+still being read, so recordings of any length run in bounded memory and use
+every core. Only numpy and Pillow are needed, not Home Assistant; run it
+from the Home Assistant configuration directory (or any directory
+containing custom_components):
+
+    python -m custom_components.thermal_camera.reprocess recording.jsonl --output review/
+"""
+import argparse
+import csv
+import json
+import logging
+import multiprocessing
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from .analysis import FrameAnalysis
+from .constants import (
+    DEFAULT_ROWS, DEFAULT_COLS, DEFAULT_DATA_FIELD, DEFAULT_LOWEST_FIELD, DEFAULT_HIGHEST_FIELD,
+    DEFAULT_AVERAGE_FIELD, DEFAULT_RESAMPLE_METHOD, DEFAULT_DESIRED_HEIGHT, DEFAULT_MOTION_THRESHOLD,
+    DEFAULT_PALETTE, DEFAULT_CONTOUR_STEP, PALETTES, RESAMPLE_METHODS,
+)
+from .frame import ThermalFrame
+from .renderer import font_size_for_height, load_renderer
+
+_LOGGER = logging.getLogger(__name__)
+
+# Frames in flight per worker; bounds memory while keeping every worker busy
+FRAMES_PER_WORKER = 8
+STATS_FIELDS = [
+    "index", "timestamp", "min_value", "max_value", "avg_value",
+    "hotspot_row", "hotspot_col", "hotspot_value", "motion_delta", "motion",
+]
+EVENT_FIELDS = ["start_index", "start_timestamp", "end_index", "end_timestamp", "frames", "peak_delta"]
+
+# Set in each worker by _init_worker
+_options = None
+_render = None
+
+def read_json_lines(stream):
+    """Yield the raw bytes of each non-empty line of a JSON lines recording."""
+    for line in stream:
+        if line.strip():
+            yield line
+
+def read_binary_frames(stream):
+    """Yield the payloads of a length-prefixed binary recording."""
+    while True:
+        header = stream.read(4)
+        if len(header) < 4:
+            return
+        length = int.from_bytes(header, byteorder="big", signed=False)
+        payload = stream.read(length)
+        if len(payload) < length:
+            _LOGGER.warning("Recording ends in a truncated frame; ignoring it")
+            return
+        yield payload
+
+def _init_worker(options):
+    """Load the renderer and font once per worker process."""
+    global _options, _render
+    _options = options
+    if options["output_images"]:
+        process_frame, font = load_renderer(font_size_for_height(options["height"]))
+        _render = (process_frame, font)
+
+def parse_record(record, options):
+    """Return (frame, (min, max, avg) or None, timestamp) of one recorded JSON line or binary payload."""
+    rows, cols = options["rows"], options["cols"]
+    if options["format"] == "bin":
+        return ThermalFrame.from_payload(record, rows, cols), None, None
+
+    data = json.loads(record)
+    if not isinstance(data, dict):
+        return ThermalFrame.from_values(data, rows, cols), None, None
+    frame = ThermalFrame.from_values(data.get(options["data_field"]) or [], rows, cols)
+    reported = tuple(data.get(options[field]) for field in ("lowest_field", "highest_field", "average_field"))
+    return frame, (reported if None not in reported else None), data.get(options["timestamp_field"])
+
+def process_record(item):
+    """Parse, analyse and optionally render one frame in a worker; return its stats row."""
+    index, record = item
+    options = _options
+    try:
+        frame, reported, timestamp = parse_record(record, options)
+    except (TypeError, ValueError) as err:
+        return {"index": index, "error": str(err)}
+    if frame is None or frame.size == 0:
+        return {"index": index, "error": "empty or unparseable frame"}
+
+    # Same statistics as the coordinator: reported by the device, else from the pixels
+    analysis = FrameAnalysis(index, frame, options["rows"], options["cols"])
+    if reported is not None:
+        analysis.min_value, analysis.max_value, analysis.avg_value = reported
+    elif analysis.stats is not None:
+        analysis.min_value, analysis.max_value, analysis.avg_value = (round(value, 1) for value in analysis.stats)
+    else:
+        return {"index": index, "error": f"frame has {frame.size} pixels, expected {options['rows'] * options['cols']}"}
+
+    hotspot = analysis.hotspot or (None, None, None)
+    motion_delta = analysis.motion_delta
+    row = {
+        "index": index,
+        "timestamp": timestamp,
+        "min_value": analysis.min_value,
+        "max_value": analysis.max_value,
+        "avg_value": analysis.avg_value,
+        "hotspot_row": hotspot[0],
+        "hotspot_col": hotspot[1],
+        "hotspot_value": None if hotspot[2] is None else round(hotspot[2], 2),
+        "motion_delta": None if motion_delta is None else round(motion_delta, 2),
+        "motion": motion_delta is not None and motion_delta > options["motion_threshold"],
+    }
+
+    if _render is not None and analysis.array is not None:
+        process_frame, font = _render
+        display_min = options["display_min"] if options["display_min"] is not None else analysis.min_value
+        display_max = options["display_max"] if options["display_max"] is not None else analysis.max_value
+        image = process_frame(
+            analysis.array, display_min, display_max, analysis.avg_value,
+            options["rows"], options["cols"], options["resample"], font, options["height"],
+            palette=options["palette"], contour_step=options["contour_step"], hotspot=analysis.hotspot,
+        )
+        with open(os.path.join(options["output"], f"frame_{index:06d}.jpg"), "wb") as output:
+            output.write(image)
+    return row
+
+def process_in_pool(records, options, workers):
+    """Yield process_record results in input order, reading records only as workers free up."""
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(workers, mp_context=context, initializer=_init_worker, initargs=(options,)) as pool:
+        pending = deque()
+        for item in enumerate(records):
+            pending.append(pool.submit(process_record, item))
+            if len(pending) >= workers * FRAMES_PER_WORKER:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+class MotionEvents:
+    """Turn the per-frame motion flags into on/off periods, like the motion sensor's state history."""
+
+    def __init__(self):
+        self.events = []
+        self._current = None
+
+    def add(self, row):
+        """Feed the stats row of the next frame."""
+        current = self._current
+        if row["motion"]:
+            if current is None:
+                current = self._current = {
+                    "start_index": row["index"], "start_timestamp": row["timestamp"],
+                    "frames": 0, "peak_delta": row["motion_delta"],
+                }
+            current["end_index"] = row["index"]
+            current["end_timestamp"] = row["timestamp"]
+            current["frames"] += 1
+            current["peak_delta"] = max(current["peak_delta"], row["motion_delta"])
+        elif current is not None:
+            self.events.append(current)
+            self._current = None
+
+    def finish(self):
+        """Close an event still open at the end of the recording and return all events."""
+        if self._current is not None:
+            self.events.append(self._current)
+            self._current = None
+        return self.events
+
+def reprocess(path, options, workers):
+    """Reprocess one recording into options["output"]; return (frames, errors, events, seconds)."""
+    os.makedirs(options["output"], exist_ok=True)
+    motion = MotionEvents()
+    frames = errors = 0
+    start = time.perf_counter()
+    with open(path, "rb") as recording, \
+            open(os.path.join(options["output"], "stats.csv"), "w", newline="") as stats_file:
+        records = read_binary_frames(recording) if options["format"] == "bin" else read_json_lines(recording)
+        stats = csv.DictWriter(stats_file, fieldnames=STATS_FIELDS)
+        stats.writeheader()
+        for row in process_in_pool(records, options, workers):
+            if "error" in row:
+                errors += 1
+                _LOGGER.warning("Frame %s skipped: %s", row["index"], row["error"])
+                continue
+            frames += 1
+            stats.writerow(row)
+            motion.add(row)
+    elapsed = time.perf_counter() - start
+
+    events = motion.finish()
+    with open(os.path.join(options["output"], "motion_events.csv"), "w", newline="") as events_file:
+        writer = csv.DictWriter(events_file, fieldnames=EVENT_FIELDS)
+        writer.writeheader()
+        writer.writerows(events)
+    return frames, errors, events, elapsed
+
+def detect_format(path):
+    """Guess the recording format from the file extension."""
+    return "json" if path.lower().endswith((".json", ".jsonl", ".ndjson")) else "bin"
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("recording", help="JSON lines or binary frame recording")
+    parser.add_argument("--output", "-o", required=True, help="directory for images and CSV files")
+    parser.add_argument("--format", choices=["auto", "json", "bin"], default="auto")
+    parser.add_argument("--rows", type=int, default=DEFAULT_ROWS)
+    parser.add_argument("--columns", type=int, default=DEFAULT_COLS)
+    parser.add_argument("--data-field", default=DEFAULT_DATA_FIELD)
+    parser.add_argument("--lowest-field", default=DEFAULT_LOWEST_FIELD)
+    parser.add_argument("--highest-field", default=DEFAULT_HIGHEST_FIELD)
+    parser.add_argument("--average-field", default=DEFAULT_AVERAGE_FIELD)
+    parser.add_argument("--timestamp-field", default="timestamp", help="JSON field copied into the CSV files")
+    parser.add_argument("--motion-threshold", type=float, default=DEFAULT_MOTION_THRESHOLD)
+    parser.add_argument("--no-images", action="store_true", help="only write the CSV files")
+    parser.add_argument("--height", type=int, default=DEFAULT_DESIRED_HEIGHT)
+    parser.add_argument("--resample", choices=list(RESAMPLE_METHODS), default=DEFAULT_RESAMPLE_METHOD)
+    parser.add_argument("--palette", choices=PALETTES, default=DEFAULT_PALETTE)
+    parser.add_argument("--contour-step", type=float, default=DEFAULT_CONTOUR_STEP)
+    parser.add_argument("--display-min", type=float, help="fixed display range (default: each frame's own)")
+    parser.add_argument("--display-max", type=float)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s %(message)s")
+
+    if (args.display_min is None) != (args.display_max is None):
+        parser.error("--display-min and --display-max go together")
+    if args.display_min is not None and args.display_min >= args.display_max:
+        parser.error("--display-min must be below --display-max")
+    options = {
+        "format": detect_format(args.recording) if args.format == "auto" else args.format,
+        "output": args.output,
+        "rows": args.rows,
+        "cols": args.columns,
+        "data_field": args.data_field,
+        "lowest_field": args.lowest_field,
+        "highest_field": args.highest_field,
+        "average_field": args.average_field,
+        "timestamp_field": args.timestamp_field,
+        "motion_threshold": args.motion_threshold,
+        "output_images": not args.no_images,
+        "height": args.height,
+        "resample": args.resample,
+        "palette": args.palette,
+        "contour_step": args.contour_step or None,
+        "display_min": args.display_min,
+        "display_max": args.display_max,
+    }
+    workers = max(1, args.workers)
+    frames, errors, events, elapsed = reprocess(args.recording, options, workers)
+    rate = frames / elapsed if elapsed > 0 else 0.0
+    print(
+        f"{frames} frames ({errors} skipped), {len(events)} motion events in {elapsed:.1f} s: "
+        f"{rate:.1f} frames/s, {rate / workers:.1f} frames/s per core ({workers} workers)"
+    )
+    return 0 if frames else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
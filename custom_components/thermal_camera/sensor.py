@@ -1,11 +1,33 @@
 import logging
-from homeassistant.components.sensor import SensorEntity
-from homeassistant.const import UnitOfTemperature
-from .constants import DOMAIN, DEFAULT_NAME
+from datetime import timedelta
+from homeassistant.components.sensor import SensorEntity, SensorStateClass
+from homeassistant.const import EntityCategory, UnitOfDataRate, UnitOfTemperature, UnitOfTime
+from homeassistant.core import callback
+from homeassistant.helpers.event import async_call_later
+from .constants import (
+    DOMAIN, DEFAULT_NAME, DEFAULT_SENSOR_DEADBAND, DEFAULT_SENSOR_RELATIVE_DEADBAND,
+    DEFAULT_SENSOR_MIN_INTERVAL, DEFAULT_SENSOR_HEARTBEAT, SENSOR_UPDATE_RATE_HZ
+)
 from .coordinator import ThermalCameraDataCoordinator
+from .write_policy import WritePolicy
 
 _LOGGER = logging.getLogger(__name__)
 
+# Only the diagnostic ingest sensors poll; they read the coordinator's telemetry
+SCAN_INTERVAL = timedelta(seconds=30)
+
+# Telemetry snapshot key -> (name suffix, unit, state class, enabled by default)
+TELEMETRY_SENSORS = {
+    "frame_rate": ("Ingest Frame Rate", "fps", SensorStateClass.MEASUREMENT, True),
+    "bytes_per_second": ("Ingest Throughput", UnitOfDataRate.BYTES_PER_SECOND, SensorStateClass.MEASUREMENT, True),
+    "jitter_ms": ("Ingest Jitter", UnitOfTime.MILLISECONDS, SensorStateClass.MEASUREMENT, True),
+    "latency_ms": ("Request Latency", UnitOfTime.MILLISECONDS, SensorStateClass.MEASUREMENT, True),
+    "frames_coalesced": ("Frames Coalesced", None, SensorStateClass.TOTAL_INCREASING, False),
+    "frames_dropped": ("Frames Dropped", None, SensorStateClass.TOTAL_INCREASING, True),
+    "reconnects": ("Reconnects", None, SensorStateClass.TOTAL_INCREASING, True),
+    "disconnected_seconds": ("Time Disconnected", UnitOfTime.SECONDS, SensorStateClass.TOTAL_INCREASING, False),
+}
+
 async def async_setup_entry(hass, config_entry, async_add_entities):
     """Set up the thermal camera sensors from a config entry."""
     # Retrieve the coordinator from the main integration data
@@ -14,33 +36,53 @@ async def async_setup_entry(hass, config_entry, async_add_entities):
         _LOGGER.error("Data coordinator not found for Thermal Camera Sensors")
         return
 
+    # Each sensor gets its own write policy so deadbands and intervals are tracked per entity
+    config = config_entry.data
+
+    def write_policy():
+        return WritePolicy(
+            deadband=config.get("sensor_deadband", DEFAULT_SENSOR_DEADBAND),
+            relative_deadband=config.get("sensor_relative_deadband", DEFAULT_SENSOR_RELATIVE_DEADBAND) / 100.0,
+            min_interval=config.get("sensor_min_interval", DEFAULT_SENSOR_MIN_INTERVAL),
+            heartbeat=config.get("sensor_heartbeat", DEFAULT_SENSOR_HEARTBEAT) or None,
+        )
+
     # Initialize three sensors: highest, lowest, and average temperature
     async_add_entities([
         ThermalCameraTemperatureSensor(
             coordinator,
             config_entry,
             "highest",
-            unique_id=config_entry.data["unique_id_highest_sensor"]
+            unique_id=config_entry.data["unique_id_highest_sensor"],
+            write_policy=write_policy(),
         ),
         ThermalCameraTemperatureSensor(
             coordinator,
             config_entry,
             "lowest",
-            unique_id=config_entry.data["unique_id_lowest_sensor"]
+            unique_id=config_entry.data["unique_id_lowest_sensor"],
+            write_policy=write_policy(),
         ),
         ThermalCameraTemperatureSensor(
             coordinator,
             config_entry,
             "average",
-            unique_id=config_entry.data["unique_id_average_sensor"]
+            unique_id=config_entry.data["unique_id_average_sensor"],
+            write_policy=write_policy(),
         ),
+    ] + [
+        ThermalCameraTelemetrySensor(coordinator, config_entry, key)
+        for key in TELEMETRY_SENSORS
     ])
 
 
 class ThermalCameraTemperatureSensor(SensorEntity):
     """Representation of a thermal camera temperature sensor."""
 
-    def __init__(self, coordinator, config_entry, sensor_type, unique_id=None):
+    # Write counters change on every write; keep them out of the recorder
+    _unrecorded_attributes = frozenset({"writes", "writes_suppressed"})
+
+    def __init__(self, coordinator, config_entry, sensor_type, unique_id=None, write_policy=None):
         super().__init__()
         self.coordinator = coordinator
         self._config_entry = config_entry
@@ -58,16 +100,32 @@ class ThermalCameraTemperatureSensor(SensorEntity):
         self._attr_unit_of_measurement = UnitOfTemperature.CELSIUS
         self._attr_device_class = "temperature"  # Optional: assign a device class for better UI display
 
+        # Only write states that pass the deadband / rate limit policy
+        self._write_policy = write_policy or WritePolicy()
+        self._cancel_pending_write = None
+
         # Register this sensor to listen for updates from the coordinator
         self._remove_listener = None
 
     @property
     def state(self):
-        """Return the current temperature value for this sensor type."""
-        data = self.coordinator.data
-        if data:
-            return data.get(self.field)
-        return None
+        """Return the last written temperature value for this sensor type."""
+        return self._attr_native_value
+
+    @property
+    def should_poll(self):
+        """State is pushed by the coordinator."""
+        return False
+
+    @property
+    def available(self):
+        """Unavailable until the coordinator delivers its first frame."""
+        return self.coordinator.analysis is not None
+
+    @property
+    def extra_state_attributes(self):
+        """Expose how many state writes the write policy suppressed."""
+        return self._write_policy.attributes
 
     @property
     def device_info(self):
@@ -92,13 +150,81 @@ class ThermalCameraTemperatureSensor(SensorEntity):
         if self._attr_native_value is None:
             _LOGGER.warning(f"{self.name}: Missing '{self.field}' data in coordinator response.")
 
+    @callback
+    def _handle_coordinator_update(self):
+        """Write the new value if the write policy allows it, or retry once the rate limit expires."""
+        analysis = self.coordinator.analysis
+        if analysis is None:
+            return
+
+        value = getattr(analysis, self.field)
+        delay = self._write_policy.evaluate(value)
+        if delay == 0:
+            self._attr_native_value = value
+            self._write_policy.record_write(value)
+            self.async_write_ha_state()
+        elif delay is not None and self._cancel_pending_write is None:
+            # Rate limited: make sure the latest value still lands once the interval passes
+            self._cancel_pending_write = async_call_later(self.hass, delay, self._async_write_pending)
+
+    @callback
+    def _async_write_pending(self, _now):
+        """Retry a rate-limited write with the latest coordinator value."""
+        self._cancel_pending_write = None
+        self._handle_coordinator_update()
+
     async def async_added_to_hass(self):
         """Called when the entity is added to Home Assistant."""
-        # Now attach the listener since hass is guaranteed to be available
-        self._remove_listener = self.coordinator.async_add_listener(self.async_write_ha_state)
+        # The initial state is written by Home Assistant when the entity is added
+        analysis = self.coordinator.analysis
+        if analysis is not None:
+            self._attr_native_value = getattr(analysis, self.field)
+            self._write_policy.record_write(self._attr_native_value)
+
+        # Now attach the listener since hass is guaranteed to be available; the
+        # sensors don't need every frame the camera does
+        self._remove_listener = self.coordinator.async_add_rate_limited_listener(
+            self._handle_coordinator_update, max_rate_hz=SENSOR_UPDATE_RATE_HZ
+        )
 
     async def async_will_remove_from_hass(self):
         """Clean up when the sensor is removed from Home Assistant."""
         if self._remove_listener:
             self._remove_listener()  # Remove the listener when removing the entity
             self._remove_listener = None
+        if self._cancel_pending_write:
+            self._cancel_pending_write()
+            self._cancel_pending_write = None
+
+
+class ThermalCameraTelemetrySensor(SensorEntity):
+    """Diagnostic sensor for one ingest statistic of the coordinator (frame rate, jitter, ...)."""
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_should_poll = True
+
+    def __init__(self, coordinator, config_entry, key):
+        super().__init__()
+        self.coordinator = coordinator
+        self._config_entry = config_entry
+        self._key = key
+        name, unit, state_class, enabled = TELEMETRY_SENSORS[key]
+        self._attr_name = f"{config_entry.data.get('name', DEFAULT_NAME)} {name}"
+        self._attr_unique_id = f"{config_entry.entry_id}_{key}"
+        self._attr_native_unit_of_measurement = unit
+        self._attr_state_class = state_class
+        self._attr_entity_registry_enabled_default = enabled
+
+    @property
+    def device_info(self):
+        """Group the diagnostic sensors with the thermal camera device."""
+        return {
+            "identifiers": {(DOMAIN, self._config_entry.entry_id)},
+            "name": self._config_entry.data.get("name", DEFAULT_NAME),
+            "manufacturer": "Your Manufacturer",
+            "model": "Thermal Camera Sensor",
+        }
+
+    async def async_update(self):
+        """Read the statistic from a fresh telemetry snapshot."""
+        self._attr_native_value = self.coordinator.telemetry.snapshot()[self._key]
@@ -0,0 +1,95 @@
+import importlib
+import logging
+import os
+from functools import partial
+
+import voluptuous as vol
+from homeassistant.core import SupportsResponse, callback
+from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
+from homeassistant.helpers import config_validation as cv
+from homeassistant.util import dt as dt_util
+
+from .constants import (
+    DOMAIN, DEFAULT_ROWS, DEFAULT_COLS, DEFAULT_RESAMPLE_METHOD, DEFAULT_DESIRED_HEIGHT,
+    DEFAULT_PALETTE, DEFAULT_CONTOUR_STEP, CLIP_FORMATS, EVENT_CLIP_PROGRESS
+)
+from .renderer import isotherm_from_config
+from .views import coordinator_for_camera
+
+_LOGGER = logging.getLogger(__name__)
+
+SERVICE_EXPORT_CLIP = "export_clip"
+DEFAULT_CLIP_SECONDS = 10.0
+CLIP_DIRECTORY = "thermal_camera"  # Inside the local media directory
+
+EXPORT_CLIP_SCHEMA = vol.Schema({
+    vol.Required("entity_id"): cv.entity_id,
+    vol.Optional("duration", default=DEFAULT_CLIP_SECONDS): vol.All(vol.Coerce(float), vol.Range(min=0.1)),
+    vol.Optional("format", default="gif"): vol.In(CLIP_FORMATS),
+    vol.Optional("height"): vol.All(vol.Coerce(int), vol.Range(min=48, max=2160)),
+    vol.Optional("filename"): cv.string,
+})
+
+async def async_export_clip(call):
+    """Render the retained frames of the last `duration` seconds to a clip in the media directory."""
+    hass = call.hass
+    entity_id = call.data["entity_id"]
+    coordinator, entry_id = coordinator_for_camera(hass, entity_id)
+    if coordinator is None:
+        raise ServiceValidationError(f"{entity_id} is not a thermal camera")
+    entries = coordinator.recent_frames(call.data["duration"])
+    if not entries:
+        raise HomeAssistantError(
+            f"No frames retained for {entity_id}; check that frame history is enabled"
+        )
+
+    config = hass.data[DOMAIN][entry_id]["config"]
+    fmt = call.data["format"]
+    filename = os.path.basename(
+        call.data.get("filename")
+        or f"{entity_id.split('.', 1)[1]}_{dt_util.now().strftime('%Y%m%d_%H%M%S')}"
+    )
+    if not filename.endswith(f".{fmt}"):
+        filename = f"{filename}.{fmt}"
+    media_dir = hass.config.media_dirs.get("local") or hass.config.path("media")
+    path = os.path.join(media_dir, CLIP_DIRECTORY, filename)
+
+    def progress(done, total):
+        # Called from the executor; fire is thread-safe
+        hass.bus.fire(EVENT_CLIP_PROGRESS, {
+            "entity_id": entity_id, "path": path, "frames_done": done, "frames_total": total,
+        })
+
+    # Imported on demand: the clip writer pulls in numpy, Pillow and the frame processor
+    clip = await hass.async_add_executor_job(importlib.import_module, f"{__package__}.clip")
+    frames = await hass.async_add_executor_job(partial(
+        clip.write_clip,
+        entries,
+        path,
+        fmt,
+        config.get("rows", DEFAULT_ROWS),
+        config.get("columns", DEFAULT_COLS),
+        config.get("resample", DEFAULT_RESAMPLE_METHOD),
+        call.data.get("height", config.get("desired_height", DEFAULT_DESIRED_HEIGHT)),
+        palette=config.get("palette", DEFAULT_PALETTE),
+        isotherm=isotherm_from_config(config),
+        contour_step=config.get("contour_step", DEFAULT_CONTOUR_STEP),
+        progress=progress,
+    ))
+    _LOGGER.debug("Exported %d frames of %s to %s", frames, entity_id, path)
+    return {
+        "path": path,
+        "frames": frames,
+        "media_content_id": f"media-source://media_source/local/{CLIP_DIRECTORY}/{filename}",
+    }
+
+@callback
+def async_register_services(hass):
+    """Register the integration's services."""
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_EXPORT_CLIP,
+        async_export_clip,
+        schema=EXPORT_CLIP_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
@@ -0,0 +1,125 @@
+import statistics
+import time
+from collections import deque
+
+# Rolling windows: byte rate over this many seconds, timings over the last N samples
+RATE_WINDOW_SEC = 60.0
+TIMING_SAMPLES = 120
+
+class IngestTelemetry:
+    """Counters and rolling statistics of how frames arrive from one device.
+
+    The coordinator records every frame and request as it happens (cheap
+    appends and increments); the statistics are only computed when a
+    snapshot is taken for the diagnostic sensors or a diagnostics download.
+    """
+
+    def __init__(self):
+        self.frames_received = 0  # Payloads read from the device
+        self.frames_parsed = 0  # Frames accepted and passed on
+        self.frames_coalesced = 0  # Skipped because a newer frame arrived within the push interval
+        self.frames_dropped = 0  # Empty or unparseable payloads
+        self.bytes_received = 0
+        self.requests = 0
+        self.request_errors = 0
+        self.reconnects = 0
+        self._disconnected_total = 0.0
+        self._disconnected_since = None
+        self._last_frame_ts = None
+        self._byte_log = deque()  # (monotonic time, bytes) inside RATE_WINDOW_SEC
+        self._intervals = deque(maxlen=TIMING_SAMPLES)  # Seconds between received frames
+        self._latencies = deque(maxlen=TIMING_SAMPLES)  # Request round trips in seconds
+
+    def record_frame(self, nbytes, now=None):
+        """Count a payload read from the device."""
+        now = time.monotonic() if now is None else now
+        self.frames_received += 1
+        self.bytes_received += nbytes
+        self._byte_log.append((now, nbytes))
+        self._trim(now)
+        if self._last_frame_ts is not None:
+            self._intervals.append(now - self._last_frame_ts)
+        self._last_frame_ts = now
+
+    def record_parsed(self):
+        self.frames_parsed += 1
+
+    def record_coalesced(self):
+        self.frames_coalesced += 1
+
+    def record_dropped(self):
+        self.frames_dropped += 1
+
+    def record_request(self, latency):
+        """Count a successful request (poll or stream connect) and its round trip in seconds."""
+        self.requests += 1
+        self._latencies.append(latency)
+
+    def record_request_error(self):
+        self.requests += 1
+        self.request_errors += 1
+
+    def record_disconnected(self, now=None):
+        """Mark the device unreachable; the outage lasts until record_connected."""
+        if self._disconnected_since is None:
+            self._disconnected_since = time.monotonic() if now is None else now
+            # Gaps across an outage are not jitter
+            self._last_frame_ts = None
+
+    def record_connected(self, now=None):
+        if self._disconnected_since is not None:
+            now = time.monotonic() if now is None else now
+            self._disconnected_total += now - self._disconnected_since
+            self._disconnected_since = None
+
+    def record_reconnect(self):
+        self.reconnects += 1
+
+    @property
+    def connected(self):
+        return self._disconnected_since is None
+
+    def disconnected_seconds(self, now=None):
+        """Total time spent disconnected, including an ongoing outage."""
+        total = self._disconnected_total
+        if self._disconnected_since is not None:
+            total += (time.monotonic() if now is None else now) - self._disconnected_since
+        return total
+
+    def snapshot(self, now=None):
+        """Return all counters and rolling statistics as a dict (times in ms, rates per second)."""
+        now = time.monotonic() if now is None else now
+        self._trim(now)
+        intervals = list(self._intervals)
+        latencies = sorted(self._latencies)
+        window = min(RATE_WINDOW_SEC, now - self._byte_log[0][0]) if self._byte_log else 0.0
+        mean_interval = statistics.fmean(intervals) if intervals else None
+        return {
+            "frames_received": self.frames_received,
+            "frames_parsed": self.frames_parsed,
+            "frames_coalesced": self.frames_coalesced,
+            "frames_dropped": self.frames_dropped,
+            "bytes_received": self.bytes_received,
+            "bytes_per_second": (
+                round(sum(nbytes for _, nbytes in self._byte_log) / window, 1) if window > 0 else 0.0
+            ),
+            "frame_rate": round(1.0 / mean_interval, 2) if mean_interval else 0.0,
+            "frame_interval_ms": _ms(mean_interval),
+            "jitter_ms": _ms(statistics.pstdev(intervals)) if len(intervals) > 1 else None,
+            "latency_ms": _ms(statistics.median(latencies)) if latencies else None,
+            "latency_p95_ms": _ms(latencies[min(len(latencies) - 1, int(0.95 * len(latencies)))]) if latencies else None,
+            "requests": self.requests,
+            "request_errors": self.request_errors,
+            "reconnects": self.reconnects,
+            "connected": self.connected,
+            "disconnected_seconds": round(self.disconnected_seconds(now), 1),
+        }
+
+    def _trim(self, now):
+        """Forget byte counts older than the rate window."""
+        log = self._byte_log
+        while log and now - log[0][0] > RATE_WINDOW_SEC:
+            log.popleft()
+
+def _ms(seconds):
+    return None if seconds is None else round(seconds * 1000.0, 1)
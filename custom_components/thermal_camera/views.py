@@ -0,0 +1,143 @@
+import logging
+from http import HTTPStatus
+from io import BytesIO
+
+from aiohttp import web
+from homeassistant.components.http import HomeAssistantView
+from homeassistant.helpers import entity_registry as er
+
+from .analysis import INT16_SCALE
+from .constants import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+# Longest a client may hold a long-poll request open
+MAX_WAIT_SEC = 30.0
+
+RAW_FORMATS = {
+    "f32": "application/octet-stream",
+    "i16": "application/octet-stream",
+    "npy": "application/octet-stream",
+    "csv": "text/csv",
+}
+
+# numpy is imported by the encoders, which only run once frames exist
+
+def encode_frame(analysis, fmt):
+    """Encode a frame as f32/i16 (centi-degree) little-endian bytes, .npy or CSV."""
+    import numpy as np
+
+    array = analysis.array
+    if fmt == "f32":
+        return array.astype("<f4").tobytes()
+    if fmt == "i16":
+        return analysis.centi_degrees.astype("<i2").tobytes()
+    if fmt == "npy":
+        buffer = BytesIO()
+        np.save(buffer, array.astype("<f4"), allow_pickle=False)
+        return buffer.getvalue()
+    buffer = BytesIO()
+    np.savetxt(buffer, array, fmt="%.2f", delimiter=",")
+    return buffer.getvalue()
+
+def coordinator_for_camera(hass, entity_id):
+    """Return (coordinator, entry_id) of the config entry that owns a camera entity, or (None, None)."""
+    entry = er.async_get(hass).async_get(entity_id)
+    if entry is None or entry.platform != DOMAIN or entry.domain != "camera":
+        return None, None
+    data = hass.data.get(DOMAIN, {}).get(entry.config_entry_id)
+    if not data:
+        return None, None
+    return data["coordinator"], entry.config_entry_id
+
+class ThermalFrameView(HomeAssistantView):
+    """Serve the latest raw frame of a thermal camera.
+
+    GET /api/thermal_camera/frame/<camera entity id>?format=f32|i16|npy|csv
+
+    The ETag identifies the frame version; a request whose If-None-Match (or
+    `since` version) matches the current frame gets 304, or with `wait=<sec>`
+    is held open until the next frame arrives. Encoded frames are cached per
+    version (in the entry's data, so they go away when the entry unloads),
+    so any number of clients cost one encode and no device traffic.
+    """
+
+    url = "/api/thermal_camera/frame/{entity_id}"
+    name = "api:thermal_camera:frame"
+    requires_auth = True
+
+    async def get(self, request, entity_id):
+        """Return the frame, 304 if unchanged, or wait for the next one."""
+        hass = request.app["hass"]
+        coordinator, entry_id = coordinator_for_camera(hass, entity_id)
+        if coordinator is None:
+            return self.json_message("Unknown thermal camera", HTTPStatus.NOT_FOUND)
+
+        fmt = request.query.get("format", "f32")
+        if fmt not in RAW_FORMATS:
+            return self.json_message(
+                f"format must be one of {', '.join(RAW_FORMATS)}", HTTPStatus.BAD_REQUEST
+            )
+        try:
+            wait = min(max(float(request.query.get("wait", 0)), 0.0), MAX_WAIT_SEC)
+        except ValueError:
+            return self.json_message("wait must be a number of seconds", HTTPStatus.BAD_REQUEST)
+
+        known_version = self._known_version(request, coordinator)
+        if known_version is not None and known_version >= coordinator.frame_version:
+            if wait <= 0 or not await coordinator.async_wait_for_frame(known_version, wait):
+                return web.Response(
+                    status=HTTPStatus.NOT_MODIFIED, headers={"ETag": self._etag(coordinator)}
+                )
+
+        analysis = coordinator.analysis
+        if analysis is None or analysis.array is None:
+            return self.json_message("No frame available yet", HTTPStatus.SERVICE_UNAVAILABLE)
+
+        encoded = hass.data[DOMAIN][entry_id].setdefault("encoded_frames", {})  # format -> (version, body)
+        cached = encoded.get(fmt)
+        if cached is not None and cached[0] == analysis.version:
+            body = cached[1]
+        else:
+            body = encode_frame(analysis, fmt)
+            encoded[fmt] = (analysis.version, body)
+
+        headers = {
+            "ETag": self._etag(coordinator, analysis.version),
+            "Cache-Control": "no-cache",
+            "X-Frame-Version": str(analysis.version),
+            "X-Frame-Shape": f"{analysis.rows}x{analysis.cols}",
+        }
+        if fmt == "i16":
+            headers["X-Frame-Scale"] = str(INT16_SCALE)
+        return web.Response(body=body, content_type=RAW_FORMATS[fmt], headers=headers)
+
+    @staticmethod
+    def _etag(coordinator, version=None):
+        """Return the ETag of a frame version of this coordinator run."""
+        if version is None:
+            version = coordinator.frame_version
+        return f'"{coordinator.frame_epoch}-{version}"'
+
+    def _known_version(self, request, coordinator):
+        """Return the frame version the client already has, from `since` or If-None-Match."""
+        since = request.query.get("since")
+        if since is not None:
+            try:
+                version = int(since)
+            except ValueError:
+                return None
+            # Versions restart at 0 with the coordinator: one ahead of this run
+            # was seen before a restart, so the client gets the current frame
+            return version if version <= coordinator.frame_version else None
+        prefix = f'"{coordinator.frame_epoch}-'
+        for tag in request.headers.get("If-None-Match", "").split(","):
+            tag = tag.strip()
+            if tag.startswith("W/"):
+                tag = tag[2:]
+            if tag.startswith(prefix) and tag.endswith('"'):
+                try:
+                    return int(tag[len(prefix):-1])
+                except ValueError:
+                    continue
+        return None
@@ -0,0 +1,157 @@
+import base64
+import logging
+import zlib
+
+import voluptuous as vol
+from homeassistant.components import websocket_api
+from homeassistant.core import callback
+from homeassistant.helpers import config_validation as cv
+
+from .analysis import INT16_SCALE
+from .constants import DOMAIN
+from .views import coordinator_for_camera
+
+_LOGGER = logging.getLogger(__name__)
+
+DEFAULT_SUBSCRIBER_MAX_FPS = 5.0
+MAX_SUBSCRIBER_FPS = 30.0
+DEFAULT_KEYFRAME_INTERVAL = 30  # frames between full frames
+COMPRESSION_LEVEL = 6
+
+class FrameDeltaEncoder:
+    """Encode int16 centi-degree frames as zlib keyframes or deltas to the previous frame.
+
+    Consecutive thermal frames differ by little more than sensor noise, so
+    the deltas are small integers that compress far better than the frames
+    themselves. A keyframe is sent first, every `keyframe_interval` frames,
+    after a shape change and whenever a delta would overflow int16. A client
+    reconstructs a frame by adding each delta to the previous frame.
+    """
+
+    def __init__(self, keyframe_interval=DEFAULT_KEYFRAME_INTERVAL):
+        self.keyframe_interval = keyframe_interval
+        self._previous = None
+        self._since_keyframe = 0
+
+    def encode(self, quantized):
+        """Return (is_keyframe, compressed little-endian int16 bytes) for the next frame."""
+        import numpy as np
+
+        previous = self._previous
+        payload = None
+        if (
+            previous is not None
+            and previous.shape == quantized.shape
+            and self._since_keyframe < self.keyframe_interval
+        ):
+            delta = quantized.astype(np.int32) - previous
+            if delta.size == 0 or int(np.abs(delta).max()) <= 32767:
+                payload = delta.astype("<i2")
+        keyframe = payload is None
+        if keyframe:
+            payload = quantized.astype("<i2")
+            self._since_keyframe = 0
+        self._since_keyframe += 1
+        self._previous = quantized.astype(np.int32)
+        return keyframe, zlib.compress(payload.tobytes(), COMPRESSION_LEVEL)
+
+class FrameSubscription:
+    """Push one websocket subscriber the frames of a coordinator at no more than max_fps."""
+
+    def __init__(self, connection, msg_id, coordinator, max_fps, keyframe_interval, subscriptions):
+        self.connection = connection
+        self.msg_id = msg_id
+        self.coordinator = coordinator
+        self._encoder = FrameDeltaEncoder(keyframe_interval)
+        self._subscriptions = subscriptions  # The live subscriptions of the config entry
+        self._remove_listener = coordinator.async_add_rate_limited_listener(
+            self._handle_coordinator_update, max_rate_hz=max_fps
+        )
+        subscriptions.add(self)
+
+    @callback
+    def _handle_coordinator_update(self):
+        """Encode and send the newest frame."""
+        analysis = self.coordinator.analysis
+        if analysis is None or analysis.centi_degrees is None:
+            return
+        keyframe, data = self._encoder.encode(analysis.centi_degrees)
+        self.connection.send_message(
+            websocket_api.event_message(
+                self.msg_id,
+                {
+                    "version": analysis.version,
+                    "shape": [analysis.rows, analysis.cols],
+                    "scale": INT16_SCALE,
+                    "keyframe": keyframe,
+                    "min": analysis.min_value,
+                    "max": analysis.max_value,
+                    "avg": analysis.avg_value,
+                    "data": base64.b64encode(data).decode("ascii"),
+                },
+            )
+        )
+
+    @callback
+    def async_send_current(self):
+        """Send the current frame right away, to start the client off."""
+        self._handle_coordinator_update()
+
+    @callback
+    def async_unsubscribe(self):
+        """Stop pushing frames."""
+        if self not in self._subscriptions:
+            return
+        self._subscriptions.discard(self)
+        self._remove_listener()
+
+    @callback
+    def async_end(self):
+        """Stop pushing frames because the config entry unloads."""
+        self.connection.subscriptions.pop(self.msg_id, None)
+        self.async_unsubscribe()
+
+def entry_subscriptions(hass, entry_id):
+    """Return the set of live subscriptions of a config entry, ended when the entry unloads."""
+    data = hass.data[DOMAIN][entry_id]
+    if "subscriptions" not in data:
+        subscriptions = data["subscriptions"] = set()
+
+        @callback
+        def async_end_subscriptions():
+            for subscription in list(subscriptions):
+                subscription.async_end()
+
+        hass.config_entries.async_get_entry(entry_id).async_on_unload(async_end_subscriptions)
+    return data["subscriptions"]
+
+@websocket_api.websocket_command({
+    vol.Required("type"): "thermal_camera/subscribe_frames",
+    vol.Required("entity_id"): cv.entity_id,
+    vol.Optional("max_fps", default=DEFAULT_SUBSCRIBER_MAX_FPS): vol.All(
+        vol.Coerce(float), vol.Range(min=0.1, max=MAX_SUBSCRIBER_FPS)
+    ),
+    vol.Optional("keyframe_interval", default=DEFAULT_KEYFRAME_INTERVAL): vol.All(
+        vol.Coerce(int), vol.Range(min=1, max=3600)
+    ),
+})
+@callback
+def websocket_subscribe_frames(hass, connection, msg):
+    """Subscribe to the raw frames of a thermal camera."""
+    coordinator, entry_id = coordinator_for_camera(hass, msg["entity_id"])
+    if coordinator is None:
+        connection.send_error(msg["id"], websocket_api.ERR_NOT_FOUND, "Unknown thermal camera")
+        return
+
+    subscription = FrameSubscription(
+        connection, msg["id"], coordinator, msg["max_fps"], msg["keyframe_interval"],
+        entry_subscriptions(hass, entry_id),
+    )
+    connection.subscriptions[msg["id"]] = subscription.async_unsubscribe
+    connection.send_result(msg["id"])
+    subscription.async_send_current()
+
+@callback
+def async_register_websocket_commands(hass):
+    """Register the integration's websocket commands."""
+    websocket_api.async_register_command(hass, websocket_subscribe_frames)
@@ -0,0 +1,72 @@
+import time
+
+# Tolerance so a move of exactly one deadband is not rejected because of
+# floating point noise (e.g. 20.3 - 20.2 < 0.1)
+_EPSILON = 1e-6
+
+class WritePolicy:
+    """Decide whether a new entity value is worth writing to Home Assistant.
+
+    A value is written when it moved by at least the absolute `deadband` and
+    the `relative_deadband` fraction of the last written value, no sooner than
+    `min_interval` seconds after the previous write. A write is also forced
+    every `heartbeat` seconds (None disables it) so long-stable values still
+    show up in history. Non-numeric values only need to differ.
+    """
+
+    def __init__(self, deadband=0.0, relative_deadband=0.0, min_interval=0.0, heartbeat=None):
+        self.deadband = float(deadband)
+        self.relative_deadband = float(relative_deadband)
+        self.min_interval = float(min_interval)
+        self.heartbeat = heartbeat
+        self.writes = 0
+        self.suppressed = 0
+        self._last_value = None
+        self._last_write_ts = None
+
+    def evaluate(self, value, now=None):
+        """Return 0 to write now, None to drop the value, or the seconds to wait before retrying."""
+        now = time.monotonic() if now is None else now
+        if self._last_write_ts is None:
+            return 0
+
+        elapsed = now - self._last_write_ts
+        if self.heartbeat and elapsed >= self.heartbeat:
+            return 0
+        if not self.changed(value):
+            self.suppressed += 1
+            return None
+        if elapsed < self.min_interval:
+            self.suppressed += 1
+            return self.min_interval - elapsed
+        return 0
+
+    def changed(self, value):
+        """Return True if value differs meaningfully from the last written value."""
+        last = self._last_value
+        if value is None or last is None or isinstance(value, bool) or isinstance(last, bool):
+            return value != last
+        try:
+            delta = abs(float(value) - float(last))
+        except (TypeError, ValueError):
+            return value != last
+        if delta == 0 or delta < self.deadband - _EPSILON:
+            return False
+        if delta < abs(float(last)) * self.relative_deadband - _EPSILON:
+            return False
+        return True
+
+    def record_suppressed(self):
+        """Count a value dropped before it reached evaluate (e.g. by a listener filter)."""
+        self.suppressed += 1
+
+    def record_write(self, value, now=None):
+        """Remember a value that has been written."""
+        self._last_value = value
+        self._last_write_ts = time.monotonic() if now is None else now
+        self.writes += 1
+
+    @property
+    def attributes(self):
+        """Write counters suitable for extra_state_attributes."""
+        return {"writes": self.writes, "writes_suppressed": self.suppressed}
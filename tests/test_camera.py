@@ -0,0 +1,56 @@
+"""Tests for the camera's render-ahead front buffer."""
+import asyncio
+import time
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+pytest.importorskip("homeassistant")
+
+from custom_components.thermal_camera.analysis import FrameAnalysis
+from custom_components.thermal_camera.camera import ThermalCamera
+from custom_components.thermal_camera.frame import ThermalFrame
+
+ROWS, COLS = 24, 32
+
+def make_analysis(version):
+    """Return the coordinator analysis of a synthetic frame."""
+    frame = ThermalFrame.from_celsius(np.full((ROWS, COLS), 20.0 + version, dtype=np.float32))
+    return FrameAnalysis(version, frame, ROWS, COLS, 19.0 + version, 21.0 + version, 20.0 + version)
+
+def make_camera(coordinator):
+    """Return a camera whose renders return the rendered frame version instead of a JPEG."""
+    camera = ThermalCamera(
+        name="Thermal", coordinator=coordinator, rows=ROWS, cols=COLS, data_field="frame",
+        lowest_field="min", highest_field="max", average_field="avg", resample_method="BICUBIC",
+        session=None, mjpeg_port=8080, desired_height=240,
+    )
+    camera.hass = MagicMock()
+    camera.hass.async_create_background_task.side_effect = lambda coro, name: asyncio.get_running_loop().create_task(coro)
+
+    async def render(analysis, params):
+        await asyncio.sleep(0.01)
+        return f"version {analysis.version}".encode()
+
+    camera._async_render = render
+    return camera
+
+def test_request_after_idle_waits_for_current_frame():
+    """The first request after an idle period returns the newest frame, not the stale front buffer."""
+    async def scenario():
+        coordinator = SimpleNamespace(analysis=make_analysis(1))
+        camera = make_camera(coordinator)
+        assert await camera.async_camera_image() == b"version 1"
+
+        # Idle: frames keep arriving but nothing renders while nobody is viewing
+        camera._last_image_request_ts = time.monotonic() - 60.0
+        coordinator.analysis = make_analysis(2)
+        assert await camera.async_camera_image() == b"version 2"
+
+        # Warm: the front buffer is served right away
+        coordinator.analysis = make_analysis(3)
+        assert await camera.async_camera_image() == b"version 2"
+
+    asyncio.run(scenario())
@@ -0,0 +1,70 @@
+"""Tests for the render change gate."""
+import numpy as np
+
+from custom_components.thermal_camera.change_gate import ChangeGate
+from custom_components.thermal_camera.constants import DEFAULT_RENDER_CHANGE_THRESHOLD, DEFAULT_RENDER_MAX_STALENESS
+
+FRAME_INTERVAL = 0.2
+
+def make_scene(rows, cols, rng, noise=0.1, target=None):
+    """Return a gradient with a warm blob, an optional hot 2x2 target at (row, col) and Gaussian noise."""
+    y, x = np.mgrid[0:rows, 0:cols].astype(np.float32)
+    scene = 22.0 + 3.0 * x / cols + 6.0 * np.exp(-((x - cols * 0.6) ** 2 + (y - rows * 0.4) ** 2) / (2 * (rows / 6) ** 2))
+    if target is not None:
+        row, col = target
+        scene[row:row + 2, col:col + 2] = 33.0
+    return (scene + rng.normal(0.0, noise, scene.shape)).astype(np.float32)
+
+def run_gate(frames, display_range=None):
+    """Feed frames through a default gate like the camera does; return the indices of the rendered ones."""
+    gate = ChangeGate(DEFAULT_RENDER_CHANGE_THRESHOLD, DEFAULT_RENDER_MAX_STALENESS)
+    rendered = []
+    for index, frame in enumerate(frames):
+        if display_range is None:
+            low, high = round(float(frame.min()), 1), round(float(frame.max()), 1)
+        else:
+            low, high = display_range
+        avg = round(float(frame.mean()), 1)
+        row, col = divmod(int(frame.argmax()), frame.shape[1])
+        hotspot = (row, col, float(frame[row, col]))
+        now = index * FRAME_INTERVAL
+        if gate.should_render(frame, low, high, avg, hotspot, now=now):
+            gate.record_render(frame, low, high, avg, hotspot, now=now)
+            rendered.append(index)
+    return rendered, gate
+
+def test_noise_is_skipped():
+    """A still scene with 0.1 °C noise only renders the first frame and when max_staleness forces it."""
+    for rows, cols in ((24, 32), (192, 256)):
+        for display_range in ((15.0, 35.0), None):
+            rng = np.random.default_rng(1)
+            frames = [make_scene(rows, cols, rng) for _ in range(200)]
+            rendered, gate = run_gate(frames, display_range)
+            assert rendered[0] == 0
+            assert len(rendered) <= 10, (rows, cols, display_range, rendered)
+            assert gate.renders_avoided == 200 - len(rendered)
+
+def test_moving_object_is_rendered():
+    """Every one-pixel step of a small hot object is rendered, although it changes only 4 pixels."""
+    for rows, cols in ((24, 32), (192, 256)):
+        for display_range in ((15.0, 35.0), None):
+            rng = np.random.default_rng(1)
+            frames = [make_scene(rows, cols, rng, target=(rows // 2, 2 + index // 10)) for index in range(200)]
+            rendered, _gate = run_gate(frames, display_range)
+            assert set(range(10, 200, 10)) <= set(rendered), (rows, cols, display_range, rendered)
+
+def test_label_change_is_rendered():
+    """A change of the average label beyond the tolerance renders even if no pixel changed much."""
+    frame = make_scene(24, 32, np.random.default_rng(1), noise=0.0)
+    gate = ChangeGate(16.0, 0.0)
+    hotspot = (0, 0, float(frame.max()))
+    gate.record_render(frame, 15.0, 35.0, 24.0, hotspot, now=0.0)
+    assert not gate.should_render(frame, 15.0, 35.0, 24.5, hotspot, now=1.0)
+    assert gate.should_render(frame, 15.0, 35.0, 26.0, hotspot, now=1.0)
+
+def test_threshold_zero_renders_every_frame():
+    frame = make_scene(24, 32, np.random.default_rng(1))
+    gate = ChangeGate(0.0, 0.0)
+    gate.record_render(frame, 15.0, 35.0, 24.0, None, now=0.0)
+    assert gate.should_render(frame, 15.0, 35.0, 24.0, None, now=1.0)
+    assert gate.renders_avoided == 0
@@ -0,0 +1,13 @@
+"""Tests for the display range modes."""
+from custom_components.thermal_camera.display_range import DisplayRange
+
+def test_fixed_range():
+    assert DisplayRange("fixed", 15.0, 35.0).update(18.0, 25.0) == (15.0, 35.0)
+
+def test_empty_fixed_range_falls_back_to_auto(caplog):
+    """An empty or inverted fixed range is never rendered; each frame's own range is used."""
+    for low, high in ((30.0, 20.0), (25.0, 25.0)):
+        display_range = DisplayRange("fixed", low, high)
+        assert display_range.mode == "auto"
+        assert display_range.update(18.0, 25.0) == (18.0, 25.0)
+    assert "is empty" in caplog.text